@@ -0,0 +1,287 @@
+import asyncio
+import heapq
+import itertools
+import json
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from config import settings
+
+# --- Route Lanes ---
+
+@dataclass
+class Lane:
+    # Lower values are admitted first when several requests are waiting
+    priority: int
+    # Maximum number of requests of this lane executing at once (per worker)
+    concurrency: int
+    # Requests are rejected when their expected queueing delay exceeds this
+    queue_slo: float
+
+
+INTERACTIVE = Lane(priority=0, concurrency=16, queue_slo=1.0)
+BATCH = Lane(priority=1, concurrency=4, queue_slo=5.0)
+CONVERSION = Lane(priority=2, concurrency=2, queue_slo=10.0)
+
+# Routes that call the model, by path template. Other routes (job polling, upload parts
+# and chunks, stats) are not admission controlled, so that a slow upload does not hold a
+# conversion slot while its body is read.
+ROUTE_LANES = {
+    "/parse-natural-khata-entry/": INTERACTIVE,
+    "/select-khata-customer/": INTERACTIVE,
+    "/select-khata-customer/{shop_id}/": INTERACTIVE,
+    "/voice-khata-entry/": INTERACTIVE,
+    "/information-desk/": INTERACTIVE,
+    "/information-desk/stream/": INTERACTIVE,
+    "/parse-natural-khata-entries/": BATCH,
+    "/convert-case-file/": CONVERSION,
+    "/convert-case-file/uploads/{upload_id}/complete": CONVERSION,
+    "/convert-case-file/resumable/{upload_id}": CONVERSION,
+}
+
+_ROUTE_PATTERNS = [
+    (re.compile("[^/]+".join(re.escape(part) for part in re.split(r"\{\w+\}", template))), lane)
+    for template, lane in ROUTE_LANES.items()
+]
+
+
+def lane_for(path: str) -> Lane | None:
+    for pattern, lane in _ROUTE_PATTERNS:
+        if pattern.fullmatch(path):
+            return lane
+    return None
+
+
+# --- Priority Admission ---
+
+class AdmissionController:
+    """
+    Bounds the number of requests executing per lane and, when a slot frees up,
+    hands it to the waiting request with the best (priority, arrival) order.
+
+    Every lane has its own concurrency budget, and lanes additionally share a global
+    budget so that a burst of document conversions cannot occupy all slots that
+    interactive requests need.
+    """
+
+    def __init__(self, total_concurrency: int):
+        self.total_concurrency = total_concurrency
+        self.running_total = 0
+        self.running: dict[int, int] = {}
+        self._waiters = []
+        self._counter = itertools.count()
+        # Exponentially weighted service time per lane, used to predict queueing delay
+        self._service_time: dict[int, float] = {}
+
+    def _can_run(self, lane: Lane) -> bool:
+        return (
+            self.running_total < self.total_concurrency
+            and self.running.get(lane.priority, 0) < lane.concurrency
+        )
+
+    def expected_wait(self, lane: Lane) -> float:
+        """Rough queueing delay for a new request of this lane."""
+        if self._can_run(lane):
+            return 0.0
+        ahead = sum(1 for p, _, _, _ in self._waiters if p <= lane.priority)
+        service_time = self._service_time.get(lane.priority, 1.0)
+        return (ahead + 1) * service_time / max(lane.concurrency, 1)
+
+    async def acquire(self, lane: Lane):
+        future = asyncio.get_running_loop().create_future()
+        entry = (lane.priority, next(self._counter), lane, future)
+        heapq.heappush(self._waiters, entry)
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just as the caller went away
+                self.release(lane, 0.0)
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _start(self, lane: Lane):
+        self.running_total += 1
+        self.running[lane.priority] = self.running.get(lane.priority, 0) + 1
+
+    def release(self, lane: Lane, service_time: float):
+        self.running_total -= 1
+        self.running[lane.priority] -= 1
+        if service_time:
+            previous = self._service_time.get(lane.priority, service_time)
+            self._service_time[lane.priority] = 0.8 * previous + 0.2 * service_time
+        self._wake()
+
+    def _wake(self):
+        # Admit waiters in priority order; a waiter whose lane is full does not
+        # block lower-priority waiters whose lanes still have room.
+        skipped = []
+        while self._waiters:
+            entry = heapq.heappop(self._waiters)
+            _, _, lane, future = entry
+            if future.done():
+                continue
+            if self._can_run(lane):
+                self._start(lane)
+                future.set_result(None)
+            elif self.running_total >= self.total_concurrency:
+                skipped.append(entry)
+                break
+            else:
+                skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self._waiters, entry)
+
+
+# --- Token Bucket Rate Limiting ---
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Takes a token. Returns 0 on success, otherwise the seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Token buckets keyed by tenant, created lazily and evicted when idle."""
+
+    def __init__(self, rate: float, burst: float, max_tenants: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_tenants = max_tenants
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def take(self, tenant: str) -> float:
+        bucket = self._buckets.get(tenant)
+        if bucket is None:
+            if len(self._buckets) >= self.max_tenants:
+                # Full buckets carry no state worth keeping
+                idle = [k for k, b in self._buckets.items() if b.tokens >= b.burst]
+                for k in idle or list(self._buckets)[: self.max_tenants // 10]:
+                    del self._buckets[k]
+            bucket = self._buckets[tenant] = TokenBucket(self.rate, self.burst)
+        return bucket.take()
+
+
+# --- ASGI Middleware ---
+
+def tenant(scope) -> str:
+    """
+    The rate-limited identity of a request: its API key when the key is one of
+    `tenant_api_keys`, otherwise the client's IP address. Other headers are not
+    trusted, since changing them would be enough to get a fresh token bucket.
+    """
+    headers = dict(scope.get("headers") or [])
+    api_key = headers.get(b"x-api-key", b"").decode("latin-1")
+    if api_key and api_key in settings.tenant_api_keys:
+        return f"key:{api_key}"
+    return f"ip:{client_ip(scope)}"
+
+
+def client_ip(scope) -> str:
+    """
+    The client's IP address. Behind `trusted_proxy_hops` proxies, each of which appends
+    the address it received the request from to X-Forwarded-For, that is the entry the
+    outermost trusted proxy added; entries to its left were sent by the client.
+    """
+    hops = settings.trusted_proxy_hops
+    if hops > 0:
+        headers = dict(scope.get("headers") or [])
+        forwarded = [a.strip() for a in headers.get(b"x-forwarded-for", b"").decode("latin-1").split(",")]
+        forwarded = [a for a in forwarded if a]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    client = scope.get("client")
+    return client[0] if client else "anonymous"
+
+
+async def _reject(send, detail: str, retry_after: float):
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, int(retry_after + 0.999))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class Admission:
+    """
+    The rate limiter and lane budgets of this worker, shared by the HTTP middleware
+    and the voice WebSocket, whose messages are admitted one by one.
+    """
+
+    def __init__(self):
+        self.controller = AdmissionController(settings.admission_total_concurrency)
+        self.limiter = RateLimiter(settings.rate_limit_per_second, settings.rate_limit_burst)
+
+    def rejection(self, tenant: str, lane: Lane) -> tuple[str, float] | None:
+        """Takes a token for the tenant. Returns (detail, retry after) when the request must be rejected."""
+        if settings.rate_limit_per_second > 0:
+            retry_after = self.limiter.take(tenant)
+            if retry_after > 0:
+                return "Rate limit exceeded.", retry_after
+        expected_wait = self.controller.expected_wait(lane)
+        if expected_wait > lane.queue_slo:
+            return "The service is busy. Please try again shortly.", expected_wait
+        return None
+
+    @asynccontextmanager
+    async def slot(self, lane: Lane):
+        """Holds one of the lane's slots, waiting for it in priority order."""
+        await self.controller.acquire(lane)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.controller.release(lane, time.monotonic() - started)
+
+
+admission = Admission()
+
+
+class AdmissionMiddleware:
+    """
+    Applies per-tenant rate limits and per-route concurrency budgets to the routes
+    listed in ROUTE_LANES. Requests that would wait longer than their lane's queue
+    SLO are rejected immediately with 429 and a Retry-After header.
+
+    Registered inside CORSMiddleware, so rejections carry CORS headers and preflight
+    requests are answered before they reach it; other OPTIONS requests are not counted.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            return await self.app(scope, receive, send)
+        lane = lane_for(scope["path"])
+        if lane is None:
+            return await self.app(scope, receive, send)
+
+        rejection = admission.rejection(tenant(scope), lane)
+        if rejection is not None:
+            return await _reject(send, *rejection)
+        async with admission.slot(lane):
+            await self.app(scope, receive, send)
@@ -0,0 +1,141 @@
+"""
+Precomputed canonical answers for the information desk.
+
+Most information-desk questions are a rewording of one of the knowledge base headings
+("## টালিখাতা কি?" in knowledge/info_desk.json). The build step below asks the model once per reference for its
+canonical InfoDeskReply and stores the results; at runtime a character n-gram classifier
+over the headings serves those answers directly when it is confident.
+
+Rebuild after changing the knowledge base:
+
+    python canonical_answers.py
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from config import settings
+from text_vectors import NgramVectorizer
+
+logger = logging.getLogger(__name__)
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def reference_heading(text: str) -> str:
+    """The first markdown heading of a reference, or its first line if it has none."""
+    for line in text.splitlines():
+        if line.startswith("#"):
+            return line.lstrip("#").strip()
+    return text.strip().splitlines()[0] if text.strip() else ""
+
+
+class CanonicalAnswers:
+    """
+    Nearest-heading intent classifier over the knowledge base.
+
+    A question is answered from the table only when the best heading is similar enough
+    and clearly ahead of the runner-up, and the stored answer was built from the
+    reference text that is currently deployed.
+    """
+
+    def __init__(self, threshold: float, margin: float):
+        self.threshold = threshold
+        self.margin = margin
+        self.vectorizer = NgramVectorizer()
+        self._references: list[int] = []
+        self._matrix = np.zeros((0, self.vectorizer.dimensions), dtype=np.float32)
+        self._answers: dict[int, dict] = {}
+        self._reference_hashes: dict[int, str] = {}
+
+    def load(self, references: dict[int, str], answers_path: str):
+        self._reference_hashes = {number: _digest(text) for number, text in references.items()}
+        self.vectorizer.fit(list(references.values()))
+        self._references = list(references)
+        self._matrix = np.stack([
+            self.vectorizer.transform(reference_heading(text)) for text in references.values()
+        ]) if references else self._matrix
+
+        self._answers = {}
+        if os.path.exists(answers_path):
+            with open(answers_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            for item in stored:
+                reference = item["reply"]["reference"]
+                # Answers built from an older version of the reference are ignored
+                if self._reference_hashes.get(reference) == item["reference_hash"]:
+                    self._answers[reference] = item["reply"]
+            stale = len(stored) - len(self._answers)
+            if stale:
+                logger.warning(f"{stale} canonical answers are stale; rebuild with `python canonical_answers.py`.")
+
+    def classify(self, question: str) -> tuple[int | None, float]:
+        """Returns the best matching reference (None when not confident) and its similarity."""
+        if not self._references:
+            return None, 0.0
+        similarities = self._matrix @ self.vectorizer.transform(question)
+        order = np.argsort(similarities)[::-1]
+        best = float(similarities[order[0]])
+        runner_up = float(similarities[order[1]]) if len(order) > 1 else 0.0
+        if best < self.threshold or best - runner_up < self.margin:
+            return None, best
+        return self._references[order[0]], best
+
+    def answer(self, question: str) -> dict | None:
+        if not settings.canonical_answers_enabled:
+            return None
+        reference, _ = self.classify(question)
+        return self._answers.get(reference) if reference is not None else None
+
+
+canonical_answers = CanonicalAnswers(settings.canonical_answer_threshold, settings.canonical_answer_margin)
+
+
+# --- Offline Build ---
+
+async def build(answers_path: str):
+    """Generates the canonical reply for every reference and writes them to answers_path."""
+    from google import genai
+    import gateway
+    from decoding import decode_response
+    from knowledge_base import info_desk_knowledge
+    from models import InfoDeskReply
+
+    client = genai.Client(api_key=settings.google_api_key)
+    references = info_desk_knowledge.references()
+    built = []
+    for number, text in references.items():
+        question = reference_heading(text)
+        response = await gateway.generate_content(
+            client,
+            "info-desk",
+            model='gemini-2.0-flash',
+            contents=question,
+            config={
+                'system_instruction': info_desk_knowledge.prompt(),
+                'temperature': 0.01,
+                'response_mime_type': 'application/json',
+                'response_schema': InfoDeskReply,
+            },
+        )
+        reply = decode_response(response, InfoDeskReply).model_copy()
+        # The reference and image are known locally; only the answer text comes from the model
+        images = info_desk_knowledge.get(number).images
+        reply.reference = number
+        reply.image = images[0] if images else None
+        built.append({"reference_hash": _digest(text), "question": question, "reply": reply.model_dump()})
+        print(f"[{number}/{len(references)}] {question}")
+
+    os.makedirs(os.path.dirname(answers_path) or ".", exist_ok=True)
+    with open(answers_path, "w", encoding="utf-8") as f:
+        json.dump(built, f, ensure_ascii=False, indent=2)
+    print(f"Wrote {len(built)} canonical answers to {answers_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(build(settings.canonical_answers_path))
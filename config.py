@@ -4,6 +4,130 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     google_api_key: str = ''
 
+    # Local state shared by the workers of one host (customer lists, caches, checkpoints)
+    data_dir: str = 'data'
+
+    # Tracing: fraction of requests that are traced, and where traces go
+    # ("jsonl" appends to trace_file, "otlp" posts to an OTLP/HTTP collector, "none" disables export)
+    trace_sample_rate: float = 0.1
+    trace_exporter: str = 'jsonl'
+    trace_file: str = 'traces.jsonl'
+    trace_otlp_endpoint: str = 'http://localhost:4318/v1/traces'
+    trace_service_name: str = 'ankona-service'
+
+    # Model call policy: retry backoff, hedged requests and circuit breaker
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 4.0
+    hedge_enabled: bool = True
+    hedge_min_samples: int = 20
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
+
+    # Exact-match cache of model responses for deterministic endpoints (0 disables it)
+    response_cache_ttl: float = 300.0
+    response_cache_size: int = 2000
+
+    # Information-desk knowledge base file, re-read when modified
+    knowledge_base_path: str = 'knowledge/info_desk.json'
+    knowledge_reload_interval: float = 5.0
+
+    # Bangla-to-English legal glossary for case file conversion, re-read when modified
+    legal_glossary_path: str = 'knowledge/legal_glossary.json'
+
+    # Semantic cache for the information desk: cosine similarity (between questions of the
+    # same intent) needed to reuse a reply, and its lead over a question with another answer
+    semantic_cache_enabled: bool = True
+    semantic_cache_size: int = 2000
+    semantic_cache_threshold: float = 0.78
+    semantic_cache_margin: float = 0.05
+
+    # Precomputed canonical info-desk answers, served when the heading classifier is confident
+    canonical_answers_enabled: bool = True
+    canonical_answers_path: str = 'knowledge/canonical_answers.json'
+    canonical_answer_threshold: float = 0.85
+    canonical_answer_margin: float = 0.1
+
+    # Registered customer lists: n-gram similarity needed to pick a customer without the model
+    customer_match_threshold: float = 0.9
+    customer_match_margin: float = 0.15
+    customer_index_cache_size: int = 256
+    # Names offered to the model when a customer list is over the prompt's token budget
+    customer_prefilter_size: int = 50
+
+    # Batch khata entry parsing: utterances per model call, and per request
+    khata_batch_chunk_size: int = 25
+    khata_batch_max_items: int = 500
+
+    # Admission control: concurrent requests per worker across all lanes, and the
+    # per-tenant token bucket (tenants are the X-API-Keys listed here, else client IPs;
+    # the IP is read from X-Forwarded-For behind this many proxies, 0 when exposed directly)
+    admission_total_concurrency: int = 20
+    rate_limit_per_second: float = 5.0
+    rate_limit_burst: float = 20.0
+    tenant_api_keys: set[str] = set()
+    trusted_proxy_hops: int = 1
+
+    # Voice assistant WebSocket: requests in flight per connection, and messages
+    # buffered for a client that reads slowly before handlers wait
+    ws_max_concurrency: int = 4
+    ws_send_queue_size: int = 64
+
+    # Model routing: easy inputs start on the cheaper model and are escalated to the next
+    # one when the result fails validation (see model_routing.py)
+    model_routing_enabled: bool = True
+    model_fast: str = 'gemini-2.0-flash-lite'
+    model_standard: str = 'gemini-2.0-flash'
+    model_strong: str = 'gemini-2.5-flash'
+    routing_easy_max_chars: int = 80
+    routing_min_page_chars: int = 200
+    routing_max_bangla_share: float = 0.05
+
+    # Case file conversion: pages translated at once, and translated pages kept in the page cache
+    translation_page_concurrency: int = 6
+    page_cache_max_entries: int = 20000
+
+    # Pages whose text layer is already English skip translation (see is_english_text_page);
+    # scanned pages have no text layer and are always translated
+    english_page_bypass: bool = True
+
+    # Stamps, seals and (optionally) tables are masked on scanned pages before upload; pages
+    # where more than the maximum share would be masked are sent as they are
+    layout_masking_enabled: bool = True
+    layout_mask_tables: bool = True
+    layout_render_dpi: int = 200
+    layout_max_masked_share: float = 0.4
+
+    # Translation memory of text-layer segments reused across case files, and how many of
+    # them are also matched approximately (see translation_memory.py)
+    translation_memory_enabled: bool = True
+    translation_memory_fuzzy_size: int = 10000
+    translation_memory_fuzzy_threshold: float = 0.85
+
+    # Draft tokens per refinement call, and how long conversion checkpoints are kept
+    refine_chunk_tokens: int = 8000
+    conversion_retention_hours: float = 72
+    # Unfinished conversions not worked on for this long are taken for abandoned (their
+    # worker was restarted): background ones are resumed, others reported as failed
+    conversion_stale_seconds: float = 120
+
+    # Refinement replies with line edits to the draft, falling back to the whole chunk
+    refine_with_edits: bool = True
+
+    # With the glossary enforcing terminology, the refinement pass can be turned off
+    refine_enabled: bool = True
+
+    # Pipelined uploads that are not completed within this time are discarded
+    upload_session_minutes: float = 30
+
+    # Resumable uploads: largest file and chunk accepted, and how long unfinished or
+    # converted uploads are kept on disk (so a lost response can be fetched again)
+    resumable_upload_max_bytes: int = 200 * 1024 * 1024
+    resumable_chunk_bytes: int = 8 * 1024 * 1024
+    resumable_upload_hours: float = 24
+
+    # Pages translated for a quick preview while the full conversion runs in the background
+    preview_pages: int = 3
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,170 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversion (
+    job_id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoint (
+    job_id TEXT NOT NULL REFERENCES conversion (job_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (job_id, name)
+);
+"""
+
+
+def job_id(content: bytes, variant: str = "") -> str:
+    """
+    Conversions are identified by their PDF, so resubmitting the same file resumes it.
+    `variant` tells apart conversions of the same file with different options.
+    """
+    digest = hashlib.sha256(content)
+    digest.update(variant.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class ConversionJob:
+    """The checkpoints of one conversion. Values are stored as soon as a stage produces them."""
+
+    def __init__(
+        self, store: "ConversionStore", job_id: str, filename: str, stage: str, updated_at: float, claimed: bool = False
+    ):
+        self.store = store
+        self.id = job_id
+        self.filename = filename
+        self.stage = stage
+        self.updated_at = updated_at
+        # Whether the caller of ConversionStore.start may run the job
+        self.claimed = claimed
+
+    def get(self, name: str) -> bytes | None:
+        with self.store._connect() as db:
+            row = db.execute(
+                "SELECT value FROM checkpoint WHERE job_id = ? AND name = ?", (self.id, name)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_text(self, name: str) -> str | None:
+        value = self.get(name)
+        return value.decode("utf-8") if value is not None else None
+
+    def put(self, name: str, value: bytes | str):
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        with self.store._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO checkpoint (job_id, name, value) VALUES (?, ?, ?)", (self.id, name, value)
+            )
+            db.execute("UPDATE conversion SET updated_at = ? WHERE job_id = ?", (time.time(), self.id))
+
+    def delete(self, name: str):
+        with self.store._connect() as db:
+            db.execute("DELETE FROM checkpoint WHERE job_id = ? AND name = ?", (self.id, name))
+
+    def touch(self):
+        """Records that the job is still being worked on (see `is_abandoned`)."""
+        self.updated_at = time.time()
+        with self.store._connect() as db:
+            db.execute("UPDATE conversion SET updated_at = ? WHERE job_id = ?", (self.updated_at, self.id))
+
+    @property
+    def is_abandoned(self) -> bool:
+        """
+        Whether the job is unfinished and nothing has worked on it for
+        `conversion_stale_seconds`, e.g. because the worker running it was restarted.
+        Running jobs are touched more often than that.
+        """
+        return (
+            self.stage not in ("done", "failed")
+            and time.time() - self.updated_at > settings.conversion_stale_seconds
+        )
+
+    def set_stage(self, stage: str):
+        self.stage = stage
+        with self.store._connect() as db:
+            db.execute(
+                "UPDATE conversion SET stage = ?, updated_at = ? WHERE job_id = ?", (stage, time.time(), self.id)
+            )
+
+
+class ConversionStore:
+    """
+    Durable checkpoints of case file conversions, stored in SQLite next to the other
+    local data so they survive worker restarts (e.g. gunicorn's --timeout kill).
+
+    A conversion runs as stages (translating, refining, rendering, done, or failed
+    when its runner raised), and each
+    completed unit of paid work (the translated draft, every refinement chunk, the
+    rendered DOCX) is stored under the job, so a retried request picks up where the
+    previous attempt stopped. Individual page translations are checkpointed by the
+    page cache. Jobs untouched for `conversion_retention_hours` are deleted.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA foreign_keys=ON")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def start(self, job_id: str, filename: str) -> ConversionJob:
+        """
+        Returns the job, creating it or resuming it at its recorded stage, and claims it
+        for the caller unless another runner (a request or a background conversion, in
+        any worker) is still working on it; `job.claimed` tells which. A failed job is
+        claimed to be tried again.
+        """
+        now = time.time()
+        with self._connect() as db:
+            # The DELETE takes the write lock, so two callers cannot both claim the job
+            db.execute(
+                "DELETE FROM conversion WHERE updated_at < ?", (now - settings.conversion_retention_hours * 3600,)
+            )
+            row = db.execute("SELECT stage, updated_at FROM conversion WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                db.execute(
+                    "INSERT INTO conversion (job_id, filename, stage, updated_at) VALUES (?, ?, 'translating', ?)",
+                    (job_id, filename, now),
+                )
+                return ConversionJob(self, job_id, filename, "translating", now, claimed=True)
+            stage, updated_at = row
+            job = ConversionJob(self, job_id, filename, stage, updated_at)
+            if stage not in ("done", "failed") and not job.is_abandoned:
+                return job
+            stage = "translating" if stage == "failed" else stage
+            db.execute("UPDATE conversion SET stage = ?, updated_at = ? WHERE job_id = ?", (stage, now, job_id))
+        logger.info(f"Resuming conversion {job_id} of '{filename}' at stage '{stage}'.")
+        return ConversionJob(self, job_id, filename, stage, now, claimed=True)
+
+    def get(self, job_id: str) -> ConversionJob | None:
+        """Returns an existing job without resuming it."""
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT filename, stage, updated_at FROM conversion WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return ConversionJob(self, job_id, *row) if row else None
+
+
+conversion_store = ConversionStore(os.path.join(settings.data_dir, "conversions.sqlite"))
@@ -0,0 +1,195 @@
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from config import settings
+from instruct import sys_instruct_select_customer
+from text_vectors import NgramVectorizer, normalize_text
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shop (
+    shop_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS customer (
+    shop_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    PRIMARY KEY (shop_id, name)
+);
+CREATE INDEX IF NOT EXISTS customer_normalized ON customer (shop_id, normalized);
+"""
+
+
+class VersionConflict(Exception):
+    """Raised when a delta is based on a version other than the current one."""
+
+    def __init__(self, current: int):
+        super().__init__(f"Customer list is at version {current}.")
+        self.current = current
+
+
+class _Matcher:
+    """Pre-normalized, vectorized view of one version of a shop's customer list."""
+
+    def __init__(self, names: list[str]):
+        self.names = names
+        self.by_normalized = {}
+        for name in names:
+            self.by_normalized.setdefault(normalize_text(name), name)
+        self.vectorizer = NgramVectorizer(dimensions=1024)
+        self.matrix = np.stack([self.vectorizer.transform(name) for name in names]) if names else None
+        self.prompt = sys_instruct_select_customer.format("\n".join(names))
+
+    def local_match(self, spoken: str) -> tuple[str | None, float]:
+        """
+        Returns a customer name when the spoken name identifies one unambiguously
+        without the model, together with the match score.
+        """
+        normalized = normalize_text(spoken)
+        if normalized in self.by_normalized:
+            return self.by_normalized[normalized], 1.0
+        if self.matrix is None:
+            return None, 0.0
+        similarities = self.matrix @ self.vectorizer.transform(spoken)
+        order = np.argsort(similarities)[::-1]
+        best = float(similarities[order[0]])
+        runner_up = float(similarities[order[1]]) if len(order) > 1 else 0.0
+        if best >= settings.customer_match_threshold and best - runner_up >= settings.customer_match_margin:
+            return self.names[order[0]], best
+        return None, best
+
+    def candidates(self, spoken: str, limit: int) -> list[str]:
+        """
+        The `limit` names most similar to the spoken text, in list order. Used when the
+        whole list would not fit the prompt's token budget.
+        """
+        if self.matrix is None or len(self.names) <= limit:
+            return list(self.names)
+        similarities = self.matrix @ self.vectorizer.transform(spoken)
+        top = np.argpartition(-similarities, limit)[:limit]
+        return [self.names[i] for i in sorted(top)]
+
+
+def customer_matcher(customer_list: str) -> _Matcher:
+    """A matcher for a customer list sent with the request, one name per line or comma-separated."""
+    return _Matcher([name.strip() for name in re.split(r"[\n,]", customer_list) if name.strip()])
+
+
+class CustomerIndex:
+    """
+    Customer lists registered per shop, stored in SQLite so that all workers share them.
+
+    Every change bumps the shop's version. Matchers (normalized names, n-gram vectors and
+    the formatted selection prompt) are built once per (shop, version) and kept in a
+    small in-process LRU, so requests cost the same regardless of ledger size.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._matchers: OrderedDict[tuple[str, int], _Matcher] = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def register(self, shop_id: str, names: list[str]) -> int:
+        """Replaces the shop's customer list. Returns the new version."""
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            version = self._version(db, shop_id) + 1
+            db.execute("DELETE FROM customer WHERE shop_id = ?", (shop_id,))
+            self._insert(db, shop_id, names)
+            db.execute("INSERT OR REPLACE INTO shop (shop_id, version) VALUES (?, ?)", (shop_id, version))
+        return version
+
+    def apply_delta(self, shop_id: str, add: list[str], remove: list[str], rename: dict[str, str],
+                    base_version: int | None = None) -> int:
+        """
+        Applies additions, removals and renames in one transaction. Returns the new version.
+
+        Raises:
+            KeyError: The shop has not registered a customer list.
+            VersionConflict: base_version is given and is not the current version.
+        """
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            current = self._version(db, shop_id)
+            if current == 0:
+                raise KeyError(shop_id)
+            if base_version is not None and base_version != current:
+                raise VersionConflict(current)
+            for old, new in rename.items():
+                db.execute("DELETE FROM customer WHERE shop_id = ? AND name = ?", (shop_id, old.strip()))
+                self._insert(db, shop_id, [new])
+            db.executemany(
+                "DELETE FROM customer WHERE shop_id = ? AND name = ?", [(shop_id, n.strip()) for n in remove]
+            )
+            self._insert(db, shop_id, add)
+            db.execute("UPDATE shop SET version = ? WHERE shop_id = ?", (current + 1, shop_id))
+        return current + 1
+
+    def version(self, shop_id: str) -> int:
+        """The current version of the shop's list, 0 if none is registered."""
+        with self._connect() as db:
+            return self._version(db, shop_id)
+
+    def matcher(self, shop_id: str, version: int | None = None) -> _Matcher:
+        """
+        Returns the matcher for the shop's current list.
+
+        Raises:
+            KeyError: The shop has not registered a customer list.
+            VersionConflict: version is given and is not the current version.
+        """
+        with self._connect() as db:
+            current = self._version(db, shop_id)
+            if current == 0:
+                raise KeyError(shop_id)
+            if version is not None and version != current:
+                raise VersionConflict(current)
+            key = (shop_id, current)
+            with self._lock:
+                if key in self._matchers:
+                    self._matchers.move_to_end(key)
+                    return self._matchers[key]
+            names = [row[0] for row in db.execute(
+                "SELECT name FROM customer WHERE shop_id = ? ORDER BY rowid", (shop_id,)
+            )]
+
+        matcher = _Matcher(names)
+        with self._lock:
+            self._matchers[key] = matcher
+            while len(self._matchers) > settings.customer_index_cache_size:
+                self._matchers.popitem(last=False)
+        return matcher
+
+    @staticmethod
+    def _version(db: sqlite3.Connection, shop_id: str) -> int:
+        row = db.execute("SELECT version FROM shop WHERE shop_id = ?", (shop_id,)).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _insert(db: sqlite3.Connection, shop_id: str, names: list[str]):
+        db.executemany(
+            "INSERT OR IGNORE INTO customer (shop_id, name, normalized) VALUES (?, ?, ?)",
+            [(shop_id, name.strip(), normalize_text(name)) for name in names if name.strip()],
+        )
+
+
+customer_index = CustomerIndex(os.path.join(settings.data_dir, "customers.sqlite"))
@@ -0,0 +1,155 @@
+"""
+Decoding of structured model output and fast serialization of the results.
+
+Model replies are validated straight into the Pydantic response models (reusing the
+SDK's `response.parsed` when it already did so), and endpoints return the serialized
+bytes so FastAPI does not validate and serialize them a second time. Replies cut off
+mid-JSON (e.g. at the output token limit) are cut back to their last complete value and
+closed, and used when that is still enough to fill the schema.
+"""
+import json
+import logging
+import re
+from functools import lru_cache
+
+import pydantic_core
+from fastapi import HTTPException
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# A literal ending the text is complete, since none is the start of a longer value; a
+# trailing number may have lost digits, so it is never kept
+_TRAILING_LITERAL = re.compile(r'[:,\[]\s*(true|false|null)\s*$')
+
+# Cut points tried, newest first, when a truncated reply has to be shortened
+_MAX_REPAIR_CANDIDATES = 64
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def repair_json(text: str) -> str | None:
+    """
+    Completes JSON text that was cut off, by shortening it to the last complete value
+    and closing every open array and object. A value that was cut off itself is dropped
+    rather than closed: a truncated number, string or literal (1500 arriving as 15, a
+    name as its first letters) would still be valid JSON, but wrong.
+
+    Returns:
+        Valid JSON text, or None when nothing could be salvaged.
+    """
+    stack = []
+    in_string = False
+    escaped = False
+    # (cut position, closers needed at that position) after each complete value
+    candidates = []
+    for i, c in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+                candidates.append((i + 1, "".join(reversed(stack))))
+        elif c == '"':
+            in_string = True
+        elif c in "{[":
+            stack.append("}" if c == "{" else "]")
+        elif c in "}]":
+            if not stack:
+                return None
+            stack.pop()
+            candidates.append((i + 1, "".join(reversed(stack))))
+        elif c == ",":
+            candidates.append((i, "".join(reversed(stack))))
+
+    if not in_string and _TRAILING_LITERAL.search(text):
+        candidates.append((len(text), "".join(reversed(stack))))
+    # A cut right after a key is not valid JSON; the cut before it is tried next
+    for cut, needed in reversed(candidates[-_MAX_REPAIR_CANDIDATES:]):
+        attempt = text[:cut] + needed
+        try:
+            json.loads(attempt)
+        except ValueError:
+            continue
+        return attempt
+    return None
+
+
+def load_json(text: str):
+    """
+    Parses model output as JSON, repairing it if it was truncated.
+
+    Raises:
+        ValueError: The text is not JSON and cannot be repaired.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        repaired = repair_json(text or "")
+        if repaired is None:
+            raise
+        logger.warning(f"Repaired truncated model output ({len(text)} characters).")
+        return json.loads(repaired)
+
+
+def decode_json(text: str, schema):
+    """
+    Validates JSON text into `schema` (a model class or a type such as list[Model]).
+
+    Raises:
+        HTTPException: 502 when the text does not match the schema, even after repair.
+    """
+    adapter = _adapter(schema)
+    try:
+        return adapter.validate_json(text or "")
+    except ValidationError as e:
+        if e.errors()[0]["type"] != "json_invalid":
+            logger.warning(f"Model output does not match {schema}: {e}")
+            raise HTTPException(status_code=502, detail="The model returned an invalid reply.")
+
+    repaired = repair_json(text or "")
+    try:
+        if repaired is None:
+            raise ValueError("unrepairable")
+        value = adapter.validate_json(repaired)
+    except (ValueError, ValidationError) as e:
+        logger.warning(f"Model output is not valid JSON and could not be repaired: {e}")
+        raise HTTPException(status_code=502, detail="The model returned an invalid reply.")
+    logger.warning(f"Repaired truncated model output ({len(text)} characters).")
+    return value
+
+
+def decode_response(response, schema):
+    """
+    Returns the reply of a structured-output model call as `schema`. Uses the SDK's
+    `response.parsed` when it is present, and otherwise decodes `response.text`.
+
+    Raises:
+        HTTPException: 502 when the reply does not match the schema.
+    """
+    parsed = getattr(response, "parsed", None)
+    if parsed is not None:
+        try:
+            # Already-built model instances pass through without re-validation
+            return _adapter(schema).validate_python(parsed)
+        except ValidationError:
+            pass
+    return decode_json(response.text, schema)
+
+
+def json_response(value, status_code: int = 200) -> Response:
+    """
+    Serializes models (or lists and dicts of them) to a JSON response in one pass.
+    FastAPI returns Response objects as they are, skipping response_model validation.
+    """
+    if isinstance(value, BaseModel):
+        content = value.model_dump_json()
+    else:
+        content = pydantic_core.to_json(value)
+    return Response(content=content, status_code=status_code, media_type="application/json")
@@ -0,0 +1,419 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import httpx
+from cachetools import TTLCache
+from fastapi import HTTPException
+from google.genai import errors
+
+from config import settings
+from singleflight import SingleFlight, request_key
+from token_budget import estimate_request_tokens, token_estimates
+from tracing import start_span, start_detached_span, end_detached_span, record_usage
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes from the Gemini API that are worth another attempt
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# --- Call Policies ---
+
+@dataclass
+class CallPolicy:
+    # Total wall-clock budget for the call, across all attempts and backoff sleeps
+    deadline: float
+    max_attempts: int
+    # Send a duplicate request once the first one is slower than the observed p95
+    hedge: bool = False
+    # Whether identical requests may be answered from the response cache
+    cacheable: bool = False
+    # Estimated token budgets; requests over them are rejected before they are sent
+    max_input_tokens: int | None = None
+    max_output_tokens: int | None = None
+
+
+POLICIES = {
+    "khata-entry": CallPolicy(
+        deadline=8.0, max_attempts=3, hedge=True, cacheable=True, max_input_tokens=4000, max_output_tokens=256
+    ),
+    "khata-batch": CallPolicy(
+        deadline=20.0, max_attempts=2, cacheable=True, max_input_tokens=16000, max_output_tokens=8192
+    ),
+    "select-customer": CallPolicy(
+        deadline=8.0, max_attempts=3, hedge=True, cacheable=True, max_input_tokens=6000, max_output_tokens=64
+    ),
+    "voice-khata": CallPolicy(
+        deadline=8.0, max_attempts=3, hedge=True, cacheable=True, max_input_tokens=8000, max_output_tokens=512
+    ),
+    "info-desk": CallPolicy(
+        deadline=10.0, max_attempts=3, hedge=True, cacheable=True, max_input_tokens=40000, max_output_tokens=2048
+    ),
+    # A page's translation and a refinement chunk together stay under gunicorn's --timeout
+    # (60s, see Procfile), so a conversion request makes progress within one worker timeout
+    "translate": CallPolicy(deadline=30.0, max_attempts=2, max_input_tokens=200000, max_output_tokens=32768),
+    "refine": CallPolicy(deadline=25.0, max_attempts=2, max_input_tokens=200000, max_output_tokens=32768),
+}
+
+
+class BudgetExceeded(HTTPException):
+    """
+    Raised before sending a request whose estimated input tokens, or the output tokens
+    the caller expects, exceed the endpoint's budget. Callers catch it to trim the
+    prompt or split the work; uncaught, it is a 413 response.
+    """
+
+    def __init__(self, endpoint: str, kind: str, estimated: int, budget: int):
+        super().__init__(
+            status_code=413,
+            detail=f"The request is too large to process (about {estimated} {kind} tokens, limit {budget}).",
+        )
+        self.endpoint = endpoint
+        self.kind = kind
+        self.estimated = estimated
+        self.budget = budget
+
+
+def check_budget(endpoint: str, kwargs: dict, expected_output_tokens: int = 0) -> int:
+    """
+    Checks a request against the endpoint's token budgets.
+
+    Args:
+        endpoint: Key into POLICIES.
+        kwargs: The generate_content arguments (contents, config).
+        expected_output_tokens: The caller's estimate of the reply length, if it has one.
+
+    Returns:
+        The uncalibrated input token estimate.
+
+    Raises:
+        BudgetExceeded: The input or the expected output is over budget.
+    """
+    policy = POLICIES[endpoint]
+    estimate = estimate_request_tokens(kwargs.get("contents"), kwargs.get("config"))
+    estimated = token_estimates.calibrated(endpoint, estimate)
+    if policy.max_input_tokens is not None and estimated > policy.max_input_tokens:
+        raise BudgetExceeded(endpoint, "input", estimated, policy.max_input_tokens)
+    if policy.max_output_tokens is not None and expected_output_tokens > policy.max_output_tokens:
+        raise BudgetExceeded(endpoint, "output", expected_output_tokens, policy.max_output_tokens)
+    return estimate
+
+
+def _record_estimate(endpoint: str, span, estimate: int, response):
+    """Puts the estimated next to the actual prompt tokens on the span and calibrates the estimator."""
+    span.set(estimated_input_tokens=token_estimates.calibrated(endpoint, estimate))
+    record_usage(span, response)
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None and usage.prompt_token_count:
+        token_estimates.observe(endpoint, estimate, usage.prompt_token_count)
+
+
+# --- Latency Tracking (for hedging) ---
+
+class LatencyTracker:
+    """Keeps a sliding window of successful call latencies per endpoint."""
+
+    def __init__(self, window: int = 200):
+        self._samples: dict[str, deque] = {}
+        self._window = window
+
+    def record(self, endpoint: str, seconds: float):
+        self._samples.setdefault(endpoint, deque(maxlen=self._window)).append(seconds)
+
+    def p95(self, endpoint: str) -> float | None:
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < settings.hedge_min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+
+# --- Circuit Breaker ---
+
+class CircuitBreaker:
+    """
+    Opens after a run of consecutive upstream failures so that requests fail fast
+    instead of piling up on a degraded upstream. After the cool-down a single
+    trial request is let through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def retry_after(self) -> float:
+        """Seconds until a request may be attempted, 0 if the circuit allows it now."""
+        if self.opened_at is None:
+            return 0
+        remaining = self.opened_at + self.reset_seconds - time.monotonic()
+        if remaining > 0:
+            return remaining
+        if self.trial_in_flight:
+            return 1
+        self.trial_in_flight = True
+        return 0
+
+    def release_trial(self):
+        """
+        Gives up the half-open trial without an outcome, e.g. when the trial call was
+        cancelled or its stream closed early, so that the next request becomes the trial.
+        """
+        self.trial_in_flight = False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning(f"Model circuit opened after {self.failures} consecutive failures.")
+            self.opened_at = time.monotonic()
+
+
+latencies = LatencyTracker()
+_breakers: dict[str, CircuitBreaker] = {}
+_inflight = SingleFlight()
+_response_cache = TTLCache(maxsize=settings.response_cache_size, ttl=max(settings.response_cache_ttl, 1))
+
+
+def _breaker(model: str) -> CircuitBreaker:
+    if model not in _breakers:
+        _breakers[model] = CircuitBreaker(settings.circuit_failure_threshold, settings.circuit_reset_seconds)
+    return _breakers[model]
+
+
+def _is_retryable(e: Exception) -> bool:
+    if isinstance(e, errors.APIError):
+        return e.code in RETRYABLE_STATUS_CODES
+    return isinstance(e, (asyncio.TimeoutError, httpx.TransportError))
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(settings.retry_backoff_max, settings.retry_backoff_base * (2 ** attempt)))
+
+
+# --- Gateway ---
+
+async def _hedged(client, endpoint: str, kwargs: dict, span):
+    """
+    Starts the request and, if it has not finished after the endpoint's p95 latency,
+    a duplicate of it. The first successful response wins and the other is cancelled.
+    """
+    tasks = [asyncio.ensure_future(client.aio.models.generate_content(**kwargs))]
+    try:
+        hedge_delay = latencies.p95(endpoint)
+        if hedge_delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                span.add("hedges")
+                tasks.append(asyncio.ensure_future(client.aio.models.generate_content(**kwargs)))
+
+        pending = set(tasks)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # Also covers cancellation by the caller's deadline
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def generate_content(client, endpoint: str, expected_output_tokens: int = 0, **kwargs):
+    """
+    Calls `client.aio.models.generate_content(**kwargs)` under the endpoint's call policy:
+    a hard deadline, retries with jittered exponential backoff on retryable errors,
+    optional hedging, and a per-model circuit breaker.
+
+    Identical requests are served from the response cache when the policy allows it,
+    and concurrent identical requests share a single upstream call. Requests over the
+    endpoint's token budget are rejected without being sent.
+
+    Args:
+        client: The genai client to use.
+        endpoint: Key into POLICIES, also used to label traces and latency stats.
+        expected_output_tokens: The caller's estimate of the reply length, checked
+            against the endpoint's output budget.
+        **kwargs: Passed through to generate_content (model, contents, config).
+
+    Returns:
+        The GenerateContentResponse.
+
+    Raises:
+        BudgetExceeded: The request is over the endpoint's token budget (413).
+        HTTPException: 503 when the circuit is open or retries are exhausted,
+            504 when the deadline expires, 502 for non-retryable upstream errors.
+    """
+    policy = POLICIES[endpoint]
+    estimate = check_budget(endpoint, kwargs, expected_output_tokens)
+    key = request_key(**kwargs)
+
+    with start_span("model.request", endpoint=endpoint, model=kwargs["model"]) as span:
+        cached = _response_cache.get(key) if policy.cacheable else None
+        if cached is not None:
+            span.set(cache_hit=True)
+            return cached
+
+        response, shared = await _inflight.do(key, lambda: _call(client, endpoint, policy, kwargs, estimate))
+        span.set(cache_hit=False, coalesced=shared)
+
+        if policy.cacheable and settings.response_cache_ttl > 0:
+            _response_cache[key] = response
+        return response
+
+
+def _check_breaker(breaker: CircuitBreaker) -> bool:
+    """Raises 503 while the circuit is open. Returns whether this call is the half-open trial."""
+    retry_after = breaker.retry_after()
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=503,
+            detail="The AI service is temporarily unavailable. Please try again shortly.",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+    return breaker.opened_at is not None
+
+
+def _exhausted(last_error: Exception | None) -> HTTPException:
+    if last_error is None or isinstance(last_error, asyncio.TimeoutError):
+        return HTTPException(status_code=504, detail="The AI service did not respond in time.")
+    return HTTPException(status_code=503, detail=f"The AI service is unavailable: {last_error}")
+
+
+async def _call(client, endpoint: str, policy: CallPolicy, kwargs: dict, estimate: int):
+    """Performs one logical upstream call, including its retries."""
+    breaker = _breaker(kwargs["model"])
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + policy.deadline
+    trial = _check_breaker(breaker)
+
+    # Cancellation (a deadline, a client disconnect) bypasses the handlers below, and
+    # a trial that records no outcome would otherwise keep the circuit open for good
+    try:
+        with start_span("model.call", endpoint=endpoint, model=kwargs["model"]) as span:
+            last_error = None
+            for attempt in range(policy.max_attempts):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                started = loop.time()
+                try:
+                    if policy.hedge and settings.hedge_enabled:
+                        call = _hedged(client, endpoint, kwargs, span)
+                    else:
+                        call = client.aio.models.generate_content(**kwargs)
+                    response = await asyncio.wait_for(call, timeout=remaining)
+                except Exception as e:
+                    if not _is_retryable(e):
+                        # The upstream answered, so this says nothing about its health
+                        breaker.record_success()
+                        raise HTTPException(status_code=502, detail=f"AI processing failed: {e}")
+                    last_error = e
+                    span.add("failed_attempts")
+                    logger.warning(f"Model call for '{endpoint}' failed on attempt {attempt + 1}: {e!r}")
+                    if attempt + 1 < policy.max_attempts:
+                        await asyncio.sleep(min(_backoff(attempt), max(deadline - loop.time(), 0)))
+                    continue
+
+                latencies.record(endpoint, loop.time() - started)
+                breaker.record_success()
+                _record_estimate(endpoint, span, estimate, response)
+                return response
+
+            breaker.record_failure()
+            raise _exhausted(last_error)
+    finally:
+        if trial:
+            breaker.release_trial()
+
+
+async def generate_content_stream(client, endpoint: str, expected_output_tokens: int = 0, **kwargs):
+    """
+    Streams `client.aio.models.generate_content_stream(**kwargs)` under the endpoint's
+    call policy. The deadline covers the whole stream. Failed attempts are retried only
+    until the first chunk has been yielded; after that the error goes to the caller.
+
+    Yields:
+        GenerateContentResponse chunks.
+
+    Raises:
+        HTTPException: As for generate_content.
+    """
+    policy = POLICIES[endpoint]
+    estimate = check_budget(endpoint, kwargs, expected_output_tokens)
+    breaker = _breaker(kwargs["model"])
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + policy.deadline
+    trial = _check_breaker(breaker)
+
+    # The generator is suspended at every yield, so its span cannot be the active span
+    span = start_detached_span("model.stream", endpoint=endpoint, model=kwargs["model"])
+    error = None
+    try:
+        last_error = None
+        for attempt in range(policy.max_attempts):
+            if deadline - loop.time() <= 0:
+                break
+            started = loop.time()
+            last_chunk = None
+            try:
+                stream = await asyncio.wait_for(
+                    client.aio.models.generate_content_stream(**kwargs), deadline - loop.time()
+                )
+                chunks = stream.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), deadline - loop.time())
+                    except StopAsyncIteration:
+                        break
+                    if last_chunk is None:
+                        span.set(first_chunk_ms=round((loop.time() - started) * 1000, 1))
+                    last_chunk = chunk
+                    yield chunk
+            except Exception as e:
+                if last_chunk is not None:
+                    breaker.record_failure()
+                    raise _exhausted(e)
+                if not _is_retryable(e):
+                    breaker.record_success()
+                    raise HTTPException(status_code=502, detail=f"AI processing failed: {e}")
+                last_error = e
+                span.add("failed_attempts")
+                logger.warning(f"Model stream for '{endpoint}' failed on attempt {attempt + 1}: {e!r}")
+                if attempt + 1 < policy.max_attempts:
+                    await asyncio.sleep(min(_backoff(attempt), max(deadline - loop.time(), 0)))
+                continue
+
+            latencies.record(endpoint, loop.time() - started)
+            breaker.record_success()
+            if last_chunk is not None:
+                # Usage metadata is reported on the final chunk
+                _record_estimate(endpoint, span, estimate, last_chunk)
+            return
+
+        breaker.record_failure()
+        raise _exhausted(last_error)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        # Also runs when the caller closes the stream early (GeneratorExit) or is cancelled
+        if trial:
+            breaker.release_trial()
+        end_detached_span(span, error)
@@ -75,1471 +75,23 @@ User: "টালিখাতা গোল্ড কিভাবে কিনব
 }
 '''
 
-sys_instruct_info_desk = '''You are Ankona (অঙ্কনা), an AI assistant created by TallyKhata to support users of TallyKhata and TallyPay through a voice interface. User will ask questions regarding how to use the app or the problem they are facing while using the app. The question can be in english, banglish or bangla. Please be helpful, concise and always answer in Bangla language.
-
-For your reference following is a set of context containing information related to the TallyKhata and TallyPay, each starting with a reference number i.e. [[reference:1]], [[reference:2]] etc. Please be helpful and always respond in json. Answer the user query and cite the most relevant reference number. Don't talk about reference numbers within the answer. Only cite the number in the json field named reference. If there are markdown images in the reference text, please also provide the image markdown as is in the json field named image. Otherwise keep the image field set to null. Btw, following are the contexts:
-
-[[reference:1]]
-## টালিখাতা কি?
-
-
-টালিখাতা ব্যবসার হিসাব রাখার মোবাইল অ্যাপ। এতে ক্যাশ, বাকি ও পেমেন্টসহ সকল হিসাব সহজে রাখা যায়। এর সুবিধা সমূহ:
-
-*   ব্যবসার পাই-টু-পাই হিসাব থাকে চোখের সামনে
-*   বাকির ব্যালান্স নিয়ে ভুল বুঝাবুঝি দূর হয় এবং বাকি আদায় সহজ করে
-*   পেমেন্ট লিংক এর মাধ্যমে দ্রুত বাকি আদায় করা যায়
-*   মোবাইল রিচার্জ ব্যবসার মাধ্যমে বাড়তি আয়ের ব্যবস্থা
-*   সুপার QR-এর মাধ্যমে দেশের যেকোনো বাংলা QR সাপোর্টেড অ্যাপ থেকে পেমেন্ট নেয়া যায়
-
-[[reference:2]]
-## টালিখাতায় কি কি করা যায়?
-
-  
-ব্যবসা পরিচালনা, হিসাব রাখা, বাকি আদায় এবং ডিজিটাল লেনদেনসহ যাবতীয় কাজ টালিখাতার মাধ্যমে করা যায়। যেমন:
-
-  
-বাকির হিসাব
-
-*   টালি-তে বাকি কাস্টমারের তালিকা ও বিস্তারিত হিসাব রাখা যায়
-*   প্রতিটি বাকি বেচা ও আদায়ে লেনদেন মেসেজ পাঠানো যায়
-*   তাগাদা পাঠিয়ে পেমেন্ট লিংকের মাধ্যমে বাকি কালেকশন করা যায়
-
-ক্যাশ হিসাব
-
-*   ক্যাশবক্স-এ সব ধরণের ক্যাশ হিসাব রাখা যায়
-*   দিনশেষে ক্যাশ হিসাব মিলানো যায়
-*   মালিকের হিসাব আলাদাভাবে মিলানো যায়
-
-টালি'পে ওয়ালেট
-
-*   সুপার QR-এর মাধ্যমে দেশের যেকোনো বাংলা QR সাপোর্টেড অ্যাপ থেকে পেমেন্ট নেয়া যায়
-*   পেমেন্ট লিংক দিয়ে সহজেই বাকি আদায় করা যায়
-*   মোবাইল রিচার্জ ব্যবসা থেকে বাড়তি আয় করা যায়
-*   কেনা বেচায় ডিজিটাল পেমেন্ট সুবিধা নেয়া যায়
-
-এছাড়াও যা করা যায়:
-
-*   বেচা-কেনা এবং আয়-ব্যয়ের বিস্তারিত রিপোর্ট দেখা যায়
-*   কত বাকি দেয়া হল আর কত আদায় হল তা জানা যায়
-*   লেনদেনের সাথে প্রমাণস্বরূপ ছবি তুলে রাখা যায়
-*   প্রতিটি কাস্টমারের হিসাব ডাউনলোড ও শেয়ার করা যায়
-*   ডিজিটাল ওয়ালেটের মাধ্যমে সব ধরনের লেনদেন করা যায়
-
-
-[[reference:3]]
-## বাকির কাস্টমার কীভাবে যোগ করবো?
-
-১। অ্যাপের টালি ট্যাবে “কাস্টমার যোগ করি” বাটনে ট্যাপ করুন।  
-
-![](images/image34.png) 
-
-২। 'নতুন কাস্টমার/সাপ্লায়ার' স্ক্রিনে নাম লিখে কাস্টমার যোগ করুন। আপনার কন্টাক্ট লিস্ট/ফোনবুক থেকে কোন নাম যোগ করতে চাইলে 'ফোনবুক থেকে যোগ করি' বাটনে ট্যাপ করে কন্টাক্ট লিস্ট থেকে যাকে যোগ করতে চান তার নামের উপর ট্যাপ করুন।  
-  
-![](images/image80.jpg)
-
-এই কাস্টমার এর সাথে আগের কোনো বাকি থাকলে তা 'পূর্বের বাকি (জের)' এ লিখতে পারেন।
-
-৩।  ‘নিশ্চিত' বাটন ট্যাপ করে কাস্টমার/সাপ্লায়ার যোগ করা সম্পন্ন করুন।
-
-
-[[reference:4]]
-## কাস্টমারের বাকির হিসাব কীভাবে এন্ট্রি দিবো?
-
-১। টালি ট্যাব থেকে যেকোনো কাস্টমারের নামের উপর ট্যাপ করুন। উদাহরণস্বরূপ, “রানা ভাই” এর নামের উপর ট্যাপ করা হল।
-
-![](images/image47.png) 
-
-২। রানা ভাই এর কাছে কত টাকার মালামাল বেচা হল অথবা কত টাকা পাওয়া গেল তা এন্ট্রি দিন।
-
-![](images/image64.png) 
-
-আপনি চাইলে লেনদেনের সাথে বিবরণ ও ছবি যুক্ত করতে পারেন। রানা ভাইকে টালি মেসেজ পাঠাতে চাইলে টালি মেসেজ বাটন অন করুন।
-
-৩। ‘নিশ্চিত’ চেপে লেনদেন রেকর্ড  করুন।
-
-
-
-১। প্রথমে ক্যাশবক্স ট্যাব সিলেক্ট করুন। এই স্ক্রিনে ক্যাশ বেচা, ক্যাশ কেনা, খরচ, মালিক দিল, মালিক নিল এর একটি তালিকা দেখা যাবে।  
-  
-![](images/image44.png)
-
-২। ক্যাশ বেচা এন্ট্রি করতে হলে তালিকা থেকে ক্যাশ বেচা-তে ট্যাপ করুন। মালামাল বেচা বাবদ কত টাকা পেলেন তা লিখুন। আপনি চাইলে সাথে বিবরণ এবং ছবিও যুক্ত করে নিতে পারবেন। ‘নিশ্চিত’ বাটন চেপে ক্যাশ বেচা রেকর্ড করুন।
-
-![](images/image21.png)
-
-একইভাবে, কেনা ও খরচের এন্ট্রি করতে যথাক্রমে ক্যাশ কেনা ও খরচের উপর ট্যাপ করে এন্ট্রি করতে পারেন।
-
-
-[[reference:5]]
-## টালিখাতায় এন্ট্রি দিতে গিয়ে ভুল করে ফেলেছি। কীভাবে সংশোধন করবো?
-
-টালিখাতায় যেকোনো এন্ট্রি বা কাস্টমার/সাপ্লায়ার তথ্য এভাবে এডিট-ডিলিট করা যায়:
-
-যদি বাকি কাস্টমার বা সাপ্লায়ার এর নাম বা ফোন নম্বর ভুল করেন:
-
-১। টালিখাতা থেকে কাস্টমার বা সাপ্লায়ারের নামে ট্যাপ করুন। উদাহরণস্বরূপ, “রানা ভাই” এর নামের উপর ট্যাপ করা হল।
-
-![](images/image66.png) 
-
-২। পরবর্তী স্ক্রিন কাস্টমার/সাপ্লায়ারের নাম এর ডান দিকে ৩টি ডট আছে, সেখানে ট্যাপ করে মেন্যু খুলুন। মেন্যু থেকে প্রয়োজনমতো এডিট অথবা ডিলিট অপশন সিলেক্ট করুন।
-
-![](images/image2.png)
-
-৩। এডিট-এর ক্ষেত্রে কাস্টমারের নাম বা মোবাইল নম্বর এডিট করে পরবর্তী বাটন ট্যাপ করুন। ![](images/image40.png) 
-
-![](images/image40.png)
-
-৪। ডিলিট করার ক্ষেত্রে সম্পূর্ণ নিশ্চিত হয়ে নিন যে এই কাস্টমার/সাপ্লায়ারের সাথে আপনার সকল লেনদেন মুছে দিতে চান।
-
-৫। PIN দিয়ে এডিট/ডিলিট নিশ্চিত করুন।
-
-![](images/image38.png)
-
-যদি বাকি লেনদেনের এন্ট্রি দিতে ভুল করেন:
-
-১। প্রথমে টালি থেকে কাস্টমার বা সাপ্লায়ারের নামে ট্যাপ করুন।
-
-![](images/image66.png)
-
-২। এরপর স্ক্রিনের উপরে কাস্টমারের নাম এর পাশে ৩টা ডট আছে সেখানে ট্যাপ করুন। সেখান থেকে রিপোর্ট অপশন সিলেক্ট করুন।
-
-![](images/image2.png) 
-
-৩। রিপোটের নিচের লেনদেনের লিস্ট থেকে যে লেনদেনটি এডিট করতে চান, সেটার ওপর ট্যাপ করুন।
-
-![](images/image24.png)
-
-৪। এখন আপনি লেনদেনটি ডিলিট বা এডিট করতে পারবেন। এডিট ট্যাপ করলে আপনি এই লেনদেনের পরিমাণ, বিবরণ, তারিখ বা ছবি পরিবর্তন করতে পারবেন।
-
-![](images/image69.png)
-
- ডিলিট করে দিলে আপনি ট্রানজেকশনটি আর ফেরত পাবেন না। ব্যাকআপ থেকেও ডিলিট হয়ে যাবে।
-
-৫। প্রয়োজনীয় সংশোধন করে PIN দিয়ে নিশ্চিত করুন।
-
-![](images/image53.png)
-
-![](images/image5.png)
-
-যদি ক্যাশ লেনদেন এন্ট্রি দিতে ভুল করেন:
-
-ধরুন, আপনি ক্যাশ বেচা এন্ট্রি দিতে ভুল করেছেন। এন্ট্রিটি এডিট করতে হলে -
-
-১। প্রথমে ক্যাশবক্স ট্যাবে যান।
-
-![](images/image57.png)
-
-২। তালিকা থেকে ক্যাশ বেচা-তে ট্যাপ করুন।
-
-![](images/image43.png)![](images/image96.png)
-
-৩। ক্যাশ বেচা এন্ট্রি স্ক্রিনের টাইটেল বারে রিপোর্ট আইকন এ ট্যাপ করুন। এখানে, ঐদিনের সব বেচা
-
-এন্ট্রি গুলো দেখা যাবে।
-
-![](images/image60.png)
-
-৪। আপনার এন্ট্রি করা ভুল লেনদেনটিতে ট্যাপ করলে আপনি এডিট ও ডিলিট অপশন পাবেন। ![](images/image1.png)
-
-৫। এডিট অপশনে আপনি লেনদেনের পরিমাণ, বিবরণ, বা ছবি পরিবর্তন করতে পারবেন।
-
-![](images/image5.png)
-
- ডিলিট করে দিলে আপনি ট্রানজেকশনটি আর ফেরত পাবেন না। ব্যাকআপ থেকেও ডিলিট হয়ে যাবে।
-
-৬। প্রয়োজনীয় সংশোধন করে PIN দিয়ে  নিশ্চিত করুন।
-
-![](images/image53.png)
-
-![](images/image5.png)
-
-ক্যাশ কেনা, খরচ, মালিক দিল বা মালিক নিল এন্ট্রিতে ভুল হলে একইভাবে এডিট করা যায়।
-
-[[reference:6]]
-## টালি-মেসেজ কি?
-
-টালি-মেসেজ টালিখাতা ব্র্যান্ড থেকে পাঠানো মেসেজ যা বিভিন্ন প্রয়োজনে কাস্টমারের কাছে পাঠানো যায়। যেমন:
-
-১। কাস্টমার/সাপ্লায়ার-এর সাথে লেনদেন রেকর্ড করলে
-
-২। তাগাদা ও কালেকশন লিংক পাঠাতে
-
-
-[[reference:7]]
-## হোয়াটসঅ্যাপ বা ইমো-তে কীভাবে লেনদেন রেকর্ড শেয়ার করবো?
-
-হোয়াটসঅ্যাপ বা ইমো ব্যবহার করে লেনদেন রেকর্ড শেয়ার করতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন:
-
-১। লেনদেন রেকর্ড করার সময় টালি-মেসেজ অপশন বন্ধ করে করে নিশ্চিত ট্যাপ করুন।
-
-![](images/image54.png)
-
-![](images/image54.png) 
-
-২। লেনদেন রেকর্ড হওয়ার পর ‘লেনদেন রেকর্ড শেয়ার করি’ অপশন থেকে হোয়াটসঅ্যাপ বা ইমো-তে ট্যাপ করুন।
-
-![](images/image22.png)
-
-৩। এখন হোয়াটসঅ্যাপ বা ইমো-র কন্ট্যাক্ট লিস্ট দেখাবে। এই লিস্ট থেকে আপনার কাস্টমার সিলেক্ট করুন এবং ‘সেন্ড’ বাটন চেপে লেনদেন রেকর্ড শেয়ার করুন।
-
-একইভাবে ভাইবার এবং মেসেঞ্জার-এর মাধ্যমেও লেনদেন রেকর্ড শেয়ার করা যায়।
-
-
-[[reference:8]]
-##  আমার মোবাইলের এসএমএস ব্যবহার করে কীভাবে লেনদেন রেকর্ড শেয়ার করবো?
-
-মোবাইলের এসএমএস ব্যবহার করে লেনদেন রেকর্ড শেয়ার করতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন।:
-
-১। আপনার লেনদেন রেকর্ড করুন। টালি-মেসেজ অপশন বন্ধ করে নিশ্চিত ট্যাপ করুন।
-
-![](images/image54.png)
-
-![](images/image54.png)
-
-২। লেনদেন রেকর্ড হওয়ার পর ‘লেনদেন রেকর্ড শেয়ার করি’ অপশন থেকে এসএমএস সিলেক্ট করুন।
-
-![](images/image22.png)
-
-৩। এসএমএস সিলেক্ট করলে মেসেজ অ্যাপের কাস্টমারের ইনবক্সে নিয়ে যাবে। এরপর সেন্ড বাটন প্রেস করে লেনদেন রেকর্ড শেয়ার করুন।
-
-
-[[reference:9]]
-## কাস্টমার তার লেনদেন রিপোর্ট পেমেন্ট লিংকে কীভাবে দেখবে?
-
-আপনার পাঠানো পেমেন্ট লিংকে ট্যাপ করলে কাস্টমার তার বর্তমান বাকি ও টাকার পরিমাণ দিয়ে পেমেন্ট করার অপশনসহ একটি পেজ দেখবে। এই পেজে ব্যবসা প্রতিষ্ঠানের তথ্যের নিচে ‘রিপোর্ট দেখুন’ লিংকে ক্লিক করলে সর্বশেষ পাঁচটি লেনদেনের তথ্য দেখতে পাবে।
-
-![](images/image92.png)
-
-![](images/image94.png)
-
-
-[[reference:10]]
-## কাস্টমারের সাথে লেনদেন রিপোর্ট শেয়ার করতে চাই না। কীভাবে বন্ধ করবো?
-
-টালিখাতা অ্যাপে কাস্টমারের রিপোর্ট পেজে যান। লেনদেন রিপোর্টের ঠিক উপরে ‘রিপোর্ট শেয়ার’ অপশনটি বন্ধ করুন।
-
-![](images/image83.png)
-
-কাস্টমার লিংক এ ঢুকলে লেনদেন এর রিপোর্ট দেখতে পাবে না।
-
-
-[[reference:11]]
-## কাস্টমাররা টালি মেসেজ পাচ্ছেন না। কি করবো?
-
-কাস্টমারের বাকি লেনদেনের এসএমএস পাওয়ার জন্য চারটি বিষয় নিশ্চিত করা দরকার:
-
-*   আপনার মোবাইল নম্বরটি ভেরিফাই করা হয়েছে
-*   আপনার ফোনে ইন্টারনেট সংযোগ অন আছে
-*   কাস্টমারের ফোন নম্বর সঠিক
-*   লেনদেনের স্ক্রিনে টালি মেসেজ অপশনটি অন আছে
-
-
-
-মনে করুন, আপনি ক্যাশবক্সে ক্যাশ গুনে পেলেন ১৯,৮০০.০০ টাকা। এবং টালিখাতা অ্যাপ-এ বর্তমান ক্যাশ আছে ১,৭০০.০০ টাকা। এখন দেখে নেই ‘ক্যাশবক্স মিলাই’ ব্যবহার করে ব্যবসার হিসাব কীভাবে
-
-মিলাবেন -
-
-১। ক্যাশবক্স এর হোম স্ক্রিন থেকে “ক্যাশবক্স মিলাই” বাটনে ট্যাপ করুন।
-
-![](images/image87.png)
-
-২। এবার ক্যাশবক্স এর টাকা গুণে, টাকার পরিমাণ (১৯,৮০০.০০) “ক্যাশবক্সে আছে” বক্সে লিখুন এবং পরবর্তী বাটনে ট্যাপ করুন।
-
-![](images/image6.png)
-
-![](images/image67.png)
-
-৩। ক্যাশবক্সে টাকার পরিমাণ বর্তমান ক্যাশের (এন্ট্রি করা ক্যাশের পরিমাণ) চেয়ে ১৮,১০০.০০ টাকা বেশি। ক্যাশবক্সের অতিরিক্ত ১৮,১০০.০০ টাকা, “বাড়তি  টাকা” হিসেবে দেখাবে।
-
-![](images/image46.png)
-
-৪। বাড়তি টাকা “ক্যাশ বেচা (সমন্বিত)” এন্ট্রি দিয়ে মিলাতে “নিশ্চিত” বাটনে ট্যাপ করুন।
-
-![](images/image13.png)
-
-৫। ক্যাশবক্সের বাড়তি ১৮,১০০.০০ টাকা “ক্যাশ বেচা (সমন্বিত)” এন্ট্রি হিসেবে রেকর্ড হয়ে যাবে।
-
-![](images/image97.png)
-
-এবার ধরুন, আপনি ক্যাশবক্সে ক্যাশ গুনে পেলেন ৮০০.০০ টাকা। এবং টালিখাতা অ্যাপ-এ বর্তমান ক্যাশ আছে ১,৭০০.০০ টাকা। এখন দেখে নেই ‘ক্যাশবক্স মিলাই’ ব্যবহার করে ব্যবসার হিসাব কীভাবে
-
-মিলাবেন -
-
-১। ক্যাশবক্স এর হোম স্ক্রিন থেকে “ক্যাশবক্স মিলাই” বাটনে ট্যাপ করুন।
-
-![](images/image15.png)
-
-২। এবার ক্যাশবক্স এর টাকা গুণে, টাকার পরিমাণ (৮০০.০০) “ক্যাশবক্সে আছে” বক্সে লিখুন এবং পরবর্তী বাটনে ট্যাপ করুন।
-
-![](images/image33.png)
-
-৩।ক্যাশবক্সে টাকার পরিমাণ বর্তমান ক্যাশের (এন্ট্রি করা ক্যাশের পরিমাণ) চেয়ে ৯০০.০০ টাকা কম। ক্যাশবক্সের অপর্যাপ্ত ৯০০.০০ টাকা, “ঘাটতি টাকা” হিসেবে দেখাবে।
-
-![](images/image68.png)
-
-৪।এক্ষেত্রে, ক্যাশ মিলানোর জন্য অবশ্যই ক্যাশ কেনা, খরচ  বা মালিক নিল এন্ট্রি করে ক্যাশবক্স মিলাতে হবে।
-
-![](images/image11.png)
-
-
-[[reference:12]]
-## টালি-মেসেজ কীভাবে কিনবো?
-
-টালি মেসেজ কেনার জন্য প্রথমে নিশ্চিত করতে হবে যে মোবাইল ইন্টারনেট আছে। টালি-মেসেজ দু’ভাবে কেনা যায়:
-
-১। টালি’পে এর মাধ্যমে
-
-২। বিকাশ এর মাধ্যমে
-
-টালি-মেসেজ কিনতে নিম্নলিখিত ধাপগুলো অনুসরণ করুন।
-
-১। অ্যাপের মেন্যু থেকে ‘টালি-মেসেজ কিনি’ অপশনে যান।
-
-![](images/image19.png).
-
-২। পছন্দের টালি-মেসেজ প্যাক সিলেক্ট করুন।
-
-![](images/image20.png)
-
-৩। প্যাক সিলেক্ট করলে পেমেন্ট অপশনগুলো দেখাবে। আপনার পেমেন্ট অপশন সিলেক্ট করুন।
-
-![](images/image61.png)
-
-৪.১ টালি’পে সিলেক্ট করলে পরবর্তী স্ক্রিনে আপনার টালি'পে একাউন্ট-এর PIN দিয়ে নিশ্চিত করুন।
-
-![](images/image39.png)
-
-![](images/image39.png)
-
-৪.২ (ক) বিকাশ সিলেক্ট করলে বিকাশ পেমেন্ট স্ক্রিন-টি খুলবে। এখানে বিকাশ একাউন্ট নম্বর দিয়ে পরবর্তী ধাপে যান।
-
-![](images/image102.png)
-
-৪.২ (খ) বিকাশ থেকে এসএমএস এর মাধ্যমে প্রাপ্ত ভেরিফিকেশন কোডটি দিন।
-
-![](images/image56.png)
-
-৪.২ (গ) এরপর বিকাশ PIN দিয়ে নিশ্চিত করুন।
-
-![](images/image26.png)
-
-৫। টালি-মেসেজ প্যাক কেনা সফল হলে এই স্ক্রিনটি দেখতে পাবেন এবং টালি-মেসেজ ব্যালেন্স আপডেট হয়ে যাবে।
-
-![](images/image73.png)
-
-
-[[reference:13]]
-## তাগাদা মেসেজ কীভাবে পাঠাবো?
-
-আপনি চারটি উপায়ে তাগাদা মেসেজ পাঠাতে পারেন:
-
-১. অ্যাপের টালি ট্যাবের হোমস্ক্রিন থেকে
-
-২. কাস্টমারের লেনদেন রেকর্ড স্ক্রিন থেকে
-
-৩.কাস্টমারের রিপোর্ট স্ক্রিন থেকে
-
- ৪. মেন্যু থেকে
-
-১. অ্যাপের টালি ট্যাবের হোমস্ক্রিন থেকে
-
-১.১ অ্যাপের টালি ট্যাবের হোমস্ক্রিন এর সুপার QR বাটনের পাশে বেল আইকনসহ “তাগাদা” বাটনে চাপুন। বাকির পরিমাণ সহ কাস্টমারদের একটি লিস্ট দেখা যাবে। সেখান থেকে যে কাস্টমারকে তাগাদা পাঠাতে চান, ঠিক তার নামের উপর চাপুন।
-
-![](images/image58.png) 
-
-১.২ এরপর তাগাদা পাঠাই স্ক্রিনে বাকির পরিমাণ সহ তাগাদা মেসেজটি দেখতে পাবেন এবং তার নিচে শেয়ার করার অপশন পাবেন।
-
-![](images/image76.png) 
-
-১.৩ টালি মেসেজের মাধ্যমে পাঠাতে চাইলে “টালি-মেসেজ পাঠাই” বাটনে ট্যাপ করুন অথবা অন্য যেকোনো মাধ্যমে পাঠাতে চাইলে “শেয়ার করি” বাটনে ট্যাপ করুন। এক্ষেত্রে যদি ফোনের এসএমএসের মাধ্যমে পাঠালে মোবাইল ফোন অপারেটরের চার্জ প্রযোজ্য হবে।
-
-  
-২. কাস্টমারের লেনদেন রেকর্ড স্ক্রিন থেকে
-
-২.১ টালি থেকে যে কাস্টমারকে তাগাদা পাঠাতে চান তার নামের উপর ট্যাপ করুন।
-
-২.২ এরপর স্ক্রিনের উপরে কাস্টমারের নাম এর পাশে ৩টা ডট আছে সেখানে ট্যাপ করুন। সেখান থেকে তাগাদা পাঠাই অপশন সিলেক্ট করুন।
-
-![](images/image2.png)
-
-২.৩ এরপর তাগাদা স্ক্রিনে বাকির পরিমাণ সহ তাগাদা মেসেজটি দেখতে পাবেন এবং তার নিচে শেয়ার করার অপশন পাবেন।
-
-![](images/image76.png) 
-
-১.৩ টালি মেসেজের মাধ্যমে পাঠাতে চাইলে “টালি-মেসেজ পাঠাই” বাটনে ট্যাপ করুন অথবা অন্য যেকোনো মাধ্যমে পাঠাতে চাইলে “শেয়ার করি” বাটনে ট্যাপ করুন। এক্ষেত্রে যদি ফোনের এসএমএসের মাধ্যমে পাঠালে মোবাইল ফোন অপারেটরের চার্জ প্রযোজ্য হবে।
-
-  
-  
-৩. কাস্টোমারের লেনদেন রিপোর্ট থেকে
-
-৩.১ টালি থেকে যে কাস্টমারকে তাগাদা পাঠাতে চান তার নামের উপর ট্যাপ করুন।
-
-৩.২ এরপর স্ক্রিনের উপরে কাস্টমারের নাম এর পাশে ৩টা ডট আছে সেখানে ট্যাপ করুন। সেখান থেকে রিপোর্ট অপশন সিলেক্ট করুন।
-
-![](images/image2.png) 
-
-৩.৩ রিপোর্ট স্ক্রিন থেকে তাগাদা মেসেজ পাঠাই বাটন ক্লিক করুন।
-
-![](images/image24.png) 
-
-৩.৪ তাগাদা পাঠাই স্ক্রিনে টালি মেসেজের মাধ্যমে পাঠাতে চাইলে “টালি-মেসেজ পাঠাই” বাটনে ট্যাপ করুন অথবা অন্য যেকোনো মাধ্যমে পাঠাতে চাইলে “শেয়ার করি” বাটনে ট্যাপ করুন। এক্ষেত্রে যদি ফোনের এসএমএসের মাধ্যমে পাঠালে মোবাইল ফোন অপারেটরের চার্জ প্রযোজ্য হবে।
-
-![](images/image76.png)
-
-৪. মেন্যু থেকে
-
-৪.১ মেন্যু অপশন থেকে তাগাদা পাঠাই বাটন সিলেক্ট করুন।
-
-![](images/image19.png)
-
-৪.২ বাকির পরিমাণ সহ কাস্টমারদের একটি লিস্ট দেখা যাবে। সেখান থেকে যে কাস্টমারকে তাগাদা পাঠাতে চান, ঠিক তার নামের উপর চাপুন।
-
-![](images/image91.png)
-
-৪.৩ তাগাদা পাঠাই স্ক্রিনে টালি মেসেজের মাধ্যমে পাঠাতে চাইলে “টালি-মেসেজ পাঠাই” বাটনে ট্যাপ করুন অথবা অন্য যেকোনো মাধ্যমে পাঠাতে চাইলে “শেয়ার করি” বাটনে ট্যাপ করুন। এক্ষেত্রে যদি ফোনের এসএমএসের মাধ্যমে পাঠালে মোবাইল ফোন অপারেটরের চার্জ প্রযোজ্য হবে।
-
-![](images/image76.png)
-
-
-
-পেমেন্ট ভয়েস নোটিফিকেশন পেতে নিন্মোক্ত ধাপগুলো অনুসরণ করুন:
-
-১. মেন্যু থেকে "সেটিংস" -এ ট্যাপ করুন
-
-২. "ভয়েস নোটিফিকেশন" অপশনটির টগল অন করুন
-
-এখন থেকে সুপার QR থেকে প্রাপ্ত সকল পেমেন্ট আপনি ভয়েস নোটিফিকেশনের মাধ্যমে শুনতে পাবেন।
-
-[[reference:14]]
-## আমার ব্যবসার হিসাব অন্য কেউ দেখতে পারবে কি?
-
-আপনার ব্যবসার হিসাব শুধুমাত্র আপনিই দেখতে পারবেন। আপনার তথ্য সুরক্ষিত রাখতে টালিখাতা অ্যাপে রয়েছে PIN এর মাধ্যমে লক করার ব্যবস্থা, যাতে অন্য কেউ আপনার তথ্য দেখতে না পারে।
-
-
-[[reference:15]]
-## টালিখাতা ব্যবহারের জন্য কি ইন্টারনেট সংযোগ দরকার?
-
-ইন্টারনেট সংযোগ ছাড়াই টালিখাতা অ্যাপ ব্যবহার করা যায়। ডাটা ব্যাকআপ, লেনদেনের মেসেজ পাঠানো , তাগাদা পাঠানো, টালি - মেসেজ কেনা, হেল্প সেকশন এবং টালি'পে ওয়ালেট ব্যবহার করার জন্য এর জন্য ইন্টারনেট সংযোগ চালু থাকা প্রয়োজন।
-
-
-[[reference:16]]
-## ডাটা ব্যাকআপ কীভাবে হয়?
-
-টালিখাতা অ্যাপে ইন্টারনেট সংযোগ অন থাকলে প্রতি ১ ঘণ্টা পর পর অটোমেটিক ডাটা ব্যাকআপ হয়। তাছাড়া, মেন্যু থেকে “ডাটা ব্যাকআপ” সিলেক্ট করে ম্যানুয়ালি ডাটা ব্যাকআপ করা যায়।  মেন্যু থেকে ডাটা ব্যাকআপ স্ক্রিনে এ গেলে সর্বশেষ ব্যাকআপের সময় ও দেখা যায়। এছাড়াও আপনার ডাটা ব্যাকআপ না হয়ে থাকলে টালি হোমস্ক্রিনে ডাটা ব্যাকআপ ওয়ার্নিং দেখতে পাবেন। ডাটা ব্যাকআপ হওয়ার জন্য অবশ্যই ইন্টারনেট সংযোগ অন থাকতে হবে।
-
-
-[[reference:17]]
-## অ্যাপটি আনইন্সটল/ডিলিট হয়ে গেলে কি সব ডাটা হারিয়ে যাবে?
-
-টালিখাতা অ্যাপে ইন্টারনেট সংযোগ অন থাকলে প্রতি ১ ঘণ্টা পর পর অটোমেটিক ডাটা ব্যাকআপ হয়। টালিখাতা অ্যাপটি আনইন্সটল/ডিলিট হয়ে গেলে আবার ইন্সটল করে লগইন করুন। আপনার ব্যবসার সব ডাটা দেখতে পাবেন ও ব্যবহার করতে পারবেন।
-
-তবে অ্যাপ আনইন্সটল/ডিলিট করার আগে ম্যানুয়ালি ডাটা ব্যাকআপ করে রাখা ভালো।
-
-
-[[reference:18]]
-## মোবাইল হারিয়ে গেলে বা নষ্ট হলে কি সব ডাটা হারিয়ে যাবে?
-
-মোবাইল হারিয়ে গেলে বা নষ্ট হলেও আপনার ব্যবসার ব্যাকআপ করা ডাটা হারাবে না। আপনি যে মোবাইল নম্বর ব্যবহার করে টালিখাতায় রেজিস্ট্রেশন করেছেন, সেই নম্বর দিয়েই নতুন মোবাইলে টালিখাতা ইনস্টল করে লগইন করুন। আপনার ব্যবসার সব ডাটা দেখতে পাবেন ও ব্যবহার করতে পারবেন।
-
-
-[[reference:19]]
-## টালি’পে ব্যবহারের জন্য কি ইন্টারনেট সংযোগ জরুরি?
-
-হ্যাঁ, টালি’পে সার্ভিস ব্যবহার করতে আপনার মোবাইলে ইন্টারনেট সংযোগ লাগবে।
-
-
-[[reference:20]]
-## আমি কী একই PIN দিয়ে টালিখাতা ও টালি'পে ব্যবহার করতে পারবো??
-
-জ্বী, আপনি একই PIN দিয়ে টালিখাতা ও টালি'পে ব্যবহার করতে পারবেন।
-
-
-[[reference:21]]
-## টালিখাতা বা টালি’পে সম্পর্কিত অভিযোগ বা মতামত কোথায় জানাবো?
-
-টালিখাতা বা টালি 'পে সম্পর্কিত যেকোনো অভিযোগ বা মতামত জানাতে ১৬৭২৬ নম্বরে কল করুন, অথবা টালিখাতার ফেইসবুক মেসেঞ্জারে মেসেজ পাঠাতে পারেন।
-
-
-[[reference:22]]
-## ক্যাশবক্স কি?
-
-ক্যাশবক্স টালিখাতা অ্যাপ-এর একটি ফিচার যেখানে ব্যবসার সামগ্রিক হিসাব নিয়ন্ত্রন করা যায়। এখানে -
-
-*   দৈনন্দিন ক্যাশ বেচা, কেনা ও খরচের হিসাব রাখা যায়
-*   প্রতিদিনের বেচা ও ক্যাশের সার্বিক চিত্র দেখা যায়
-*   মালিকের হিসাব আলাদা করে রাখা যায়
-*   দিনশেষে ক্যাশবক্স মিলানো যায়  
-    
-
-
-[[reference:23]]
-## মালিক দিল এবং মালিক নিল বলতে কি বুঝি?
-
-অনেক ব্যবসাতেই মালিকের সাথে ব্যবসার লেনদেন থাকে। যেমন, অনেক ক্ষেত্রে সকালে মালিক বাসা থেকে টাকা নিয়ে এসে ব্যবসায় বা ক্যাশবক্সে দেয়। এটা হল মালিক দিল।
-
-আবার ধরুন রাতে ব্যবসা বন্ধ করার আগে মালিক ক্যাশ টাকা নিয়ে বাসায় গেলেন। এটা হল মালিক নিল।
-
-
-[[reference:24]]
-## ক্যাশ বেচা, কেনা ও খরচের হিসাব কীভাবে রাখবো? বেচা-কেনা ও খরচের হিসাব কীভাবে দেখা যায়?
-
-বেচা-কেনা ও খরচের হিসাব দেখতে হলে মেন্যু থেকে বেচা-কেনা অথবা খরচ সিলেক্ট করুন। এই রিপোর্টটি মাস, সপ্তাহ বা দিনের ভিত্তিতে দেখা যাবে।
-
-![](images/image65.png)
-
-
-[[reference:25]]
-## টালি’পে কী?
-
-টালি'পে একটি ডিজিটাল ওয়ালেট সার্ভিস যার মাধ্যমে যে কোনো ব্যাংক বা মোবাইল ব্যাংকিং অ্যাপ-এর সাথে টাকা লেনদেন করা যায়। এছাড়াও বাকি কালেকশন, মোবাইল রিচার্জসহ বিভিন্ন ধরণের ডিজিটাল লেনদেন করা যায়। এই ওয়ালেট সার্ভিসটি বাংলাদেশ ব্যাংক কর্তৃক লাইসেন্স প্রাপ্ত।
-
-
-[[reference:26]]
-## টালি’পে সেবাসমূহ কী কী?
-
-*   সুপার QR দিয়ে দেশের যেকোনো বাংলা QR সাপোর্টেড অ্যাপ থেকে পেমেন্ট নেয়া
-*   পেমেন্ট লিংক এর মাধ্যমে বাকি কালেকশন
-*   ডেবিট/ক্রেডিট কার্ড, রকেট বা নগদ থেকে অ্যাড মানি করা
-*   মোবাইল রিচার্জ
-*   ব্যাংক একাউন্ট, রকেট বা নগদে মানি ট্রান্সফার করা
-*   মার্চেন্ট বা সাপ্লায়ার পেমেন্ট
-*   অন্য টালি'পে একাউন্ট-এ টাকা পাঠানো
-
-
-[[reference:27]]
-## টালি’পে একাউন্ট কীভাবে খুলবো?
-
-অ্যাপের ‘ওয়ালেট’ ট্যাবে যান। এরপর ‘সুপার QR নিন’ বাটন-এ ট্যাপ করুন।
-
-![](images/image101.png)
-
-এরপর ‘সুপার QR নিন’ পেজ থেকে টালি’পে একাউন্ট খুলতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন :
-
-![](images/image72.png) 
-
-ধাপ ১ঃ NID এর তথ্য 
-
-আপনার NID-এর সামনের ও পেছনের দিকের ছবি তুলুন এবং NID এর সকল তথ্য অ্যাপে দেখানোর পর তা নিশ্চিত করুন।
-
-![](images/image62.png)
-
-ধাপ ২ঃ সেলফি
-
-আপনার সেলফি তুলুন।
-
-খেয়াল রাখবেনঃ
-
-*   যেন পর্যাপ্ত আলো চেহারার উপর থাকে।
-*   মোবাইল ফোনের সামনের ক্যামেরাতে আপনার চেহারা সম্পূর্ণভাবে দেখা যায়।
-
-![](images/image98.png)
-
-*   চোখের পলক ফেলে সেলফি নিশ্চিত করুন।
-
-ধাপ ৪ঃ এই পর্যায়ে আপনার টালি'পে পার্সোনাল একাউন্ট তৈরি হয়ে যাবে। এখন PIN সেট করে একাউন্টের সিকিউরিটি নিশ্চিত করুন।![](images/image42.png) 
-
-ধাপ ৫ঃ সর্বশেষ ধাপে যেকোনো মোবাইল ব্যাংকিং একাউন্ট বা ব্যাংক একাউন্ট-এর তথ্য দিয়ে টালি’পে একাউন্টটি একটিভ করতে হবে।
-
-
-[[reference:28]]
-## টালি’পে-তে লেনদেনের পূর্বশর্ত কি?
-
-টালি’পে-তে যেকোনো লেনদেন করতে হলে অবশ্যই ওয়ালেট একটিভ করতে হবে। যদি টালি'পে পার্সোনাল একাউন্ট খোলার সময় একাউন্ট একটিভ করা না হয়ে থাকে তাহলে পরবর্তীতে ২ ভাবে একাউন্ট এক্টিভ করা যায়:
-
-১. ওয়ালেট ট্যাবে যেকোনো সার্ভিসে ট্যাপ করে
-
-২. লিংকড একাউন্ট সমূহ থেকে ‘একাউন্ট যোগ করি’ বাটনে ট্যাপ করে
-
-![](images/image89.png) 
-
-উভয় যায়গা থেকেই যেকোনো মোবাইল ব্যাংকিং একাউন্ট অথবা ব্যাংক একাউন্ট যোগ করে একাউন্ট একটিভ করে নিন।
-
-*   মোবাইল ব্যাংকিং একাউন্ট যোগ করতে নিম্নোক্ত ধাপগুলো অনুসরণ করুনঃ
-
-১। ব্যাংক একাউন্ট ও মোবাইল ব্যাংকিং একাউন্ট অপশন ২টি থেকে ‘মোবাইল ব্যাংকিং একাউন্ট’ সিলেক্ট করুন।
-
-![](images/image78.png)
-
-২। আপনার বিদ্যমান মোবাইল ব্যাংকিং সার্ভিস সিলেক্ট করুন এবং উক্ত মোবাইল ব্যাংকিং সার্ভিস এর একাউন্ট নম্বর দিয়ে নিশ্চিত করুন।
-
-![](images/image77.png)
-
-![](images/image41.png)
-
-৩। আপনার প্রদত্ত নম্বরটি যদি টালি’পে একাউন্ট নম্বর ব্যতিত অন্য নম্বর হয়ে থাকে, তাহলে এসএমএস এর মাধ্যমে উক্ত নম্বরে একটি ভেরিফিকেশন কোড পাঠানো হবে। আপনি ভেরিফিকেশন কোড এর মাধ্যমে নম্বরটি ভেরিফাই করুন।
-
-অন্যথায়, যদি টালি’পে নম্বর ও প্রদত্ত মোবাইল ব্যাংকিং একাউন্ট নম্বর একই হয়ে থাকে তাহলে ভেরিফিকেশন কোড ছাড়াই একাউন্টটি যোগ হয়ে যাবে।
-
-*   ব্যাংক একাউন্ট যোগ করতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন।
-
-১। অ্যাপ এর ওয়ালেট ট্যাবে যেকোনো সার্ভিসে ট্যাপ করলে ব্যাংক একাউন্ট ও মোবাইল ব্যাংকিং একাউন্ট যোগ করার দুটো অপশন দেখা যাবে। এখান থেকে ‘ব্যাংক একাউন্ট’ সিলেক্ট করুন।
-
-![](images/image29.png)
-
-২। ‘ব্যাংক একাউন্ট যোগ করি’ স্ক্রিনে আপনার ব্যাংক একাউন্ট এর তথ্যসমূহ যেমন ব্যাংকের নাম, জেলা, শাখা, একাউন্ট হোল্ডারের নাম এবং এই একাউন্টের তথ্য যে সঠিক ও নির্ভুল তা নিশ্চিত করুন।
-
-![](images/image8.png)
-
-৩। নিশ্চিত হয়ে গেলে আপনার ব্যাংক একাউন্ট টি যোগ হয়ে যাবে।
-
-
-[[reference:29]]
-## সুপার QR কী ?
-
-সুপার QR বাংলা QR সাপোর্টেড  একটি ব্র্যান্ডেড QR কোড যা দিয়ে যেকোনো টালি'পে রিটেইলার অথবা মার্চেন্ট একাউন্টধারী যেকোনো বাংলা QR সাপোর্টেড ব্যাংক বা মোবাইল ব্যাংকিং অ্যাপ থেকে পেমেন্ট গ্রহণ করতে পারবেন।
-
-সুপার QR-এর সুবিধা:
-
-*   বিকাশ, রকেট ও সকল ব্যাংক থেকে পেমেন্ট নেয়া যায়
-*   পেমেন্ট রিসিভ হলে ভয়েস নোটিফিকেশন পাওয়া যায়
-*   সাশ্রয়ী সার্ভিস চার্জ
-
-[[reference:30]]
-## সুপার QR পেতে করনীয় কী?
-
-সুপার QR পাওয়া খুবই সহজ। টালি'পে-তে একটি রিটেইলার বা মার্চেন্ট একাউন্ট খুলেই পেতে পারেন সুপার QR।
-
-পার্সোনাল একাউন্ট না থাকলে অ্যাপের মধ্যেই টালি’পে পার্সোনাল একাউন্ট খুলে রিটেইলার একাউন্ট-এর জন্য অনুরোধ করা যাবে। যদি টালি'পে পার্সোনাল একাউন্ট খোলা হয়ে থাকে, তবে তা রিটেইলার একাউন্ট-এ আপগ্রেড করে নিলেই হবে।
-
-টালি'পে-তে পার্সোনাল একাউন্ট না খুলে থাকলে নিম্নোক্ত ধাপগুলো অনুসরণ করুনঃ
-
-১) NID-এর তথ্য দিন
-
-২) আপনার সেলফি তুলুন
-
-৩) মোবাইল ব্যাংকিং একাউন্ট বা ব্যাংক একাউন্টের তথ্য দিন
-
-টালি’পে একাউন্ট হয়ে গেলে অ্যাপের মধ্যেই আপনার ব্যবসা/পেশার তথ্য দিয়ে রিটেইলার একাউন্টের জন্য অনুরোধ করুন। আপনার তথ্য যাচাই করে সাধারণত ২-৩ কর্মদিবসের মধ্যে রিটেইলার একাউন্ট এক্টিভ করা হয় ও সুপার QR প্রদান করা হয়। উল্লেখ্য, আপনার প্রদত্ত তথ্য অবশ্যই সামঞ্জস্যপূর্ণ হতে হবে।
-
-আর যদি আপনার ব্যবসার ট্রেড লাইসেন্স থাকে তাহলে টালি’পে মার্চেন্ট একাউন্ট খুলে সুপার QR পেতে পারেন। এই একাউন্ট খোলার জন্য টালিখাতা হেল্পলাইনে কল করে কাস্টমার সার্ভিস প্রতিনিধির কাছে মার্চেন্ট একাউন্ট-এর জন্য আগ্রহের কথা জানান।
-
-- - -
-[[reference:31]]
-## টালি'পে রিটেইলার একাউন্ট কী? 
-
-টালি'পে রিটেইলার একাউন্ট টালি'পে ওয়ালেট সার্ভিসের একাউন্টের একটি ধরণ যা ক্ষুদ্র/মাঝারি ব্যবসায়ী যারা নিজেরা ব্যবসার মালিক এবং নিজেরাই ব্যবসা পরিচালনা করেন অথবা পেশাজীবী যারা সেবার বিপরীতে কাস্টমারের কাছ থেকে পেমেন্ট নিয়ে থাকেন তাদের জন্য প্রযোজ্য।
-
-রিটেইলার একাউন্ট-এর প্রধান সুবিধা সমূহঃ
-
-*   টালি'পে সুপার QR পাওয়া খুবই সহজ
-*   যেকোনো পেমেন্ট রিসিভে ভয়েস নোটিফিকেশন
-*   কম খরচে ব্যাংক ও মোবাইল ব্যাংকিং সার্ভিসে মানি আউট করা যায়
-
-রিটেইলার একাউন্ট খুলতে কোনো ট্রেড লাইসেন্সের প্রয়োজন নেই। শুধু একাউন্টধারীর NID দিয়ে রেজিস্ট্রিকৃত মোবাইল নম্বরটি সক্রিয় থাকা প্রয়োজন।
-
-[[reference:32]]
-## টালি’পে রিটেইলার একাউন্ট কিভাবে খুলবো?
-
-রিটেইলার একাউন্ট-এর জন্য অনুরোধ করতে নিন্মোক্ত প্রক্রিয়া অনুসরণ করুনঃ
-
-ক) টালি’পে পার্সোনাল একাউন্ট থাকলে নিচের যেকোনো একটি  অপশনে ট্যাপ করে রিটেইলার একাউন্টের ফর্ম পূরণ করুন।
-
-১) টালি ট্যাবে সুপার QR ব্যানারে ট্যাপ করে
-
-২) অ্যাপের টপবারে ব্যবসার নামে ট্যাপ করে
-
-৩) মেন্যু থেকে সুপার QR ব্যানারে ট্যাপ করে
-
-৪) টালি ট্যাবে কাস্টমার/সাপ্লাইয়ার লিস্টের উপরে সুপার QR আইকনে ট্যাপ করে
-
-![](images/image74.png)
-
-৫) ওয়ালেটের সুপার QR সার্ভিস আইকনে ট্যাপ করে
-
-![](images/image82.png)
-
-খ) টালি'পে পার্সোনাল একাউন্ট না থাকলে প্রথমে অ্যাপের ‘ওয়ালেট’ ট্যাব থেকে “সুপার QR নিন” বাটন-এ ট্যাপ করে পার্সোনাল একাউন্ট সম্পন্ন করুন।
-
-![](images/image18.png) 
-
-এরপর “সুপার QR নিই” বাটনে ট্যাপ করে রিটেইলার একাউন্ট-এর জন্য ফর্ম পূরণ করুন।
-
-![](images/image51.png)
-
-রিটেইলার একাউন্ট-এর ফর্মে থাকা প্রয়োজনীয় তথ্য পূরণ করে জমা নিশ্চিত করতে হবে।
-
-রিটেইলার একাউন্ট-এর জন্য যে সকল তথ্যের প্রয়োজনঃ
-
-১। ব্যবসা/পেশার তথ্য
-
-২। আয়ের তথ্য
-
-৩। ব্যবসার বর্তমান ঠিকানা
-
-এই সকল তথ্য দেয়ার পর আপনার টালি’পে মোবাইল নম্বরটি আপনার NID দিয়ে রেজিস্ট্রিকৃত কিনা তা অটোমেটিক যাচাই করা হবে। মোবাইল নম্বরটি যদি আপনার NID দিয়ে রেজিস্ট্রিকৃত না হয়, তাহলে NID দিয়ে রেজিস্ট্রিকৃত ভিন্ন একটি নম্বর দিতে হবে। NID দিয়ে রেজিস্ট্রিকৃত নম্বর যাচাই সম্পন্ন হলে আপনার অনুরোধটি গ্রহণ করা হবে।
-
-টালি’পে টিম কর্তৃক যাচাই সাপেক্ষে রিটেইলার একাউন্টটি একটিভ হবে এবং একাউন্ট একটিভ হলে আপনি সুপার QR এর সকল সুবিধা উপভোগ করতে পারবেন।
-
-[[reference:33]]
-## আমার মোবাইল নম্বর আমার NID দিয়ে রেজিস্ট্রিকৃত না, কী করবো?
-
-রিটেইলার একাউন্ট-এর জন্য প্রদত্ত মোবাইল নম্বরটি আপনার NID দিয়ে রেজিস্ট্রিকৃত না হলে আপনারই NID দিয়ে রেজিস্ট্রিকৃত ভিন্ন একটি নম্বর দিতে হবে।
-
-মোবাইল নম্বর NID দিয়ে রেজিস্ট্রিকৃত কিনা জানতে নিন্মোক্ত ধাপগুলো অনুসরণ করুনঃ
-
-১। আপনার ফোন থেকে *১৬০০১# ডায়াল করুন
-
-২। এবার NID-এর শেষ ৪ ডিজিট দিয়ে রিপ্লাই করুন
-
-৩। ফিরতি SMS-এ আপনার NID দিয়ে রেজিস্ট্রিকৃত সকল নম্বরের তালিকা পাওয়া যাবে
-
-[[reference:34]]
-## কীভাবে বুঝবো যে আমি সুপার QR পেয়েছি?  
-
-আপনার সুপার QR এক্টিভ হলে এসএমএস ও টালিখাতা অ্যাপে নোটিফিকেশনের মাধ্যমে জানানো হবে।
-
-এছাড়াও আপনার একাউন্ট-এর ধরণ যদি “মার্চেন্ট” অথবা “রিটেইলার” হয়ে থাকে অ্যাপের টপ বার-এ ব্যবসার নামের ট্যাপ করে আপনার সুপার QR দেখতে পারবেন। এছাড়াও মেন্যুতে ট্যাপ “মার্চেন্ট” অথবা “রিটেইলার” ট্যাগ দেখতে পাবেন।
-
-[[reference:35]]
-## কীভাবে সুপার QR দিয়ে পেমেন্ট নিবো ?  
-
-সুপার QR দিয়ে পেমেন্ট নিতে নিন্মোক্ত ধাপগুলো অনুসরণ করুনঃ
-
-১) আপনার দোকানে রাখা QR স্ট্যান্ড বা স্টিকারটি কাস্টমারের সামনে প্রদর্শন করুন। স্টিকার/স্ট্যান্ড না থাকলে অ্যাপের টপ বার-এ নামের পাশে QR আইকনটি ট্যাপ করে QR টি কাস্টমারের সামনে প্রদর্শন করুন।
-
-![](images/image27.png)
-![](images/image88.png)
-
-২) কাস্টমারকে বলুন তার পেমেন্ট অ্যাপের বাংলা QR স্ক্যানার দিয়ে আপনার সুপার QR স্ক্যান করতে।
-
-৩) কাস্টমার লেনদেনটি সম্পন্ন করলে আপনার টালিখাতা অ্যাপে নোটিফিকেশন চলে আসবে, এবং ভয়েস সাউন্ডে আপনি প্রাপ্ত টাকার পরিমাণ শুনতে পাবেন।
-
-![](images/image63.png)
-
-
-[[reference:36]]
-## টালি'পে মার্চেন্ট একাউন্ট কী?
-
-যে সকল ব্যবসায়ী মাঝারি বা বড় পরিসরে ব্যবসা পরিচালনা করেন এবং যাদের ব্যবসার ট্রেড লাইসেন্স আছে তাদের জন্য মার্চেন্ট একাউন্ট প্রযোজ্য।
-
-মার্চেন্ট একাউন্ট-এর দৈনিক ও মাসিক লেনদেন লিমিট এবং সর্বোচ্চ ওয়ালেট ব্যালেন্স সাধারণত ব্যবসার বেচার পরিমাণের উপর হয়ে থাকে। ক্ষেত্র বিশেষে আনলিমিটেড হয়।
-
-[[reference:37]]
-## টালি'পে মার্চেন্ট একাউন্ট কীভাবে খুলবো? 
-
-যদি আপনার টালি'পে পার্সোনাল একাউন্ট খোলা না হয়ে থাকে, অ্যাপের ‘ওয়ালেট’ ট্যাবে যান। এরপর “সুপার QR নিন” বাটন-এ ট্যাপ করুন।
-
-![](images/image18.png)
-
-একাউন্ট খোলা সম্পন্ন করে টালিখাতা হেল্পলাইনে কল করুন। আমাদের কাস্টমার সার্ভিস প্রতিনিধি আপনাকে মার্চেন্ট একাউন্ট খুলতে সাহায্য করবে।
-
-[[reference:38]]
-## আমার টালি‘পে রিটেইলার একাউন্ট-এর অনুরোধ বাতিল হয়েছে, কী করবো?
-
-আপনার প্রদত্ত তথ্য সামঞ্জস্যপূর্ণ না হলে টালি’পে টিম পুনরায় হালনাগাদ তথ্য চাইতে পারে। এক্ষেত্রে  অ্যাপে নোটিফিকেশন ও এসএমএস এর মাধ্যমে আপনাকে জানানো হবে। সাথে একাউন্ট একটিভ না হওয়ার কারণসমূহও জানানো হবে।
-
-আপনি হালনাগাদ তথ্য দিয়ে পুনরায় অনুরোধ করতে পারবেন। হালনাগাদ তথ্য দিতে সুপার QR বাটন, মেন্যু বা টালি ট্যাবের ব্যানার ট্যাপ করে অথবা আমার সুপার QR স্ক্রিন থেকে “হালনাগাদ তথ্য দিই” বাটন-এ ট্যাপ করে রিটেইলার একাউন্ট-এর ফর্মটি খুলে তথ্যের ঘাটতি সম্পর্কে জানতে পারবেন ও পুনরায় তথ্য জমা দিতে পারবেন। 
-
-![](images/image84.png)![](images/image84.png)![](images/image96.png)
-
-হালনাগাদ তথ্য জমা দিলে অনুরোধ পুনরায় যাচাই করা হবে। যাচাই প্রক্রিয়া সম্পন্ন হলে আপনাকে এসএমএস ও টালিখাতা অ্যাপে নোটিফিকেশনের মাধ্যমে জানানো হবে।
-
-[[reference:39]]
-## সুপার QR  সম্পর্কিত লিমিট কোথায় দেখা যাবে?
-
-আপনার অ্যাপের মেন্যু থেকে “লেনদেনের লিমিট” ট্যাপ করে সুপার QR লিমিট সম্পর্কে জানতে পারবেন।
-
-![](images/image28.png)
-
-[[reference:40]]
-## টালি’পে তে অ্যাড মানি করার কি কি পদ্ধতি আছে?
-
-টালি'পে তে ভিসা, মাস্টারকার্ড, নগদ এবং রকেট থেকে অ্যাড মানি করা যাবে।  
-
-[[reference:41]]
-## রকেট/নগদ থেকে কিভাবে টালি'পে তে ‘অ্যাড মানি’ করবো?
-
-টালি'পে তে অ্যাড মানি করতে নিন্মোক্ত ধাপগুলো অনুসরণ করুন:
-
-১। ‘ওয়ালেট’ ট্যাব থেকে ‘অ্যাড মানি’ সিলেক্ট করুন।
-
-![](images/image23.png) 
-
-২। অ্যাড মানি-এর মাধ্যম সিলেক্ট করুন
-
- ২.১ (ক) রকেট মোবাইল ব্যাংকিং সার্ভিস থেকে অ্যাড মানি করতে 'রকেট' সিলেক্ট করুন।
-
-![](images/image3.png) 
-
-২.১ (খ) টাকার পরিমাণ দিন এবং ‘পরবর্তী’ বাটনে ট্যাপ করুন।
-
-![](images/image4.png)
-
-![](images/image17.jpg)
-
-২.১ (গ) এখন আপনার রকেট একাউন্ট এর তথ্য দেয়ার জন্য একটি স্ক্রিন দেখা যাবে। এই স্ক্রিনে আপনার রকেট একাউন্ট নম্বর এবং PIN দিয়ে পরবর্তী ধাপে যান।
-
-![](images/image16.png)
-
-২.১ (ঘ) পরবর্তী ধাপে রকেট সার্ভিস থেকে এসএমএস-এর মাধ্যমে প্রাপ্ত OTP দিয়ে নিশ্চিত করুন।
-
-লেনদেনটি সফল হলে নিচের স্ক্রিনটি দেখা যাবে।
-
-![](images/image90.png)
-
-২.২ (ক) নগদ মোবাইল ব্যাংকিং সার্ভিস থেকে অ্যাড মানি করতে ‘নগদ’ সিলেক্ট করুন।
-
-![](images/image3.png) 
-
-২.২ (খ) টাকার পরিমাণ দিন এবং ‘পরবর্তী’ বাটনে ট্যাপ করুন।
-
-![](images/image4.png)
-
-![](images/image17.jpg)
-
-২.২ (গ) এখন আপনার নগদ একাউন্ট এর তথ্য দেয়ার জন্য একটি স্ক্রিন দেখা যাবে। এই স্ক্রিনে আপনার নগদ একাউন্ট নম্বর দিয়ে পরবর্তী ধাপে যান।
-
-![](images/image85.png)
-
-২.২ (ঘ) নগদ সার্ভিস থেকে এসএমএস-এর মাধ্যমে প্রাপ্ত ভেরিফিকেশন কোড দিয়ে পরবর্তী ধাপে যান।
-
-![](images/image70.png)
-
-২.২ (ঙ) পরবর্তী ধাপে আপনার নগদ একাউন্ট-এর PIN দিয়ে নিশ্চিত করুন।
-
-![](images/image86.png)
-
-লেনদেনটি সফল হলে নিচের স্ক্রিনটি দেখা যাবে।
-
-![](images/image71.png)
-
-
-[[reference:42]]
-## টালি'পে তে ডেবিট/ক্রেডিট কার্ড থেকে কিভাবে অ্যাড মানি করবো?
-
-টালি’পে-তে যেকোনো ভিসা বা মাস্টারকার্ড থেকে অ্যাড মানি করা যাবে। অ্যাড মানি করার ক্ষেত্রে নিম্নোক্ত ধাপ গুলো অনুসরণ করুন:
-
-১। ‘ওয়ালেট’ ট্যাব থেকে ‘অ্যাড মানি’ সিলেক্ট করুন।
-
-![](images/image55.jpg) 
-
-২। ‘অ্যাড মানি’ স্ক্রিনে ‘ভিসা/মাস্টারকার্ড’ সিলেক্ট করুন।
-
-![](images/image14.jpg) 
-
-৩। টাকার পরিমাণ দিন এবং ‘পরবর্তী’ বাটনে ট্যাপ করুন।
-
-৪। এখন আপনার কার্ডের তথ্য দেয়ার জন্য একটি স্ক্রিন দেখা যাবে। এই স্ক্রিনে নিম্নোক্ত তথ্যগুলো প্রদান করুন:
-
-ক) কার্ডহোল্ডার এর নাম (Cardholder name - exactly as shown on card)
-
-খ) কার্ড নম্বর (Card number)
-
-গ) কার্ডের মেয়াদ উত্তীর্ণের তারিখ (Expiry date)
-
-ঘ) কার্ডের সিকিউরিটি কোড (Security code)
-
-![](images/image93.png)
-
-এই তথ্যগুলো সঠিক হলে নিশ্চিত করুন।
-
-৫।লেনদেনটি সম্পন্ন হলে সাফল্যের মেসেজ দেখানো হবে।  
-  
-![](images/image32.png) 
-
-
-[[reference:43]]
-## টালি’পে-র মাধ্যমে বাকি কালেকশন কীভাবে করবো?
-
-টালি’পের মাধ্যমে খুব সহজেই কাস্টমারদের কাছ থেকে বাকি আদায় করা যায়। বাকি আদায় করতে নিম্নোক্ত ধাপ গুলো অনুসরণ করুন:
-
-১। ‘ওয়ালেট’ ট্যাব থেকে ‘কালেকশন’ সিলেক্ট করুন।
-
-![](images/image23.png)
-
-২। কাস্টমারের তালিকা থেকে কাস্টমার সিলেক্ট করুন অথবা মোবাইল নম্বর দিয়ে কাস্টমার খুজুন।
-
-![](images/image59.png)
-
-৩।  কাস্টমার এর বাকির হিসাব এবং পেমেন্ট লিংক সহ একটি মেসেজ তৈরি হবে। এবার ‘টালি মেসেজ পাঠাই ‘ বা ‘শেয়ার করি’ এর মাধ্যমে কাস্টমারকে মেসেজ পাঠান।
-
-![](images/image100.jpg)
-
-![](images/image37.png)
-
-মেসেজের সাথে কাস্টমার একটি পেমেন্ট লিংক পাবে। উক্ত পেমেন্ট লিংকে ট্যাপ করে কাস্টমার নগদ রকেট অথবা ডেবিট/ক্রেডিট কার্ড-এর মাধ্যমে আপনাকে পেমেন্ট করতে পারবে।
-
-উল্লেখ্য, টালি মেসেজ অবশিষ্ট ০ দেখালে, ‘টালি মেসেজ কিনি’ লিংকে ট্যাপ করে টালি মেসেজ কিনতে পারবেন।
-
-
-[[reference:44]]
-## মোবাইল রিচার্জ কীভাবে করবো?
-
-মোবাইল রিচার্জ করতে নিম্নোক্ত ধাপ গুলো অনুসরণ করুন:
-
-১। ‘ওয়ালেট’ ট্যাব থেকে ‘মোবাইল রিচার্জ’ সিলেক্ট করুন।
-
-![](images/image23.png)
-
-২। ‘মোবাইল রিচার্জ’ স্ক্রিনে মোবাইল নম্বর এবং ডান দিকের ‘->’ বাটনে ট্যাপ করুন।  
-![](images/image79.png)
-
-৩। এরপর মোবাইল অপারেটর এবং নম্বরের ধরণ সিলেক্ট করে ‘ঠিক আছে’ বাটনে ট্যাপ করুন।
-
-![](images/image7.png)
-
-৪। টাকার পরিমাণ দিয়ে রিচার্জ করতে টাকা ট্যাবে টাকার পরিমাণ দিন এবং ‘পরবর্তী’ বাটনে ট্যাপ করুন অথবা ইন্টারনেট, মিনিট, কল রেট বা বাণ্ডেল প্যাক রিচার্জ করতে পাশের ট্যাবগুলো থেকে পছন্দের প্যাকটি সিলেক্ট করুন।
-
-![](images/image75.jpg)
-
-৫। টালি’পে-র PIN দিয়ে ‘নিশ্চিত’ করুন।
-
-![](images/image25.png) 
-
-রিচার্জ সম্পন্ন হলে ‘মোবাইল রিচার্জ সফল হয়েছে’ মেসেজ দেখাবে।
-
-
-[[reference:45]]
-## টালি’পে দিয়ে কীভাবে সাপ্লায়ার পেমেন্ট করা যায়?
-
-টালি’পের মাধ্যমে খুব সহজেই মার্চেন্ট বা সাপ্লায়ার পেমেন্ট করা যায়। পেমেন্ট করতে নিম্নোক্ত ধাপ গুলো অনুসরণ করুন:
-
-১। ‘ওয়ালেট’ ট্যাব থেকে ‘মার্চেন্ট পেমেন্ট’ সিলেক্ট করুন।
-
-![](images/image23.png)
-
-২। ‘মার্চেন্ট পেমেন্ট’ স্ক্রিনে পেমেন্ট এর জন্য কয়েক ধরণের অপশন আছে
-
-![](images/image81.jpg)
-
-ক) সরাসরি সাপ্লায়ার সিলেক্ট করে পেমেন্ট করতে হলে ‘সাপ্লায়ার সিলেক্ট করি’ বাটনে ট্যাপ করে লিস্ট থেকে সাপ্লায়ার সিলেক্ট করুন
-
-খ) একাউন্ট নম্বর দিয়ে পেমেন্ট করতে চাইলে ফোনবুক থেকে সিলেক্ট করুন বা সরাসরি টালি’পে মার্চেন্ট-এর একাউন্ট নম্বর দিন
-
-৩। পরবর্তী ধাপে টাকার পরিমাণ দিন। আপনি চাইলে বিবরণ ও লিখতে পারেন। এখন ‘পরবর্তী’ বাটনে ট্যাপ করুন।
-
-![](images/image50.png)
-
-৪। টালি’পে-র PIN দিয়ে নিশ্চিত করুন।
-
-![](images/image25.png)
-
-![](images/image95.png)
-
-পেমেন্ট সম্পন্ন হলে ‘পেমেন্ট সফল হয়েছে’ মেসেজ দেখাবে।
-
-
-[[reference:46]]
-## টালি’পে থেকে কী কী উপায়ে টাকা ট্রান্সফার করা যাবে?
-
-টালি’পে থেকে ব্যাংক একাউন্ট, ভিসা কার্ড, ‘নগদ’ এবং ‘রকেট’ মোবাইল ব্যাংকিং একাউন্টে টাকা ট্রান্সফার করা যাবে।
-
-[[reference:47]]
-## কীভাবে টালি'পে থেকে নগদ ট্রান্সফার করা যাবে?
-
-টালি'পে থেকে নগদ মোবাইল ব্যাংকিং সার্ভিসের মাধ্যমে টাকা ট্রান্সফার করার ক্ষেত্রে নিন্মোক্ত ধাপ গুলো অনুসরণ করুন:
-
-১। 'ওয়ালেট' ট্যাব থেকে 'নগদ ট্রান্সফার’ সিলেক্ট করুন।
-
-![](images/image10.jpg)
-
-২। এবার 'নগদ' এর মোবাইল নম্বর দিন বা ফোনবুক থেকে নাম সিলেক্ট করুন।
-
-![](images/image45.jpg)
-
-৩। পরবর্তী ধাপে টাকার পরিমাণ দিন। আপনি চাইলে বিবরণ ও লিখতে পারেন। এরপর 'পরবর্তী' বাটনে ট্যাপ করুন।
-
-![](images/image35.jpg)
-
-৪। টালি'পে-র PIN দিয়ে নিশ্চিত করুন।  
-
-![](images/image12.jpg)
-
-৫। নগদ ট্রান্সফার সম্পন্ন হলে 'নগদ ট্রান্সফার সফল হয়েছে' মেসেজ দেখাবে। আপনি চাইলে পরবর্তী লেনদেনের জন্য নম্বরটি সংরক্ষণ করতে পারেন।
-
-![](images/image9.jpg)
-
-[[reference:48]]
-## কীভাবে টালি'পে থেকে রকেট ট্রান্সফার করা যাবে?
-
-টালি'পে থেকে রকেট মোবাইল ব্যাংকিং সার্ভিসের মাধ্যমে মানি আউট করার ক্ষেত্রে নিন্মোক্ত ধাপ গুলো অনুসরণ করুন:
-
-১। 'ওয়ালেট' ট্যাব থেকে 'রকেট ট্রান্সফার’ সিলেক্ট করুন।
-
-![](images/image10.jpg)
-
-২। এবার 'রকেট' এর মোবাইল নম্বর দিন বা ফোনবুক থেকে নাম সিলেক্ট করুন।
-
-![](images/image45.jpg)
-
-৩। পরবর্তী ধাপে টাকার পরিমাণ দিন। আপনি চাইলে বিবরণ ও লিখতে পারেন। এরপর 'পরবর্তী' বাটনে ট্যাপ করুন।
-
-![](images/image35.jpg)
-
-৪। টালি'পে-র PIN দিয়ে নিশ্চিত করুন।  
-
-![](images/image12.jpg)
-
-৫। মানি আউট সম্পন্ন হলে 'মানি আউট সফল হয়েছে' মেসেজ দেখাবে। আপনি চাইলে পরবর্তী লেনদেনের জন্য নম্বরটি সংরক্ষণ করতে পারেন।
-
-![](images/image9.jpg)
-
-
-[[reference:49]]
-## কীভাবে টালি'পে থেকে ব্যাংক ট্রান্সফার করা যাবে?
-
-টালি'পে থেকে ব্যাংক ট্রান্সফার করতে নিচে উল্লেখিত ধাপগুলো অনুসরণ করুন:
-
-১। 'ওয়ালেট' ট্যাব থেকে 'ব্যাংক ট্রান্সফার' সিলেক্ট করুন।
-
-![](images/image10.jpg)
-
-২। 'ব্যাংক ট্রান্সফার' স্ক্রিনে আপনার ব্যাংক একাউন্ট' সিলেক্ট করুন। যদি আপনার ব্যাংক একাউন্টটি যোগ না করা থাকে, তাহলে ‘নতুন একাউন্ট’ বাটন ট্যাপ করে একাউন্ট যোগ করে নিন।
-
-![](images/image30.png)
-
-৪। পরবর্তী ধাপে টাকার পরিমাণ দিন। আপনি চাইলে বিবরণ ও লিখতে পারেন। এরপর 'পরবর্তী' বাটনে ট্যাপ করুন।
-
-![](images/image31.png)
-
-![](images/image31.png)
-
-৪। টালি'পে-র PIN দিয়ে নিশ্চিত করুন।  
-
-![](images/image99.png)
-
-৫। ব্যাংক ট্রান্সফার সম্পন্ন হলে 'ব্যাংক ট্রান্সফার সফল হয়েছে' মেসেজ দেখাবে।
-
-[[reference:50]]
-## নিজের ব্যাংক একাউন্ট টাকা পাঠাতে কতক্ষণ বা কয়দিন সময় লাগে?
-
-ব্যাংকে মানি আউট করলে এটি বাংলাদেশ ব্যাংক-এর ইলেক্ট্রনিক ফান্ড ট্রান্সফার (BEFTN) সিস্টেম এর মাধ্যমে আপনার ব্যাংক একাউন্টে পাঠানো হয়। তাই BEFTN-এর নির্ধারিত সময়সূচী অনুযায়ী লেনদেনটি প্রসেস করা হয়।
-
-লেনদেন সম্পন্ন হওয়ার সম্ভাব্য সময়:
-
-১। দুপুর ০২:৩০ এর মধ্যে টালি'পে থেকে মানি আউট করলে ঐ কর্মদিবসে প্রদত্ত ব্যাংক একাউন্টে টাকা যোগ হয়।
-
-২। দুপুর ০২:৩০ এর পর টালি'পে থেকে মানি আউট করলে পরবর্তী কর্মদিবসের প্রথমার্ধে ব্যাংক একাউন্টে টাকা যোগ হয়।
-
-৩। সাপ্তাহিক  ছুটি বা সরকারি ছুটির দিনে মানি আউট করলে পরবর্তী কর্মদিবসের প্রথমার্ধে ব্যাংক একাউন্টে টাকা যোগ হয়।
-
-উপরে উল্লেখিত সময়ের মধ্যে ব্যাংক একাউন্টে টাকা জমা না হলে আপনার নিকটস্থ ব্যাংক ব্রাঞ্চে যোগাযোগ করুন। আর, যদি একাউন্ট-এর ভুল তথ্যের কারণে কিংবা কারিগরি কারণে ব্যাংক একাউন্টে টাকা জমা না হয়ে থাকে, বাংলাদেশ ব্যাংক থেকে নিশ্চিতকরণের পরে আপনার টালি'পে একাউন্টে টাকা রিফান্ড করা হবে।
-
-চাইলে NPSB এর মাধ্যমে অতিরিক্ত ১০ টাকা চার্জ দিয়ে ব্যাংক একাউন্টে ইনস্ট্যান্ট ট্রান্সফার করা যায়। এই ক্কখেত্রে সাথে সাথেই টাকা ব্যাংক একাউন্টে জমা হবে। বাংলাদেশ ব্যাংক এর NPSB সার্ভিসে সংযুক্ত ৩৫টি ব্যাংকে ইন্সটায়ন্ট ট্রান্সফার সার্ভিস্টি উপভোগ করতে পারবেন।
-
-সহায়তার জন্য হেল্পলাইন নম্বর ১৬৭২৬-এ কল করুন।
-
-
-[[reference:51]]
-## কিভাবে টালি'পে থেকে সেন্ড মানি করা যাবে?
-
-১। 'ওয়ালেট' ট্যাব থেকে 'সেন্ড মানি' সিলেক্ট করুন।
-
-![](images/image23.png)
-
-২। আপনি যে টালি'পে একাউন্টে সেন্ড মানি করবেন সেই নম্বরটি ইনপুট দিন।
-
-![](images/image52.png)
-
-৩। পরবর্তী ধাপে টাকার পরিমাণ দিন। আপনি চাইলে বিবরণও লিখতে পারেন। এরপর 'পরবর্তী' বাটনে ট্যাপ করুন।
-
-![](images/image36.png)
-
-![](images/image36.png)
-
-৪। টালি'পে-র PIN দিয়ে নিশ্চিত করুন।
-
-![](images/image48.png)
-
-![](images/image48.png)
-
-৫। সেন্ড মানি সম্পন্ন হলে সাফল্যের মেসেজ দেখাবে।
-
-![](images/image49.png)
-
-উল্লেখ্য যে, রিটেইলার এবং মার্চেন্ট একাউন্ট থেকে কাস্টমার একাউন্ট-এ সেন্ড মানি করা যায় না। শুধুমাত্র কাস্টমার একাউন্ট থেকে সেন্ড মানি করা যাবে।
-
-
-[[reference:52]]
-## টালি’পে একাউন্টে যেকোনো লেনদেনের লিমিট কীভাবে জানা যাবে?
-
-টালি’পে লেনদেনের লিমিট দেখতে মেন্যু থেকে ‘লেনদেনের লিমিট’ সিলেক্ট করুন।
-
-
-[[reference:53]]
-##  টালি’পে ব্যবহার করার জন্য কি আমার ব্যাংক একাউন্ট থাকা আবশ্যক?
-
-না। টালি’পে ব্যবহার করার জন্য একাউন্ট একটিভ করা আবশ্যক। এক্ষেত্রে ব্যাংক একাউন্ট না থাকলেও আপনার বিদ্যমান থাকা যেকোনো মোবাইল ব্যাংকিং একাউন্ট দিয়ে একটিভ করলেই হবে।
-
-
-[[reference:54]]
-## আমি কী একই PIN দিয়ে টালিখাতা ও টালি'পে ব্যবহার করতে পারবো?
-
-![](img/ic_right.png)
-
-জ্বী, আপনি একই PIN দিয়ে টালিখাতা ও টালি'পে ব্যবহার করতে পারবেন।
-
-টালিখাতা বা টালি’পে সম্পর্কিত অভিযোগ বা মতামত কোথায় জানাবো?
-
-![](img/ic_right.png)
-
-[[reference:55]]
-## টালিখাতা গোল্ড ভার্সনের সুবিধাগুলো কী কী?
-
-টালিখাতা গোল্ড-এর সুবিধা সমূহ:
-
-১. একই অ্যাপ-এ একাধিক ব্যবসার খাতা ম্যানেজ করার ব্যবস্থা
-২. প্রোডাক্টের স্টক হিসাব রাখা যাতে পাবেন মোট স্টক মূল্যের ধারনা
-৩. ব্যবসার প্রয়োজনীয় নোট লিখে রাখার সুবিধা 
-৪. অনেক কাস্টমারকে একসাথে গ্রুপ তাগাদা পাঠানোর সুবিধা
-
-এছাড়াও রয়েছে আনলিমিটেড লেনদেন এন্ট্রি, রিপোর্ট ডাউনলোড, বিজ্ঞাপনবিহীন ব্যবহার ও ফ্রি টালি-মেসেজ 
-
-[[reference:56]]
-## টালিখাতা গোল্ড কিভাবে কিনবো?
-স্যার, টালিখাতা গোল্ড প্যাকেজ কিনতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন:
-- টালিখাতা গোল্ড প্যাকেজ কিনতে মেন্যুতে গিয়ে "গোল্ড প্যাকেজ কিনুন" এর উপরে  ট্যাপ করুন
-- পরবর্তী স্ক্রীনে গোল্ড প্যাকেজগুলো দেখতে পাবেন। পছন্দের প্যাকেজে ট্যাপ করে প্যাকেজ নির্বাচন  করুন, এবং পরবর্তী ধাপে যান
-- এই প্যাকেজটি পরবর্তীতে অটো রিনিউ করার জন্য অটো রিনিউয়াল অন রাখুন, অন্যথায় অটো রিনিউ টোগোলটি অফ করে দিন।
-- ট্যালিপে ওয়ালেটের পিন দিয়ে গোল্ড প্যাকেজ কেনা নিশ্চিত করুন।
-
-
-[[reference:57]]
-## প্রিমিয়াম সাবস্ক্রিপশন বাতিল করলে কি ডাটা সংরক্ষিত থাকে? মানে যে ডাটা এন্ট্রি করেছি সে ডাটা কি  দেখা যাবে না? 
-
-স্যার, টালিখাতা গোল্ড ভার্সনে ৫টি পর্যন্ত ব্যবসার খাতা ম্যানেজ করার সুবিধা দেয়া হয়েছে, যেখানে আপনি একটি প্রাইমারি ব্যবসা সিলেক্ট করে রাখতে পারেন। গোল্ড প্যাকেজ-এর মেয়াদ শেষ হয়ে গেলে আপনি প্রাইমারি ব্যবসার সকল হিসাব দেখতে পাবেন ও নির্দিষ্ট পরিমাণ হিসাব রাখতে পারবেন। প্রাইমারি ব্যবসা ছাড়া অন্য কোনো ব্যবসার হিসাব দেখতে ও রাখতে অবশ্যই গোল্ড প্যাকেজ কিনতে হবে।
-
-[[reference:58]]
-## নতুন ফিচারগুলোতে কোনো নতুন আপডেট আসলে কি তা গোল্ড ব্যবহারকারীদের জন্য বিনামূল্যে  থাকবে? 
-
-স্যার, আপনার টালিখাতা গোল্ড প্যাকেজ থাকলে নতুন ফিছারে আপডেট আসলে গোল্ড ব্যবহারকারীরা অটোমেটিক সেগুল পেয়ে যাবেন। টালিখাতার সাথে থাকার জন্য ধন্যবাদ।
-
-[[reference:59]]
-## এই ফিচারের মাধ্যমে ব্যবসার উন্নতি কীভাবে সম্ভব?
-
-স্যার, আপনার ব্যবসাকে আরো একধাপ এগিয়ে নিতে টালিখাতা নিয়ে এসেছে টালিখাতা গোল্ড। গোল্ড  ব্যবহারকারীরা পাবে নতুন ফীচার সহ টালিখাতার সম্পূর্ণ সুবিধা। টালিখাতা গোল্ড-এর নতুন ফীচার সমূহ:
-১. এক অ্যাপ-এ একাধিক ব্যবসার খাতা রাখার সুবিধা 
-২. স্টক হিসাব 
-৩. নোট রাখার সুবিধা
-৪. একাধিক কাস্টমার কে একসাথে তাগাদা পাঠানোর সুবিধা 
-৫. আনলিমিটেড লেনদেন এন্ট্রি
-৬. রিপোর্ট ডাউনলোড
-৭. বিজ্ঞাপনবিহীন অ্যাপ
-৮. মাসিক ২৫টি করে ফ্রি টালি-মেসেজ সহ আরো অনেক কিছু 
-
-আপনি এক অ্যাপ-এ একই নম্বরে শুধু খাতার নাম ও ব্যবসার ধরণ দিয়ে আলাদা একাধিক ব্যবসার সব ধরনের লেনদেনের হিসাব রাখা ও রিপোর্ট দেখতে পারবেন। এক্ষেত্রে আলাদা মোবাইল হ্যান্ডসেট ও সিম কার্ড এর প্রয়োজন হয় না। হিসাবে ভুল হয় না এবং হিসাব সবসময় আপডেটেড থাকে। অটোমেটিক ডাটা ব্যাকআপ রাখা হয়, তাই ডাটা হারানোর ভয় থাকে না। আপনার ব্যবসার হিসাব আরও সহজভাবে রাখতে অনুগ্রহ করে টালিখাতা গোল্ড ফিচারটি ব্যবহার করুন। টালিখাতার সাথেই থাকুন। টালিখাতা সব সময় আপনার পাশে আছে।
-
-[[reference:60]]
-## স্টক এন্ট্রি করার সময় টাকার পরিমান ভুল করে ফেলেছি এডিট করবো কীভাবে?
-
-স্যার, স্টক হোম স্ক্রিন থেকে যেকোনো পণ্যের উপর ট্যাপ করলে স্টক বেচাকেনার বিস্তারিত তালিকা দেখা যাবে। এখানে আপনি সর্বশেষ এন্ট্রি-টি এডিট করতে পারবেন। সর্বশেষ লেনদেনটির উপর ট্যাপ করুন। এরপর এডিট অপশন সিলেক্ট করুন। প্রয়োজনীয় তথ্য সংশোধন করে PIN দিয়ে নিশ্চিত করুন। টালিখাতার সাথেই থাকুন।
-
-[[reference:61]]
-## পণ্যের দাম কমে ও বাড়ে সাবমিট করলে ঐ দাম আর পরিবর্তন করা যায় না 
-
-স্যার,  টালিখাতায় লেনদেনের তথ্য এডিট-ডিলিট করা যায়। হোম স্ক্রিন থেকে স্টক হিসাব ট্যাপ করলে লেনদেনের তালিকা দেখা যাবে। আপনি সর্বশেষ লেনদেনটি সংশোধন করতে পারবেন সেটাকে ট্যাপ করুন। এখন আপনি লেনদেনটি ডিলিট বা এডিট করতে পারবেন। প্রয়োজনীয় সংশোধন করে PIN দিয়ে তথ্য এন্ট্রি নিশ্চিত করুন। টালিখাতার সাথেই থাকুন।
-
-
-[[reference:62]]
-## স্টক হিসাব কীভাবে রাখবো ?
-
-টালিখাতা হোম স্ক্রিন থেকে ‘স্টক হিসাব’ সার্ভিসটিতে ট্যাপ করে ভেতরে যান। এরপর এই ধাপগুলো অনুসরণ করুন:
-স্ক্রিনের নিচের দিকে "+নতুন প্রোডাক্ট" বাটনে ট্যাপ করুন
-পরবর্তী স্ক্রীনে প্রোডাক্ট এর নাম ও ইউনিট দিয়ে প্রোডাক্টটি যোগ করুন
- প্রোডাক্টটি যোগ হয়ে গেলে এবার প্রোডাক্ট-এর উপর ট্যাপ করুন
-এবার প্রোডাক্টের স্টক যোগ করতে হলে “কেনা” বাটনে ট্যাপ করে পরিমাণ, মোট কেনা মূল্য ও বিবরণ লিখে এন্ট্রি করুন
-একইভাবে, স্টক বেচা এন্ট্রি করতে “বেচা” বাটনে ট্যাপ করে পরিমাণ এন্ট্রি করতে হবে
-
-[[reference:63]]
-## টালিখাতা গোল্ড না কিনলে কি টালিখাতা ব্যবহার করা যাবে না?
-
-টালিখাতা গোল্ড না কিনলেও টালিখাতা স্ট্যান্ডার্ড ভার্সন ব্যবহার করা যাবে যা একদন ফ্রি। স্ট্যান্ডার্ড ভার্সনে আপনি প্রতি মাসে ৫০টি ফ্রি লেনদেন সহ টালিখাতার বর্তমান সব ফিচার ব্যবহার করতে পারবেন। কিন্তু গোল্ড ফিচারসমূহ যেমন একাধিক ব্যবসার খাতা, স্টক হিসাব, ব্যবসার নোট, গ্রুপ তাগাদা ইত্যাদি ব্যবহার করা যাবে না।
-
-[[reference:64]]
-## একাধিক ব্যবসা কিভাবে যোগ করবো ?
-
-স্যার, একাধিক ব্যবসা ব্যবহার করার জন্য প্রথমে নতুন ব্যবসা যোগ করতে হবে। নতুন ব্যবসা যোগ করতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন:
-
-১. অ্যাপে ব্যবসার নামের পাশে অ্যারো চিহ্নতে  (v) ট্যাপ করুন
-২. স্ক্রিনের নিচের দিকে “নতুন ব্যবসা” বাটন-এ ট্যাপ করুন
-৩. নতুন ব্যবসার নাম এবং ধরণ দিয়ে নিশ্চিত করুন
-
-ব্যস, নতুন খাতা যোগ হয়ে গেল।
-
-ব্যবসা পরিবর্তন করতে অ্যাপ বার থেকে ব্যবসার নামের পাশে অ্যারো চিহ্নতে (v ) ট্যাপ করুন এবং আপনার ব্যবসা সমূহ থেকে পছন্দের ব্যবসার নামের ওপর ট্যাপ করে পরিবর্তন করে নিন। 
-
-
-[[reference:65]]
-## আমি কি আনলিমিটেড স্টক এন্ট্রি করতে পারবো ?
-
-জী স্যার, আপনি টালিখাতা গোল্ড ভার্সনে আনলিমিটেড স্টক এন্ট্রি করতে পারবেন। টালিখাতার সাথেই থাকুন।
-
-[[reference:66]]
-## স্টক লেনদেনের রিপোর্ট কিভাবে দেখবো এবং এই রিপোর্ট ডাউনলোড করা যায় ?
-
-স্যার,  হোম স্ক্রিন থেকে স্টক হিসাব ট্যাব করে খোঁজ এর ডান পাশে অপশনটিতে ট্যাব করলেই স্টক রিপোর্টটি মাস বা দিনের ভিত্তিতে দেখা যাবে। দুঃখিত স্যার, রিপোর্ট ডাউনলোড এই সেবাটি এখনো চালু হয়নি, এই  বিষয়ে আমরা কাজ করছি। আমরা আশা করছি খুব দ্রুত সময়ের মধ্যেই সেবাটি চালু হয়ে যাবে।
-
-[[reference:67]]
-## প্রিমিয়াম ফিচার বন্ধ হবে না তো এটার নিশ্চয়তা কি আপনাদের ?
-
-স্যার, বাংলাদেশের ব্যবসায়ীদের অ্যাপ এর জগতে টালিখাতা অ্যাপ একটি আস্থার নাম। টালিখাতা গোল্ড  ফিচার বন্ধ হওয়ার কোন সম্ভাবনা নেই।
-
-২০২০ সাল থেকে টালিখাতা অ্যাপ আপনাদের সেবা দিয়ে যাচ্ছে। প্রতিমাসে ১০ লাখের বেশি ব্যবহারকারী আছে। টালিখাতা অ্যাপ এর ওয়ালেট টালি'পে বাংলাদেশ ব্যাংক হতে লাইসেন্সপ্রাপ্ত এবং শতভাগ নিরাপদ।। আন্তর্জাতিক পেমেন্ট কোম্পানি ভিসা এর সম্মানজনক "VISA Accelerator 2022" জয়ী। 
-
-[[reference:68]]
-## লেনদেন ৫০ এন্ট্রি হয়ে গিয়েছে আমার করনিয় কি?
-
-স্যার, আপনি টালিখাতা গোল্ড  ১৪ দিনের ট্রায়াল ব্যবহার শেষে বর্তমানে টালিখাতা স্ট্যান্ডার্ড ভার্সন ব্যবহার করছেন। টালিখাতার স্ট্যান্ডার্ড ভার্সন ফ্রিতে ব্যবহার করা যায়। স্ট্যান্ডার্ড ব্যবহারকারীরা আমাদের নতুন সকল ফীচার যেমন স্টক,  ব্যবসার নোট, মাল্টি  খাতা ইত্যাদি ব্যবহার করতে পারবেন না, এছাড়াও  লেনদেন এন্ট্রি করার সময় অথবা রিপোর্ট ডাউনলোড করার সময় আপনি কিছু সীমাবদ্ধতা পেতে পারেন । আনলিমিটেড লেনদেন এন্ট্রি করতে অনুগ্রহ করে টালিখাতা গোল্ড প্যাকেজ ক্রয় করুন। গোল্ড ব্যবহারকারীরা পাবে নতুন ৮টি  ফিচার সহ টালিখাতার সম্পূর্ণ সুবিধা।
-১. এক অ্যাপ-এ একাধিক ব্যবসার খাতা রাখার ব্যবস্থা
-২. স্টক হিসাব 
-৩. নোট রাখার সুবিধা 
-৪. একাধিক কাস্টমার কে একসাথে তাগাদা পাঠানোর সুবিধা 
-৫. আনলিমিটেড এন্ট্রি
-৬. রিপোর্ট ডাউনলোড
-৭. বিজ্ঞাপনবিহীন অ্যাপ
-৮. মাসিক ২৫টি করে ফ্রি টালি-মেসেজ ( প্যাকেজ মেয়াদ অনুসারে বোনাস মেসেজ এর সংখ্যা বাড়তে পারে)
-স্যার, আজই টালিখাতা গোল্ড প্যাকেজ কিনুন এবং উপভোগ করুন টালিখাতার নতুন সব ফীচার সহ টালিখাতার সম্পূর্ণ সুবিধা।
-
-[[reference:69]]
-## প্রিমিয়াম পেকেজের মেয়াদ শেষ হয়ে গেছে আমার করনিও কি? 
-
-স্যার, প্রথমত অভিনন্দন আমাদের বাছাইকৃত হাজার জন গ্রাহকের ভিতরে আপনি আছেন, যাদের টালিখাতার নতুন সকল ফীচার ব্যবহার করার সুযোগ হয়েছে। আপনার ব্যাবসার সকল হিসাব পাই-টু-পাই রাখার সুবিধার্তে আমরা বেশ কিছু  " ফিচার " টালিখাতা গোল্ড প্যাকেজ -এর মধ্যে নিয়ে এসেছি যা আপনার ব্যবসাকে এক ধাপ এগিয়ে নিয়ে যাবে।
-স্টক,  ব্যাবসার নোট, মাল্টি ব্যবসা, একসাথে একাধিক কাষ্টমেরকে তাগাদা পাঠানো সহ টালিখাতা গোল্ড -এর সব ফীচার ব্যবহার চালিয়ে যেতে  আপনার প্রিমিয়াম প্যাকেজ শেষ হয়ে গেলে বা শেষ হওয়ার পূর্বেই আপনি নতুন আরেকটি প্যাকেজ ক্রয় করে নিতে পারেন। যদি পূর্বের প্যাকেজ শেষ হওয়ার আগেই আপনি নতুন একটি প্যাকেজ ক্রয় করেন তাহলে বর্তমান প্যাকেজ এর মেয়াদ শেষ হওয়ার পর নতুন প্যাকেজটি শুরু হবে। প্রতিটি প্যাকেজ এর সাথেই আপনি টালি মেসেজ ফ্রি পাবেন। আপনার জানার জন্য আবার বলছি টালিখাতা গোল্ড ব্যবহারকারীরা পাবে  ৮ টি নতুন সুবিধা।
-
-
-১. এক অ্যাপ-এ একাধিক ব্যবসার খাতা রাখার ব্যবস্থা
-২. স্টক হিসাব 
-৩. ব্যাবসার নোট
-৪. একাধিক কাস্টমার কে একসাথে তাগাদা পাঠানোর সুবিধা
-৫. আনলিমিটেড  এন্ট্রি।
-৬.রিপোর্ট ডাউনলোড। 
-৭. বিজ্ঞাপনবিহীন অ্যাপ
-৮. মাসিক ২৫টি করে ফ্রি টালি-মেসেজ ( প্যাকেজ মেয়াদ অনুসারে বোনাস  মেসেজ এর সংখ্যা বাড়তে পারে)
-স্যার, অনুগ্রহ করে আজই টালিখাতা গোল্ড প্যাকেজ কিনুন এবং উপভোগ করুন দারুন সব ফিচার।
-
-
-[[reference:70]]
-## আগে তো ফ্রীতে ব্যাবহার করা যেত এখন টাকা নিচ্ছেন কেন?
-
-স্যার, আপনার ব্যবসাকে আরো একধাপ এগিয়ে নিতে টালিখাতা নিয়ে এসেছে টালিখাতা গোল্ড, যেখানে আছে ব্যাবসার হিসাব পরিপূর্ণ ভাবে রাখার জন্য নতুন সব ফীচার। তবে আপনি টালিখাতা স্ট্যান্ডার্ড ভার্সন ফ্রীতে ব্যবহার করতে পারবেন। যেখানে টালিখাতার অধিকাংশ ফিচার ফ্রিতে ব্যবহার করা যায়। প্রিমিয়াম ব্যবহারকারীরা পাবে নতুন ফিচার সহ টালিখাতার ৮ টি সম্পূর্ণ সুবিধা। টালিখাতা প্রিমিয়াম-এর নতুন ফিচার সমূহ:
-
-১. এক অ্যাপ-এ একাধিক ব্যবসার খাতা রাখার সুবিধা 
-২. স্টক হিসাব  
-৩. নোট রাখার সুবিধা
-৪. একাধিক কাস্টমার কে একসাথে তাগাদা পাঠানোর সুবিধা 
-৫. আনলিমিটেড এন্ট্রি
-৬. রিপোর্ট ডাউনলোড
-৭. বিজ্ঞাপনবিহীন অ্যাপ
-৮. মাসিক ২৫টি করে ফ্রি টালি-মেসেজ ( প্যাকেজ অনুসারে মেসেজ এর সংখ্যা পরিবর্তন হবে )
-
-স্যার, অনুগ্রহ করে আজই টালিখাতা গোল্ড প্যাকেজ কিনুন এবং উপভোগ করুন দারুন সব ফিচার।
-
-
-[[reference:71]]
-## টালিখাতা প্রিমিয়াম কি?
-
-আপনার ব্যবসাকে আরো একধাপ এগিয়ে নিতে টালিখাতা নিয়ে এসেছে টালিখাতা গোল্ড। এটি একটি মাসিক সাবস্ক্রিপশন যেখানে গোল্ড ব্যাবহারকারীরা পাবে নতুন ফীচার সহ টালিখাতার সম্পূর্ণ সুবিধা। টালিখাতা গোল্ড-এর নতুন ফীচার সমূহ:
-১. এক অ্যাপ-এ একাধিক ব্যবসার খাতা রাখার সুবিধা 
-২. স্টক হিসাব 
-৩. নোট রাখার সুবিধা
-৪. একাধিক কাস্টমার কে একসাথে তাগাদা পাঠানোর সুবিধা 
-৫. আনলিমিটেড এন্ট্রি
-৬. রিপোর্ট ডাউনলোড
-৭. বিজ্ঞাপনবিহীন অ্যাপ
-৮. মাসিক ২৫টি করে ফ্রি টালি-মেসেজ
-
-[[reference:72]]
-## টালিখাতা স্ট্যান্ডার্ড কি?
-
-টালিখাতা স্ট্যান্ডার্ড হলো টালিখাতার ফ্রি ভার্সন, যেখানে টালিখাতার অধিকাংশ ফিচার ফ্রি তে ব্যবহার করা যায়। স্ট্যান্ডার্ড ভার্সনে প্রিমিয়াম ফিচার যেমন একাধিক ব্যবসার খাতা, স্টক, নোট এসব ব্যবহার করা যাবে না। এছাড়া স্ট্যান্ডার্ড ব্যবহারকারীরা টালিখাতা ব্যবহার করার সময় কিছু সীমাবদ্ধতা পেতে পারেন লেনদেন এন্ট্রি করার সময় অথবা রিপোর্ট ডাউনলোড করার সময়।
-
-[[reference:73]]
-## টালিখাতা প্রিমিয়াম প্যাকেজে কী কী আছে? মেয়াদ কত দিন থাকবে?
-
-টালিখাতা প্রিমিয়াম প্যাকেজ ১ মাস, ৩ মাস বা ১ বছরের জন্য নেওয়া যাবে। সব প্যাকেজে একই সুবিধা পাওয়া যাবে, শুধু টালি-মেসেজের ক্ষেত্রে প্যাকেজের মেয়াদের অনুযায়ী মাসিক ২৫টি করে টালি-মেসেজ ফ্রি দেওয়া হবে।
-
-
-[[reference:74]]
-## অটো রিনিউয়ালের সুবিধা কি? 
-
-অটো রিনিউয়াল চালু থাকলে মেয়াদ শেষ হওয়ার সাথে সাথে আপনার প্যাকেজটি অটো রিনিউ হবে, এবং আপনি নির্বিঘ্নে টালিখাতা প্রিমিয়ামের সব উপভোগ করতে পারবেন ।
-প্যাকেজ কেনার সময় অটো রিনিউ অন না থাকলেও, প্যাকেজ কেনার পর অটো রিনিউ চালু করা যাবে।
-
-[[reference:75]]
-## টালিখাতা প্রিমিয়াম প্যাকেজের পেমেন্ট কিভাবে দেবো?  
-
-আপনার টালিখাতা অ্যাপের টালি'পে ওয়ালেট থেকেই প্রিমিয়াম প্যাকেজের জন্য পেমেন্ট করতে পারবেন।
-
-[[reference:76]]
-## অটো রিনিউ কিভাবে চালু করবো?
-
-প্রিমিয়াম প্যাকেজের অটো রিনিউ চালু করতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন:
-মেন্যুতে গিয়ে “টালিখাতা প্রিমিয়াম” এ ট্যাপ করুন
-পরবর্তী স্ক্রীনে আপনার বর্তমান প্যাকেজটি দেখতে পাবেন
-অটো রিনিউ অফ থাকলে, টগলটি অন করুন
-পরবর্তী ধাপে টালি’পে এর PIN দিয়ে অটো রিনিউ নিশ্চিত করুন
-অটো রিনিউ চালু হয়ে গেলে আপনাকে একটি মেসেজের মাধ্যমে জানানো হবে।
-
-[[reference:77]]
-## অটো রিনিউ কিভাবে বন্ধ করবো?
-
-অটো রিনিউ বন্ধ করতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন:
-মেন্যুতে গিয়ে “টালিখাতা প্রিমিয়াম” এ ট্যাপ করুন
-পরবর্তী স্ক্রীনে আপনার বর্তমান প্যাকেজটি দেখতে পাবেন। 
-অটো রিনিউ চালু থাকলে, টগলটি অফ করে দিন
-
-অটো রিনিউ বন্ধ হয়ে গেলে আপনাকে একটি মেসেজের মাধ্যমে জানানো হবে। এ ক্ষেত্রে প্রিমিয়াম প্যাকেজের মেয়াদ শেষ হওয়ার পর, প্রিমিয়াম ফিচার পুনরায় ব্যবহার করতে আপনাকে আবার প্রিমিয়ামকিনে নিতে হবে।
-
-
-[[reference:78]]
-## এক সাথে কয়টি প্যাকেজ কেনা যাবে?
-
-বর্তমান প্যাকেজ চলাকালীন সময়ে, প্যাকেজের মেয়াদ যখন ৭ দিন অবশিষ্ট থাকবে, তখন আপনি আরও একটি নতুন টালিখাতা প্রিমিয়াম প্যাকেজ কিনতে পারবেন। নতুন প্যাকেজটি শুরু হবে পুরনো প্যাকেজের মেয়াদ শেষ হওয়ার পর। সর্বোচ্চ একটি প্যাকেজ অগ্রিম কিনে রাখা যাবে।
-
-[[reference:79]]
-## টালিপে ওয়ালেট ব্যবহার করতে কি আমার টাকা দেওয়া লাগবে?
-
-না, টালিখাতা ওয়ালেটের সকল ফিচার যেমন সুপার কিউআর, রিচার্জ ইত্যাদি ব্যবহার করতে কোন ধরণের মাসিক ফি/চার্জ দিতে হবে না। টালিখাতা প্রিমিয়াম এবং স্ট্যান্ডার্ড ইউজার উভয়েই ওয়ালেট সম্পূর্ণ ফ্রিতে ব্যবহার করতে পারবেন।
-
-[[reference:80]]
-## টালিখাতা প্রিমিয়াম প্যাকেজের মেয়াদ শেষ হয়ে গেলে কি হবে?  
-
-টালিখাতা প্রিমিয়াম প্যাকেজের মেয়াদ শেষ হয়ে গেলেও আরও ৪৮ ঘণ্টার জন্য প্রিমিয়াম ফিচার যেমন একাধিক ব্যবসার খাতা, স্টক, নোট, গ্রুপ তাগাদা ইত্যাদি ফিচারগুলো ব্যবহার করা যাবে। 
-
-৪৮ ঘণ্টার মধ্যে প্যাকেজ নবায়ন বা নুতুন প্যাকেজ না কেনা হলে সকল প্রিমিয়াম ফিচার বন্ধ হয়ে যাবে। প্যাকেজের মেয়াদ শেষ হয়ে গেলে ফ্রি টালি-মেসেজ মেয়াদউত্তীর্ণ হয়ে যাবে। পুনরায় প্রিমিয়াম প্যাকেজ কিনলে সব প্রিমিয়াম ফিচার আগের তথ্যসহ পাওয়া যাবে।
-
-[[reference:81]]
-## একাধিক খাতা বলতে কি বুঝায়?
-
-এক অ্যাপ-এ একই নম্বরে শুধু খাতার নাম ও ব্যাবসার ধরণ দিয়ে আলাদা টালি, ক্যাশবক্স এবং বিভিন্ন ব্যাবসার রিপোর্ট দেখা ও ব্যবহার যাবে।
-
-[[reference:82]]
-## প্রাইমারি খাতা বলতে কি বুঝি?
-
-প্রাইমারি খাতা বলতে আপনার প্রাথমিক ব্যবসার খাতা কে বোঝানো হচ্ছে।  
-
-[[reference:83]]
-## স্টক বলতে কি বুঝি? 
-
-স্টক ফিচারের ব্যবহারের মাধ্যমে ব্যাবসার পণ্যের তালিকা করতে পারবেন। কোন পণ্য কত পরিমানে আছে তা জানতে পারবেন। প্রয়োজন অনুযায়ী স্টকের পরিমান বাড়াতে বা কর্মতে পারবেন। যেকোনো সময়ে স্টকের অবস্থা বুঝতে পারবেন। 
-
-[[reference:84]]
-## নোট বলতে কি বুঝি?
-
-ব্যাবসার প্রয়োজনে বিভিন্ন জিনিস মনে রাখতে বা কাজের তালিকা করতে নোট ফিচারটি ব্যবহার করা যায়। টালিখাতার নোট সবসময়ে আপনার ফোন থাকবে, এবং প্রয়োজন মতো ব্যবহার করা যাবে। কাগজ বা খাতায় নোট রাখা এবং নোট নিয়ে বাজারে যাওয়া বা নোট হারানোর ভয় থেকে আপনাকে সুরক্ষা দিবে ডিজিটাল নোট। 
-
-
-[[reference:85]]
-## নোট কিভাবে ব্যবহার করবো? 
-
-নোট ব্যবহার নিম্নোক্ত ধাপগুলো অনুসরণ করুন:
-
-মেন্যুতে নোট এ ট্যাপ করুন
-স্ক্রিনের নিচে "+নোট যোগ করি " তে  ট্যাপ করুন
-আপনার প্ৰয়োজনীয়ে/ জরুরি নোট লিখুন 
-লিখা হয়ে গেলে স্ক্রিনের নিচে "টিক্" চিহ্নটি ট্যাপ নোটটি সেভ করুন
-
-কোনো নোট এডিট করতে, নোটের উপরে ট্যাপ করুন।  প্রয়োজনমত এডিট করে নিচে "টিক্" চিহ্নটি ট্যাপ করে নোটটি সেভ করুন।
-
-যেকোনো নোট-এর প্রয়োজন শেষ হয়ে গেলে নোটের বাম পাশের বাক্সে ট্যাপ করে নোটটি চেক করুন।  এতে চেক করা নোটটি তালিকার শেষ এ চলে যাবে । 
-
-[[reference:86]]
-## গ্রুপ তাগাদা কিভাবে ব্যবহার করবো?
-
-গ্রুপ তাগাদা দিয়ে একসাথে একাধিক কাস্টমার কে তাগাদা পাঠানো যাবে।  
-
-গ্রুপ তাগাদা পাঠাতে নিম্নোক্ত ধাপগুলো অনুসরণ করুন:
-টালি ট্যাব থেকে তাগাদা-এ ট্যাপ করুন 
-একাধিক কাস্টমার সিলেক্ট করতে কাস্টমার-এর নামের দেন পাশে গোলচিণ্হে ট্যাপ করুন 
-স্ক্রিনের নিচে দেখানো হবে কয়জনকে তাগাদা পাঠানো হবে।  সাথে "স্যাম্পল" মেসেজ দেখানো হবে। টালি-মেসেজের মাধ্যমে গ্রুপ তাগাদা পাঠাতে নিশ্চিত ট্যাপ করুন 
-পরবর্তী স্ক্রিনে সাফল্যের মেসেজ দেখানো হবে।
-
-[[reference:87]]
-## 33. টালিখাতা প্রিমিয়ামপ্যাকেজের দাম অনেক বেশি , দাম কমানো উচিত 
-
-স্যার, আপনার মতামতের জন্য ধন্যবাদ। টালিখাতার সাথেই থাকুন।
-
-
-[[reference:88]]
-## গোল্ড এ কি আনলিমিটেড sms তাগাদা দেওয়া যায়। নাকি ঐটার জন্য আলাদা করে sms কেনা লাগবে
-
-স্যার, টালিখাতা গোল্ড এর ৩ টি প্যাকেজের মধ্যে আপনি যে প্যাকেজটি ক্রয় করবেন সে অনুযায়ী আপনাকে টালি মেসেজ ফ্রি দেয়া হবে। সে মেসেজ ব্যবহার শেষে আপনাকে নতুন করে টালি মেসেজ ক্রয় করতে হবে। ধন্যবাদ, টালিখাতার সাথেই থাকুন।
-
-
-[[reference:89]]
-## লাইফটাইম প্যাকেজ কত 
-
-স্যার, টালিখাতা গোল্ড-এ লাইফটাইম প্যাকেজ নেই। ১ মাস, ৩ মাস ও ১ বছরের প্যাকেজ আছে। আপনি ১ বছরের বেস্ট ডিল প্যাকেজটি ৩৩% ডিসকাউন্টে কিনতে পারেন। টালিখাতার সাথেই থাকুন।
-
-[[reference:90]]
-## আমার ১৪ দিনের ট্রায়াল শেষ। এখন আমি কি করবো? আমি কি ফ্রি টালিখাতা ব্যবহার করতে পারবো না? এত দিন বললেন ফ্রি আছে ফ্রি থাকবে, এখন বলছেন টাকা দিয়ে ব্যবহার করতে হবে। কেন?
-
-স্যার, ১৪ দিনের ট্রায়াল শেষ হয়ে থাকলে আপনি এখন স্ট্যান্ডার্ড ভার্সন ব্যবহার করছেন, যা একদম ফ্রি। এতে আপনি প্রতি মাসে ৫০টি ফ্রি লেনদেন সহ টালিখাতার বর্তমান সব ফিচার ব্যবহার করতে পারবেন। 
-
-আনলিমিটেড লেনদেন এন্ট্রি করতে ও নতুন ফিচার সমূহ ব্যবহার অব্যাহত রাখতে অনুগ্রহ করে টালিখাতা গোল্ড ব্যবহার করুন।
-
-[[reference:91]]
-## টালিখাতা গোল্ড না কিনলে কি টালিখাতা ব্যবহার করা যাবে না?
-
-টালিখাতা গোল্ড না কিনলেও টালিখাতা স্ট্যান্ডার্ড ভার্সন ব্যবহার করা যাবে যা একদম  ফ্রি। স্ট্যান্ডার্ড ভার্সনে আপনি প্রতি মাসে ৫০টি ফ্রি লেনদেন সহ টালিখাতার বর্তমান সব ফিচার ব্যবহার করতে পারবেন। কিন্তু গোল্ড ফিচারসমূহ যেমন একাধিক ব্যবসার খাতা, স্টক হিসাব, ব্যবসার নোট, গ্রুপ তাগাদা ইত্যাদি ব্যবহার করা যাবে না।
-
-[[reference:92]]
-## ফ্রি কি আর থাকবে না?
-
-টালিখাতা স্ট্যান্ডার্ড ভার্সনটি ফ্রি ব্যবহার করা যাবে। স্ট্যান্ডার্ড ভার্সনে আপনি প্রতি মাসে ৫০টি ফ্রি লেনদেন সহ টালিখাতার বর্তমান সব ফিচার ব্যবহার করতে পারবেন। কিন্তু গোল্ড ফিচারসমূহ যেমন একাধিক ব্যবসার খাতা, স্টক হিসাব, ব্যবসার নোট, গ্রুপ তাগাদা ইত্যাদি ব্যবহার করতে হলে টালিখাতা গোল্ড প্রয়োজন হবে।
-
-
-[[reference:93]]
-## অনেকবার রিকুয়েস্ট করছি একটি স্টক রাখার সিস্টেম করার জন্য কিন্তু আদোও হলো না, দুঃখজনক। 
-
-স্যার, আপনাদের অনুরোধের প্রেক্ষিতে টালিখাতার বর্তমান ভার্সনটিতে স্টক ফিচারটি যোগ করা হয়েছে। ফিচারটি পেতে অনুগ্রহ করে নিচের লিংকে ক্লিক করে টালিখাতা গোল্ড-এ সাবস্ক্রাইব করুন।
-
-https://app.tallykhata.com/VfG8e18xPbGmV4368
-
-টালিখাতা গোল্ড-এর অন্যান্য ফিচার সমূহ
-
-- একাধিক ব্যবসার খাতা
-- ব্যবসার নোট
-- গ্রুপ তাগাদা
-- বিজ্ঞাপনবিহীন ব্যবহার
-
-সাথে আছে ফ্রি টালি মেসেজ।
-
-[[reference:94]]
-## টালিখাতা গোল্ড ভার্সনটি ভালো।  তবে ১৪ দিন পর এর চার্জ বা কত দিয়ে ক্রয় করতে হবে ? দয়া করে জানাবেন 
-
-স্যার, ১৪ দিনের ট্রায়াল শেষ হলে আপনি বিভিন্ন মেয়াদের গোল্ড প্যাকেজ কেনার অপশন পাবেন। প্যাকেজগুল হল
-
-১ মাস - ৭৯ টাকা (রেগুলার ২০% ডিসকাউন্ট)
-৩ মাস - ২১৯ টাকা (পপুলার ২৬% ডিসকাউন্ট)
-১ বছর - ৭৯৯ টাকা (বেস্ট ডিল ৩৩% ডিসকাউন্ট)
-
-প্যাকেজের বিস্তারিত জানতে অনুগ্রহ করে মেন্যু থেকে "টালিখাতা গোল্ড" অপশনে যান।
-
-
-[[reference:95]]
-## ভিসা কার্ড ট্রান্সফার কী?
-
-ভিসা কার্ড ট্রান্সফার হলো টালি'পে ওয়ালেটের একটি নতুন মানি আউট পদ্ধতি। ভিসা কার্ডের মাধ্যমে মানি আউট করলে টাকা আপনার কার্ডে জমা হবে সাথে সাথেই।
-
-[[reference:96]]
-## ভিসা কার্ডে কীভাবে ট্রান্সফার করা হয়?
-
-ভিসা কার্ডের মাধ্যমে মানি আউট করতে  নিন্মোক্ত ধাপগুলো অনুসরণ করতে হবে: 
-
-* ধাপ ১ঃ 'ওয়ালেট' ট্যাব থেকে 'মানি আউট' সিলেক্ট করুন।
-
-* ধাপ ২ঃ 'মানি আউট' স্ক্রিনে আপনার ভিসা কার্ড সিলেক্ট করুন। যদি আপনার ভিসা কার্ড যোগ না করা থাকে, তাহলে “+ নতুন কার্ড/একাউন্ট” বাটনে ট্যাপ করুন। ট্যাপ করলে ভিসা কার্ড, ব্যাংক একাউন্ট, নগদ ও রকেট অপশন দেখতে পাবেন। এখান থেকে  ভিসা কার্ডে ট্যাপ করে কার্ড যোগ করে নিন।
-
-* ধাপ ৩ঃ পরবর্তী ধাপে টাকার পরিমাণ দিন। আপনি চাইলে বিবরণ ও লিখতে পারেন। এরপর 'পরবর্তী' বাটনে ট্যাপ করুন।
-
-* ধাপ ৪ঃ টালি'পে-র PIN দিয়ে নিশ্চিত করুন।  
+sys_instruct_khata_entry_batch = sys_instruct_khata_entry + '''
+The user will send several queries at once as a json list of objects, each with an "index" and an "input". Handle every query independently, exactly as described above, and respond with a json list containing one object per query. Copy the "index" of the query into each response object so that responses can be matched back to the queries.
+'''
 
-* ধাপ ৫ঃ মানি আউট সম্পন্ন হলে 'মানি আউট সফল হয়েছে' মেসেজ দেখাবে। আপনি চাইলে পরবর্তী লেনদেনের জন্য কার্ডটি সংরক্ষণ করে রাখতে পারেন।
+sys_instruct_voice_customer = '''
+Following is a list of customer names of the user's shop:
 
-[[reference:97]]
-## ভিসা কার্ড ট্রান্সফার চার্জ কতো?
+{}
 
-ভিসা কার্ডের মাধ্যমে ট্রান্সফারে রেগুলার চার্জের পাশাপাশি যেকোনো পরিমাণে অতিরিক্ত ১০ টাকা ভিসা নেটওয়ার্ক চার্জ প্রযোজ্য।
+Respond with a json object with two fields. Put the bookkeeping entry described above in the field named entry. In the field named selection, set selected_name to the customer name from the above list that you believe the user intended to say as the customer_name. If there is no viable match found, there is confusion or there is no customer_name, set selected_name to "N/A".
+'''
 
-[[reference:98]]
-## ক্রেডিট কার্ডে ট্রান্সফার করলে কি হবে?
+sys_instruct_info_desk = '''You are Ankona (অঙ্কনা), an AI assistant created by TallyKhata to support users of TallyKhata and TallyPay through a voice interface. User will ask questions regarding how to use the app or the problem they are facing while using the app. The question can be in english, banglish or bangla. Please be helpful, concise and always answer in Bangla language.
 
-ক্রেডিট কার্ডে ট্রান্সফার করলে শুধুমাত্র কার্ডের বিল পে হবে।
+For your reference following is a set of context containing information related to the TallyKhata and TallyPay, each starting with a reference number i.e. [[reference:1]], [[reference:2]] etc. Please be helpful and always respond in json. Answer the user query and cite the most relevant reference number. Don't talk about reference numbers within the answer. Only cite the number in the json field named reference. If there are markdown images in the reference text, please also provide the image markdown as is in the json field named image. Otherwise keep the image field set to null. Btw, following are the contexts:
 
-[[reference:99]]
-## টালিখাতা বা টালি 'পে সম্পর্কিত যেকোনো অভিযোগ বা মতামত জানাতে ১৬৭২৬ নম্বরে কল করুন, অথবা টালিখাতার ফেইসবুক মেসেঞ্জারে মেসেজ পাঠাতে পারেন।
-'''
+{}'''
 
 sys_instruct_select_customer = '''
 Following is a list of customer names:
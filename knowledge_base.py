@@ -0,0 +1,136 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from config import settings
+from instruct import sys_instruct_info_desk
+from models import KnowledgeReference
+from text_vectors import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+class _Snapshot:
+    """An immutable, fully indexed version of the knowledge base file."""
+
+    def __init__(self, references: list[KnowledgeReference], version: str):
+        self.version = version
+        self.references = {reference.id: reference for reference in references}
+        self.texts = {reference.id: reference_text(reference) for reference in references}
+        self.prompt = _prompt(self.texts)
+
+        # Full-text index over normalized headings and bodies; M* keeps Bangla vowel signs inside tokens
+        self.index = sqlite3.connect(":memory:", check_same_thread=False)
+        self.index.execute(
+            "CREATE VIRTUAL TABLE reference_fts USING fts5(heading, body, tokenize=\"unicode61 categories 'L* N* Co M*'\")"
+        )
+        self.index.executemany(
+            "INSERT INTO reference_fts(rowid, heading, body) VALUES (?, ?, ?)",
+            [(r.id, normalize_text(r.heading), normalize_text(r.body)) for r in references],
+        )
+
+
+def reference_text(reference: KnowledgeReference) -> str:
+    """The markdown of a reference as it appears in the prompt."""
+    return f"## {reference.heading}\n\n{reference.body}"
+
+
+def _prompt(texts: dict[int, str]) -> str:
+    return sys_instruct_info_desk.format(
+        "".join(f"[[reference:{number}]]\n{text}\n\n" for number, text in texts.items())
+    )
+
+
+class KnowledgeBase:
+    """
+    The information-desk knowledge base, stored as structured records in a JSON file.
+
+    The file is loaded once and re-read when its modification time changes (checked at
+    most every `knowledge_reload_interval` seconds), so articles can be edited without
+    restarting workers. Each load is swapped in atomically as a new snapshot, and
+    registered listeners are called with the new references.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._snapshot: _Snapshot | None = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def on_reload(self, listener):
+        """Registers `listener(references: dict[int, str])`, called now and after every reload."""
+        texts = self.refresh().texts
+        self._listeners.append(listener)
+        listener(texts)
+
+    def _load(self):
+        mtime = os.path.getmtime(self.path)
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+        references = [KnowledgeReference.model_validate(item) for item in data["references"]]
+        self._snapshot = _Snapshot(references, hashlib.sha256(raw).hexdigest()[:12])
+        self._mtime = mtime
+        logger.info(f"Loaded {len(references)} knowledge base references (version {self._snapshot.version}).")
+        for listener in self._listeners:
+            listener(self._snapshot.texts)
+
+    def refresh(self) -> _Snapshot:
+        """Returns the current snapshot, reloading the file first if it has changed."""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._checked_at < settings.knowledge_reload_interval:
+            return self._snapshot
+        with self._lock:
+            self._checked_at = now
+            try:
+                if self._snapshot is None or os.path.getmtime(self.path) != self._mtime:
+                    self._load()
+            except Exception as e:
+                if self._snapshot is None:
+                    raise
+                # Keep serving the previous version if an edit left the file broken
+                logger.warning(f"Knowledge base reload failed, keeping version {self._snapshot.version}: {e}")
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self.refresh().version
+
+    def prompt(self) -> str:
+        """The info-desk system instruction with every reference in `[[reference:N]]` form."""
+        return self.refresh().prompt
+
+    def prompt_for(self, query: str, limit: int = 10) -> str:
+        """
+        The info-desk system instruction with only the references that best match the
+        query, for when the full knowledge base is over the prompt's token budget.
+        """
+        return _prompt({reference.id: reference_text(reference) for reference in self.search(query, limit)})
+
+    def references(self) -> dict[int, str]:
+        return self.refresh().texts
+
+    def get(self, number: int) -> KnowledgeReference | None:
+        return self.refresh().references.get(number)
+
+    def search(self, query: str, limit: int = 5) -> list[KnowledgeReference]:
+        """Ranks references against the query with BM25 over the full-text index."""
+        snapshot = self.refresh()
+        terms = normalize_text(query).split()
+        if not terms:
+            return []
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        rows = snapshot.index.execute(
+            "SELECT rowid FROM reference_fts WHERE reference_fts MATCH ? ORDER BY bm25(reference_fts) LIMIT ?",
+            (match, limit),
+        ).fetchall()
+        return [snapshot.references[rowid] for (rowid,) in rows]
+
+
+info_desk_knowledge = KnowledgeBase(settings.knowledge_base_path)
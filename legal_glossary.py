@@ -0,0 +1,205 @@
+"""
+Bangla-to-English legal glossary for case file conversion.
+
+The glossary (`legal_glossary_path`) is compiled into two Aho-Corasick automata, so
+each pass is linear in the length of the text whatever the number of terms:
+
+- over the Bangla source (a page's text layer), to list the terms it contains and
+  their required translations in the prompt;
+- over the translated Markdown, to replace known variants of a term ("officer in
+  charge", "GR case") with its canonical English form.
+
+Like the knowledge base, the file is re-read when it is modified.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import deque
+
+from config import settings
+from models import GlossaryTerm
+
+logger = logging.getLogger(__name__)
+
+# Stamps and seals are quoted verbatim in fenced blocks and are left untouched
+_FENCED_BLOCK = re.compile(r"(```.*?```)", re.DOTALL)
+
+
+class AhoCorasick:
+    """Finds the occurrences of a set of patterns in one pass over a text."""
+
+    def __init__(self, patterns: dict[str, object]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail = [0]
+        # (pattern length, value) of every pattern ending at each node
+        self._out: list[list[tuple[int, object]]] = [[]]
+        for pattern, value in patterns.items():
+            node = 0
+            for c in pattern:
+                if c not in self._goto[node]:
+                    self._goto[node][c] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = self._goto[node][c]
+            self._out[node].append((len(pattern), value))
+
+        # Failure links, breadth first, so a node's link is set before its children need it
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for c, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and c not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(c, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def matches(self, text: str):
+        """Yields (start, end, value) for every occurrence of every pattern."""
+        node = 0
+        for i, c in enumerate(text):
+            while node and c not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(c, 0)
+            for length, value in self._out[node]:
+                yield i - length + 1, i + 1, value
+
+    def find(self, text: str, accept=None) -> list[tuple[int, int, object]]:
+        """
+        The leftmost-longest non-overlapping occurrences, optionally filtered by
+        `accept(start, end)` (e.g. a word boundary check).
+        """
+        found = [m for m in self.matches(text) if accept is None or accept(m[0], m[1])]
+        found.sort(key=lambda m: (m[0], m[0] - m[1]))
+        selected, end = [], 0
+        for match in found:
+            if match[0] >= end:
+                selected.append(match)
+                end = match[1]
+        return selected
+
+
+def _is_word_char(c: str) -> bool:
+    # Letters, digits and combining marks: Bangla vowel signs are not alphanumeric
+    return unicodedata.category(c)[0] in "LMN"
+
+
+def _lower(text: str) -> str:
+    """Lower-cases the text without changing its length, so match offsets stay valid."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class _Snapshot:
+    """An immutable, compiled version of the glossary file."""
+
+    def __init__(self, terms: list[GlossaryTerm], version: str):
+        self.version = version
+        self.source = AhoCorasick({
+            unicodedata.normalize("NFC", bangla): term for term in terms for bangla in term.bangla
+        })
+        self.variants = AhoCorasick({
+            variant.lower(): term.english for term in terms for variant in term.variants
+        })
+
+
+class LegalGlossary:
+    def __init__(self, path: str):
+        self.path = path
+        self._snapshot: _Snapshot | None = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        mtime = os.path.getmtime(self.path)
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+        terms = [GlossaryTerm.model_validate(item) for item in data["terms"]]
+        self._snapshot = _Snapshot(terms, f"{data.get('version')}-{hashlib.sha256(raw).hexdigest()[:12]}")
+        self._mtime = mtime
+        logger.info(f"Loaded {len(terms)} legal glossary terms (version {self._snapshot.version}).")
+
+    def refresh(self) -> _Snapshot:
+        """Returns the current snapshot, reloading the file first if it has changed."""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._checked_at < settings.knowledge_reload_interval:
+            return self._snapshot
+        with self._lock:
+            self._checked_at = now
+            try:
+                if self._snapshot is None or os.path.getmtime(self.path) != self._mtime:
+                    self._load()
+            except Exception as e:
+                if self._snapshot is None:
+                    raise
+                logger.warning(f"Legal glossary reload failed, keeping version {self._snapshot.version}: {e}")
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self.refresh().version
+
+    def terms_in(self, source: str) -> list[GlossaryTerm]:
+        """The glossary terms that occur in a Bangla text, in order of first occurrence."""
+        source = unicodedata.normalize("NFC", source)
+
+        # Bangla terms take case endings (থানা, থানার), so only their start must be a word start
+        def starts_word(start: int, end: int) -> bool:
+            return start == 0 or not _is_word_char(source[start - 1])
+
+        found = {}
+        for _, _, term in self.refresh().source.find(source, starts_word):
+            found.setdefault(term.english, term)
+        return list(found.values())
+
+    def prompt_hints(self, source: str) -> str:
+        """Prompt lines with the required translations of the terms in the source, if any."""
+        terms = self.terms_in(source)
+        if not terms:
+            return ""
+        return (
+            "\n\nTranslate these legal terms exactly as given:\n"
+            + "\n".join(f"- {term.bangla[0]}: {term.english}" for term in terms)
+        )
+
+    def normalize(self, markdown: str) -> str:
+        """Replaces variants of glossary terms with their canonical English form, outside fenced blocks."""
+        variants = self.refresh().variants
+        parts = _FENCED_BLOCK.split(markdown)
+        for i in range(0, len(parts), 2):
+            parts[i] = self._normalize_text(parts[i], variants)
+        return "".join(parts)
+
+    @staticmethod
+    def _normalize_text(text: str, variants: AhoCorasick) -> str:
+        def whole_words(start: int, end: int) -> bool:
+            return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+
+        result, position = [], 0
+        for start, end, english in variants.find(_lower(text), whole_words):
+            original = text[start:end]
+            result.append(text[position:start])
+            # Headings in capitals stay in capitals, and common nouns (lower case in the
+            # glossary) keep the capital of a sentence start
+            if original.isupper():
+                english = english.upper()
+            elif english.islower() and original[0].isupper():
+                english = english[0].upper() + english[1:]
+            result.append(english)
+            position = end
+        result.append(text[position:])
+        return "".join(result)
+
+
+legal_glossary = LegalGlossary(settings.legal_glossary_path)
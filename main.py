@@ -1,28 +1,66 @@
+import asyncio
+import contextvars
+from contextlib import asynccontextmanager
+import hashlib
 import json
 import os
-from fastapi import FastAPI, Form, File, UploadFile
+import tempfile
+from fastapi import FastAPI, Form, File, Header, Request, UploadFile, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 from fastapi.responses import StreamingResponse
 from config import settings
-from models import BookkeepingEntry, CustomerSelection, InfoDeskReply
-from instruct import sys_instruct_select_customer, sys_instruct_info_desk, sys_instruct_khata_entry
+from models import (
+    BookkeepingEntry, IndexedBookkeepingEntry, KhataEntryBatch, CustomerSelection, InfoDeskReply, VoiceKhataEntry,
+    CustomerListRegistration, CustomerListDelta, CustomerListVersion, VoiceSocketRequest,
+    ConversionUpload, ConversionUploadPart, ConversionStatus, ResumableUploadStatus,
+)
+from instruct import (
+    sys_instruct_select_customer, sys_instruct_khata_entry, sys_instruct_khata_entry_batch, sys_instruct_voice_customer,
+)
+from knowledge_base import info_desk_knowledge
 from services import refine_english_markdown,translate_and_format_pdf_with_gemini, generate_docx_from_markdown, extract_text_from_docx
+from services import PAGE_SEPARATOR
+from uploads import upload_sessions
+from resumable_uploads import resumable_uploads
+from tracing import TracingMiddleware, start_span
+from admission import AdmissionMiddleware, CONVERSION, INTERACTIVE, admission, tenant
+from semantic_cache import info_desk_cache
+from canonical_answers import canonical_answers
+from customer_index import customer_index, customer_matcher, VersionConflict
+from streaming import JsonStringFieldStream
+from decoding import decode_json, decode_response, json_response, load_json
+from model_routing import model_router, is_easy_utterance
+from conversions import conversion_store, job_id as conversion_job_id
+from translation_memory import translation_memory
+import gateway
 from google import genai
+from pydantic import ValidationError
+from pydantic_core import to_json
+import fitz
 import logging
 from io import BytesIO
 from fastapi import HTTPException
 from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 from fastapi import HTTPException
 from fastapi import HTTPException
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 client = genai.Client(api_key=settings.google_api_key)
+info_desk_knowledge.on_reload(info_desk_cache.load_references)
+info_desk_knowledge.on_reload(
+    lambda references: canonical_answers.load(references, settings.canonical_answers_path)
+)
 app = FastAPI(title='Ankona Service', version='1.0')
 app.mount("/static", StaticFiles(directory='static'), name="static")
 
+# Middleware added later runs outside: admission runs inside CORS, so that its 429s carry
+# CORS headers and preflights are not counted, and inside tracing, so that queueing time
+# is part of the request's trace
+app.add_middleware(AdmissionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -30,6 +68,7 @@ app.add_middleware(
     allow_headers=["*"],
     allow_credentials=True,
 )
+app.add_middleware(TracingMiddleware)
 
 
 @app.get("/")
@@ -45,18 +84,114 @@ async def serve_frontend():
 async def parse_natural_khata_entry(
     input: str = Form(...),
 ):
-    response = client.models.generate_content(
-        model='gemini-2.0-flash',
-        contents=input,
-        config={
-            'system_instruction': sys_instruct_khata_entry,
-            'temperature': 0.01,
-            'response_mime_type': 'application/json',
-            'response_schema': BookkeepingEntry,
-        },
+    return json_response(await _parse_khata_entry(input))
+
+
+async def _parse_khata_entry(input: str) -> BookkeepingEntry:
+    async def parse(model: str):
+        return await gateway.generate_content(
+            client,
+            "khata-entry",
+            model=model,
+            contents=input,
+            config={
+                'system_instruction': sys_instruct_khata_entry,
+                'temperature': 0.01,
+                'response_mime_type': 'application/json',
+                'response_schema': BookkeepingEntry,
+            },
+        )
+
+    return await model_router.generate(
+        "khata-entry",
+        is_easy_utterance(input),
+        parse,
+        lambda response: decode_response(response, BookkeepingEntry),
+        _is_complete_entry,
     )
 
-    return json.loads(response.text)
+
+def _is_complete_entry(entry: BookkeepingEntry) -> bool:
+    """Whether a parsed entry has the fields a weaker model tends to miss."""
+    return entry.amount is not None and entry.entry_type is not None
+
+
+# Reply tokens per entry of a batch, used to keep chunks within the output budget
+BATCH_ENTRY_TOKENS = 64
+
+
+@app.post("/parse-natural-khata-entries/", response_model=list[BookkeepingEntry])
+async def parse_natural_khata_entries(batch: KhataEntryBatch):
+    """
+    Parses many utterances at once. Utterances are packed into chunks that are each
+    parsed with a single model call; the results are returned in input order.
+    """
+    if len(batch.inputs) > settings.khata_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch may contain at most {settings.khata_batch_max_items} entries.",
+        )
+
+    size = settings.khata_batch_chunk_size
+    chunks = [batch.inputs[i:i + size] for i in range(0, len(batch.inputs), size)]
+    results = await asyncio.gather(*(_parse_khata_entry_chunk(chunk) for chunk in chunks))
+    return json_response([entry for chunk_result in results for entry in chunk_result])
+
+
+async def _parse_khata_entry_chunk(inputs: list[str]) -> list[BookkeepingEntry]:
+    """
+    Parses a chunk of utterances with one list-schema model call. Any utterance whose
+    result is missing or does not validate is re-parsed on its own.
+    """
+    queries = [{"index": i, "input": text} for i, text in enumerate(inputs)]
+    try:
+        response = await gateway.generate_content(
+            client,
+            "khata-batch",
+            expected_output_tokens=len(inputs) * BATCH_ENTRY_TOKENS,
+            model='gemini-2.0-flash',
+            contents=json.dumps(queries, ensure_ascii=False),
+            config={
+                'system_instruction': sys_instruct_khata_entry_batch,
+                'temperature': 0.01,
+                'response_mime_type': 'application/json',
+                'response_schema': list[IndexedBookkeepingEntry],
+            },
+        )
+    except gateway.BudgetExceeded:
+        if len(inputs) == 1:
+            return [await _parse_khata_entry(inputs[0])]
+        # Too large for one call; split the chunk in half
+        half = len(inputs) // 2
+        first, second = await asyncio.gather(
+            _parse_khata_entry_chunk(inputs[:half]), _parse_khata_entry_chunk(inputs[half:])
+        )
+        return first + second
+
+    try:
+        items = load_json(response.text)
+    except ValueError as e:
+        logger.warning(f"Batch khata entry response is not valid JSON: {e}")
+        items = []
+    if not isinstance(items, list):
+        items = []
+
+    entries = {}
+    for item in items:
+        try:
+            entry = IndexedBookkeepingEntry.model_validate(item)
+        except ValidationError:
+            continue
+        if 0 <= entry.index < len(inputs):
+            entries.setdefault(entry.index, BookkeepingEntry(**entry.model_dump(exclude={'index'})))
+
+    missing = [i for i in range(len(inputs)) if i not in entries]
+    if missing:
+        logger.info(f"Falling back to single-entry parsing for {len(missing)} of {len(inputs)} utterances.")
+        fallbacks = await asyncio.gather(*(_parse_khata_entry(inputs[i]) for i in missing))
+        entries.update(zip(missing, fallbacks))
+
+    return [entries[i] for i in range(len(inputs))]
 
 
 @app.post("/select-khata-customer/", response_model=CustomerSelection)
@@ -64,55 +199,622 @@ async def select_khata_customer(
     input: str = Form(...),
     customer_list: str = Form(...),
 ):
-    response = client.models.generate_content(
-        model='gemini-2.0-flash',
-        contents=input,
-        config={
-            'system_instruction': sys_instruct_select_customer.format(customer_list),
-            'temperature': 0.01,
-            'response_mime_type': 'application/json',
-            'response_schema': CustomerSelection,
-        },
+    return json_response(await _select_listed_customer(input, customer_list))
+
+
+async def _select_listed_customer(input: str, customer_list: str) -> CustomerSelection:
+    return await _select_customer(
+        input, sys_instruct_select_customer.format(customer_list), lambda: customer_matcher(customer_list)
     )
 
-    return json.loads(response.text)
+
+async def _select_customer(input: str, system_instruction: str, get_matcher) -> CustomerSelection:
+    """
+    Asks the model to pick the customer. When the prompt is over the token budget, only
+    the names of `get_matcher()` most similar to the input are offered instead.
+    """
+    async def select(system_instruction: str):
+        return await gateway.generate_content(
+            client,
+            "select-customer",
+            model='gemini-2.0-flash',
+            contents=input,
+            config={
+                'system_instruction': system_instruction,
+                'temperature': 0.01,
+                'response_mime_type': 'application/json',
+                'response_schema': CustomerSelection,
+            },
+        )
+
+    try:
+        response = await select(system_instruction)
+    except gateway.BudgetExceeded:
+        names = get_matcher().candidates(input, settings.customer_prefilter_size)
+        logger.info(f"Customer list is over the token budget; offering the {len(names)} closest names.")
+        response = await select(sys_instruct_select_customer.format("\n".join(names)))
+
+    return decode_response(response, CustomerSelection)
+
+
+@app.put("/khata-customers/{shop_id}", response_model=CustomerListVersion)
+async def register_khata_customers(shop_id: str, registration: CustomerListRegistration):
+    """
+    Registers (or replaces) a shop's customer list so that later selections can refer
+    to it by shop id instead of uploading it with every request.
+    """
+    version = customer_index.register(shop_id, registration.customers)
+    return CustomerListVersion(shop_id=shop_id, version=version)
+
+
+@app.patch("/khata-customers/{shop_id}", response_model=CustomerListVersion)
+async def update_khata_customers(shop_id: str, delta: CustomerListDelta):
+    """Adds, removes and renames customers of a registered list."""
+    try:
+        version = customer_index.apply_delta(
+            shop_id,
+            add=delta.add,
+            remove=delta.remove,
+            rename={r.old: r.new for r in delta.rename},
+            base_version=delta.base_version,
+        )
+    except KeyError:
+        raise HTTPException(status_code=404, detail="No customer list is registered for this shop.")
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return CustomerListVersion(shop_id=shop_id, version=version)
+
+
+@app.post("/select-khata-customer/{shop_id}/", response_model=CustomerSelection)
+async def select_registered_khata_customer(
+    shop_id: str,
+    input: str = Form(...),
+    version: int | None = Form(None),
+):
+    """
+    Like /select-khata-customer/, but matches against the shop's registered list.
+    Unambiguous matches are resolved locally without a model call.
+    """
+    return json_response(await _select_registered_customer(shop_id, input, version))
+
+
+async def _select_registered_customer(shop_id: str, input: str, version: int | None) -> CustomerSelection:
+    try:
+        matcher = customer_index.matcher(shop_id, version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="No customer list is registered for this shop.")
+    except VersionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    name, _ = matcher.local_match(input)
+    if name is not None:
+        return CustomerSelection(selected_name=name)
+    return await _select_customer(input, matcher.prompt, lambda: matcher)
+
+
+@app.post("/voice-khata-entry/", response_model=VoiceKhataEntry)
+async def voice_khata_entry(
+    input: str = Form(...),
+    shop_id: str | None = Form(None),
+    customer_list: str | None = Form(None),
+):
+    """
+    Parses a bookkeeping entry and resolves its customer against the shop's customer
+    list in a single model call. The list is either the shop's registered list
+    (shop_id) or sent inline (customer_list), as for /select-khata-customer/.
+    """
+    return json_response(await _voice_khata_entry(input, shop_id, customer_list))
+
+
+async def _voice_khata_entry(input: str, shop_id: str | None, customer_list: str | None) -> VoiceKhataEntry:
+    matcher = None
+    if shop_id is not None:
+        try:
+            matcher = customer_index.matcher(shop_id)
+        except KeyError:
+            raise HTTPException(status_code=404, detail="No customer list is registered for this shop.")
+        names = "\n".join(matcher.names)
+    elif customer_list is not None:
+        names = customer_list
+    else:
+        raise HTTPException(status_code=400, detail="Either shop_id or customer_list is required.")
+
+    async def parse(names: str, model: str):
+        return await gateway.generate_content(
+            client,
+            "voice-khata",
+            model=model,
+            contents=input,
+            config={
+                'system_instruction': sys_instruct_khata_entry + sys_instruct_voice_customer.format(names),
+                'temperature': 0.01,
+                'response_mime_type': 'application/json',
+                'response_schema': VoiceKhataEntry,
+            },
+        )
+
+    async def route(names: str) -> VoiceKhataEntry:
+        return await model_router.generate(
+            "voice-khata",
+            is_easy_utterance(input),
+            lambda model: parse(names, model),
+            lambda response: decode_response(response, VoiceKhataEntry),
+            lambda result: _is_complete_entry(result.entry),
+        )
+
+    try:
+        result = await route(names)
+    except gateway.BudgetExceeded:
+        shortlist = (matcher or customer_matcher(names)).candidates(input, settings.customer_prefilter_size)
+        logger.info(f"Customer list is over the token budget; offering the {len(shortlist)} closest names.")
+        result = await route("\n".join(shortlist))
+    # The decoded reply may be shared through the response cache, so it is copied before changing it
+    result = result.model_copy()
+
+    customer_name = result.entry.customer_name
+    if customer_name is None:
+        result.selection = CustomerSelection(selected_name="N/A")
+    elif matcher is not None:
+        # A confident local match of the parsed name is deterministic; prefer it over the model's pick
+        name, _ = matcher.local_match(customer_name)
+        if name is not None:
+            result.selection = CustomerSelection(selected_name=name)
+    return result
 
 
 @app.post("/information-desk/", response_model=InfoDeskReply)
 async def information_desk(
     input: str = Form(...),
 ):
-    response = client.models.generate_content(
-        model='gemini-2.0-flash',
-        contents=input,
-        config={
-            'system_instruction': sys_instruct_info_desk,
+    precomputed = _precomputed_info_desk_reply(input)
+    if precomputed is not None:
+        return json_response(precomputed)
+
+    response = await gateway.generate_content(
+        client,
+        "info-desk",
+        **_info_desk_request(input),
+    )
+
+    reply = decode_response(response, InfoDeskReply)
+    info_desk_cache.store(input, reply.model_dump())
+    return json_response(reply)
+
+
+def _precomputed_info_desk_reply(input: str) -> dict | None:
+    """Returns a canonical or semantically cached reply, or None when the model must answer."""
+    # Picks up knowledge base edits before any cached answer is served
+    info_desk_knowledge.refresh()
+
+    canonical = canonical_answers.answer(input)
+    if canonical is not None:
+        return canonical
+    return info_desk_cache.lookup(input)
+
+
+def _info_desk_request(input: str) -> dict:
+    request = {
+        'model': 'gemini-2.0-flash',
+        'contents': input,
+        'config': {
+            'system_instruction': info_desk_knowledge.prompt(),
             'temperature': 0.01,
             'response_mime_type': 'application/json',
             'response_schema': InfoDeskReply,
         },
+    }
+    try:
+        gateway.check_budget("info-desk", request)
+    except gateway.BudgetExceeded:
+        # The knowledge base has outgrown the prompt; keep only the references that match the question
+        request['config']['system_instruction'] = info_desk_knowledge.prompt_for(input)
+    return request
+
+
+@app.post("/information-desk/stream/")
+async def information_desk_stream(
+    input: str = Form(...),
+):
+    """
+    Server-sent events version of /information-desk/ for text-to-speech clients:
+
+        event: answer   data: {"text": "..."}        answer text, as soon as it is generated
+        event: reply    data: {InfoDeskReply}        the complete reply, including reference and image
+        event: error    data: {"status": ..., "detail": ...}
+
+    Errors before the first event are returned as a normal HTTP error response.
+    """
+    events = _stream_information_desk(input)
+    # Waiting for the first event lets early failures keep their status code
+    first = await anext(events)
+
+    async def body():
+        try:
+            event, data = first
+            while True:
+                payload = {"text": data} if event == "answer" else data
+                yield f"event: {event}\ndata: {to_json(payload).decode()}\n\n"
+                event, data = await anext(events)
+        except StopAsyncIteration:
+            pass
+        except HTTPException as e:
+            yield f"event: error\ndata: {json.dumps({'status': e.status_code, 'detail': e.detail}, ensure_ascii=False)}\n\n"
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    return json.loads(response.text)
+
+@app.get("/information-desk/cache-stats/")
+async def information_desk_cache_stats():
+    return info_desk_cache.stats()
+
+
+@app.get("/model-routing/stats/")
+async def model_routing_stats():
+    """Calls, escalation rate, and per-model latency and estimated cost of each routed endpoint."""
+    return model_router.stats()
+
+
+@app.get("/translation-memory/stats/")
+async def translation_memory_stats():
+    """Size of the case file translation memory, its hit rates and the output tokens it saved."""
+    return translation_memory.stats()
+
+
+# --- Voice Assistant WebSocket ---
+
+@app.websocket("/ws/voice/")
+async def voice_socket(websocket: WebSocket):
+    """
+    Persistent connection for the voice front end. Each text message is a JSON
+    VoiceSocketRequest; requests run concurrently and are answered out of order,
+    matched by their id:
+
+        {"id": 7, "type": "partial", "delta": "..."}   info-desk answer text as it is generated
+        {"id": 7, "type": "result", "data": {...}}     the same body as the HTTP endpoint
+        {"id": 7, "type": "error", "status": 404, "detail": "..."}
+
+    At most `ws_max_concurrency` requests of a connection are in flight; further
+    messages are not read until one finishes. Each message is admitted like an HTTP
+    request of the interactive lane: it takes a token from the connection's tenant
+    bucket and a slot of the lane, and is answered with a 429 error otherwise.
+    Outgoing messages go through a bounded queue, so a client that stops reading
+    stalls its own handlers instead of growing the server's buffers.
+    """
+    await websocket.accept()
+    client_tenant = tenant(websocket.scope)
+    outgoing = asyncio.Queue(maxsize=settings.ws_send_queue_size)
+    slots = asyncio.Semaphore(settings.ws_max_concurrency)
+    handlers = set()
+
+    async def sender():
+        try:
+            while True:
+                message = await outgoing.get()
+                await websocket.send_text(to_json(message).decode())
+        except Exception:
+            # The client is gone; handlers waiting on the full queue would never finish
+            for handler in list(handlers):
+                handler.cancel()
+
+    async def handle(request: VoiceSocketRequest):
+        try:
+            rejection = admission.rejection(client_tenant, INTERACTIVE)
+            if rejection is not None:
+                detail, retry_after = rejection
+                await outgoing.put({
+                    "id": request.id, "type": "error", "status": 429, "detail": detail,
+                    "retry_after": max(1, int(retry_after + 0.999)),
+                })
+                return
+            async with admission.slot(INTERACTIVE):
+                await _handle_voice_request(request, outgoing.put)
+        finally:
+            slots.release()
+
+    sending = asyncio.create_task(sender())
+    try:
+        while True:
+            await slots.acquire()
+            message = await websocket.receive_text()
+            try:
+                request = VoiceSocketRequest.model_validate_json(message)
+            except ValidationError as e:
+                slots.release()
+                await outgoing.put({"id": None, "type": "error", "status": 422, "detail": json.loads(e.json(include_url=False))})
+                continue
+            handler = asyncio.create_task(handle(request))
+            handlers.add(handler)
+            handler.add_done_callback(handlers.discard)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in [*handlers, sending]:
+            task.cancel()
+
+
+async def _handle_voice_request(request: VoiceSocketRequest, send):
+    """Runs one WebSocket request and sends its result or error through `send`."""
+    try:
+        # Each message is traced as its own request
+        with start_span("ws.message", type=request.type):
+            if request.type == "khata-entry":
+                data = await _parse_khata_entry(request.input)
+            elif request.type == "customer-selection":
+                if request.shop_id is not None:
+                    data = await _select_registered_customer(request.shop_id, request.input, request.version)
+                elif request.customer_list is not None:
+                    data = await _select_listed_customer(request.input, request.customer_list)
+                else:
+                    raise HTTPException(status_code=400, detail="Either shop_id or customer_list is required.")
+            elif request.type == "voice-khata-entry":
+                data = await _voice_khata_entry(request.input, request.shop_id, request.customer_list)
+            else:
+                # The last event is the complete reply, which becomes the result
+                async for event, data in _stream_information_desk(request.input):
+                    if event == "answer":
+                        await send({"id": request.id, "type": "partial", "delta": data})
+    except HTTPException as e:
+        await send({"id": request.id, "type": "error", "status": e.status_code, "detail": e.detail})
+        return
+    except Exception:
+        logger.exception(f"WebSocket {request.type} request failed")
+        await send({"id": request.id, "type": "error", "status": 500, "detail": "Internal server error."})
+        return
+    await send({"id": request.id, "type": "result", "data": data})
+
+
+async def _stream_information_desk(input: str):
+    """
+    Answers an information-desk question, yielding ("answer", text) as the answer is
+    generated and finally ("reply", reply) with the complete reply.
+    """
+    precomputed = _precomputed_info_desk_reply(input)
+    if precomputed is not None:
+        yield "answer", precomputed["answer"]
+        yield "reply", precomputed
+        return
+
+    answer = JsonStringFieldStream("answer")
+    text = []
+    async for chunk in gateway.generate_content_stream(
+        client,
+        "info-desk",
+        **_info_desk_request(input),
+    ):
+        if chunk.text:
+            text.append(chunk.text)
+            delta = answer.feed(chunk.text)
+            if delta:
+                yield "answer", delta
+
+    reply = decode_json("".join(text), InfoDeskReply)
+    info_desk_cache.store(input, reply.model_dump())
+    yield "reply", reply
 
 
 @app.post("/convert-case-file/", tags=["Conversion"])
-async def convert_file(file: UploadFile = File(...)):
+async def convert_file(file: UploadFile = File(...), pages: str | None = Form(None), preview: bool = Form(False)):
     """
     Receives a Bangla PDF, translates and formats it to English, and returns a DOCX file.
+
+    `pages` limits the conversion to page ranges such as "1-3,7". With `preview`, only
+    the first PREVIEW_PAGES of them are translated, without the refinement pass, and the
+    full conversion continues in the background; its job id is returned in the
+    X-Full-Conversion-Id header, for GET /convert-case-file/jobs/{job_id}.
     """
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
 
     # 1. Read the file content
-    pdf_content = await file.read()
-    filename = file.filename
+    with start_span("pdf.read") as span:
+        pdf_content = await file.read()
+        page_count = _page_count(pdf_content)
+        span.set(bytes=len(pdf_content), pages=page_count)
+    return await _convert_pdf(pdf_content, file.filename, page_count, pages, preview)
+
+
+def _page_count(pdf_content: bytes) -> int:
+    try:
+        with fitz.open(stream=pdf_content, filetype="pdf") as pdf:
+            return pdf.page_count
+    except Exception:
+        raise HTTPException(status_code=400, detail="The uploaded file is not a readable PDF.")
+
+
+async def _convert_pdf(
+    pdf_content: bytes, filename: str, page_count: int, pages: str | None, preview: bool
+) -> FileResponse:
+    """Converts an uploaded PDF, posted at once or through a resumable upload."""
+    selection = _parse_page_ranges(pages, page_count) if pages else None
+    variant = f"pages:{selection}" if selection is not None else ""
+    if preview:
+        return await _convert_preview(pdf_content, filename, page_count, selection, variant)
     
+    # Every stage is checkpointed, so resubmitting the file after a worker restart or a
+    # timeout resumes the conversion instead of paying for the finished work again
+    job = await _claim_conversion(conversion_job_id(pdf_content, variant), filename)
+    async with _heartbeat(job):
+        return await _convert_job(job, pdf_content, selection)
+
+
+async def _convert_job(job, pdf_content: bytes, selection: list[int] | None) -> FileResponse:
     # 2. AI Processing (OCR, Translation, and Formatting)
     # The function handles all exceptions internally
-    english_markdown_draft = await translate_and_format_pdf_with_gemini(pdf_content, filename)
+    english_markdown_draft = await _translate_draft(job, pdf_content, selection)
     # english_markdown_draft = '## Translated Legal Document: Arrest Warrant and First Information Report\n\n**Page 1**\n\n```\nবাংলাদেশ অনলিপি স্ট্যা\nএক\nটাকা\nবাংলাদেশ\nকোর্ট ফি\n```\n\nBangladesh Copy Stamp\nOne\nTaka\nBangladesh\nCourt Fee\n\n10/02/25, 11/02/25, 12/02/25, 22/2/24. 22/02/20\nCriminal: Copy 4-654/25\n\n```\nআদালত\nOURT OF THE CHIEF METROPOLITAN HAG\nসিলেট\n*\n*COPWING DEPARTMEN\nনকল বিভাগ\n```\n\nCourt\nCourt of the Chief Metropolitan Magistrate\nSylhet\n*\n*Copying Department\nCopy Department\n\nGovernment of the People\'s Republic of Bangladesh\nLearned Metropolitan Magistrate, 2nd Court, Sylhet.\nAirport G.R. Case No.-432/2023 AD.\nReference:- Airport Police Station Case No. 05, Date-15/06/2023 AD,\n\n**ARREST WARRANT**\n(Section 75 of the Code of Criminal Procedure)\n\n1) The name and designation of the person or persons to whom this warrant is to be executed.\n\nTo\nOfficer-in-Charge\nShahparan Police Station,\nSMP, Sylhet.\nAccused:- Sajidur Rahman Shaju (28) Father-Md. Aang Mukit Residing- Hatimbag, Police Station-Shahparan, SMP, Sylhet.--To Resident\n\nSignature (Placeholder for signature)\n\n2) Description of the offense.\n2) A complaint has been filed against the above-mentioned accused Sajidur Rahman Shaju under Sections 144/147/148/149/186/332/333/353/307/506 of the Penal Code 1860, along with Section 4 of the Explosive Substances Act 1908. Therefore, you are hereby ordered to apprehend the accused and produce him before me. Let there be no default in this.\n\nSd./Illegible\nMetropolitan Magistrate 2nd Court,\nSylhet.\n\n---\n\nChecked and verified\n(Handwritten Signature: Hare Rahim)\nIn cooperation with.\nVerification Assistant\nDate\n\nCertified to be a true copy\n(Handwritten Signature: Md. Azad Mia)\n(Md. Azad Mia)\nCertifying Officer (In-Charge) Copying Department (Nazir)\nMetropolitan Magistrate Court, Sylhet.\nLaw 73 that, former minister.\n\n"Take an oath of patriotism, bid farewell to corruption"\n\n---\n\n**Page 2**\n\n```\nবাংলাদেশ অনুলিপি ষ্ট্যান্ড\nএক\nটাকা\nবাংলাদেশ\nকোর্ট ফি\n```\n\nBangladesh Copy Stamp\nOne\nTaka\nBangladesh\nCourt Fee\n\n10/02/25, 11/02/25, 12/02/25, 22/0/20. 240/202.\nCriminal: Copy:-654/25\nB.P. Form No.-27\nBangladesh Form No.-5356\n\n```\nমেট্রোপলিটন ম্যাজিস্ট্রেট আদালত\nRT OF THE CHIEF METROPOLITAN MAGISTRAT\n*\n*COPYING DEPARTMENT\nনকল বিভাগ\n```\n\nMetropolitan Magistrate Court\nCourt of the Chief Metropolitan Magistrate\n*\n*Copying Department\nCopy Department\n\n**FIRST INFORMATION REPORT**\n\nPreliminary Information regarding Cognizable Offenses presented at the Police Station under Section 154 of the Code of Criminal Procedure\n\nSeen by\nSd.) Illegible\nAddl. Chief Metropolitan Magistrate Court,\nSylhet,\n\nUpazila-Airport Police Station\nDistrict: SMP Sylhet.\nCase No. 432\nDate and time of incident: 15/06/2023 AD: Approximately 01:45 AM\n\n**AIRPORT G.R. CASE NO.-432/2023 ENGLISH.**\n\nDate and time of presentation: 15/06/2023 AD, 21:05 PM.\nPlace of incident, distance and direction from police station and responsible area no.-\nPlace of incident: On Sylhet Bholaganj Road, in front of Sylhet Divisional Stadium under Airport Police Station. Distance from police station approximately 03 km west. AmbarKhana Police Outpost, Beat No.-03.\n\nDate of dispatch from police station: 16/06/2023 AD.\n\nN.B.:- The preliminary information must contain the signature or thumb impression of the informant and be attested by the recording officer.\n\nName and residential address of informant and complainant:\nS.I., Asim Kumar Sarkar, Airport Police Station, SMP, Sylhet.\n\nName and residential address of accused:\n1. Rezaul Hasan Koyes Lodi (50) Father-Unknown, Residing-Housing Estate, Upazila-Police Station-Airport, Sylhet,\n2. Dr. Nazmul Islam (48) Father-Abdul Karim, House No.-18, Police Station-Kotwali, Sylhet\n3. Shakil (25) Father-Sirjan alias Siraj Mia Village-Khuliyapara,\n\n"Take an oath of patriotism, bid farewell to corruption"\n\n---\n\n**Page 3**\n\n```\nবাংলাদেশ অনুলিপি ষ্ট্যাম্প\nটাকা\n```\n\nBangladesh Copy Stamp\nTaka\n\n(2)\n\n```\nHE CHIEF METROPOLITAN MAGISTRAথানা-কতোয়ালী, সিলেট ৪। শামীম (১৮) পিতা-সিরজান ওরফে\nপ্লটন ম্যাজিস্ট্রেট আদালত\nমেট্রোপলিটন\nOF TH\n*\n**\n* COPYING DEPARTMEN\nনকল বিভাগ\n```\n\nPolice Station-Kotwali, Sylhet 4. Shamim (18) Father-Sirjan alias\nMetropolitan Magistrate Court\nOf The Chief Metropolitan Magistrate\n*\n**\n*Copying Department\nCopy Department\n\nSiraj Mia, Residing-Khuliyapara Police Station-Kotwali, Sylhet, 5. Sujan (25) Father-Gedu Mia, currently-Khuliyapara, House No.-11/1) Upazila/Police Station-Kotwali, Sylhet 7. Delwar Hossain Dinar (Haji Dinar) (35), Father-Unknown, Village-Teroroton, Sylhet, 8. Enamul Haque (30), 9. Ekramul Haque (22), both Father-Abdul Bari, both Village-Shahjalal Upashahar, Sylhet, 10. Humayun Ahmed (56), Father-Late Kabir Ahmed, Permanent Village-Dashghar, Police Station-Bishwanath, District-Sylhet, Currently-Shahjalal Upashahar, House No.-32, Main Road, 11. Md. Sabbir Ahmed Dinar (33), Father-Akteruzzaman, Residing-17/1, Momtaz Villa, Purbo Chowkidekhi, AmbarKhana, Police Station-Airport, 12. Solid (36), Father-Unknown, Village-Upashahar, 13. Forhad (28), Father-Unknown, Village-Teroroton, 14. Saddam (30), Father-Unknown, Village-Teroroton, 15. Muhibur Rahman Khan Rasel (33), Father-Motiur Rahman Khan, Village-Khan Complex Sonarpara Main Road, Sylhet, 16. Rasel alias Kala Rasel (32), Father-Unknown, Village-House No.-8, Road No.-30, Block/D, Shahjalal Upashahar, Sylhet, 17. Arafat (33), Father-Unknown, Village-Shahjalal Upashahar, Sylhet, 18. Mofazzal Chowdhury Morshed (27), Father-Unknown, Village-Shahjalal Upashahar, Sylhet, 19. Alfu Mia (30), Father-Abdul Haque, Permanent-Village-Tatikona, Upazila/Police Station-Chhatak, Sunamganj, Currently-Village-Teroroton, 20. Shaheen (27), Father-Unknown, Village-Jindabazar Panchbhai Restaurant owner, 21. Sufian (30), Father-Unknown, Village-Upashahar, Business Address-Kalighat, Sylhet, 22. Nazrul alias Junior Nazrul (24), Father-\n\n"Take an oath of patriotism, bid farewell to corruption"\n\n---\n\n**Page 4**\n\n```\n>বাংলাদেশ অনুলিপি ষ্ট্যাম্প\nঢাক\n```\n\n>Bangladesh Copy Stamp\nDhaka\n\n```\nLE CHIEF METROPOLITAN MAGIST\nটাকা\n```\n\nThe Chief Metropolitan Magistrate\nTaka\n\n(3)\n\n```\nমেট্রোপলিটন ম্যাজিস্ট্রেট আদালত অজ্ঞাত, গ্রাম-রায়নগর, সিলেট, ২৪। আফজল (৩০), পিতা-অজ্ঞাত,\nঅজ্ঞাত, গ্রাম-শাহজালাল উপশহর, সিলেট। ২৩ । তোহা (২৮), পিতা-\nচীফ\nCOURT OF\n*\n☆☆\n* COPYING DEPARTMENT\nনকল বিভাগ\n```\n\nMetropolitan Magistrate Court Unknown, Village-Shahjalal Upashahar, Sylhet. 23. Toha (28), Father-Unknown, Village-Raynagar, Sylhet, 24. Afzal (30), Father-Unknown,\nChief\nCourt of\n*\n☆☆\n*Copying Department\nCopy Department\n\nVillage-Bianibazar, Sylhet, 25. Imad Uddin Ayman (45) Father-Unknown, Residing-Dashghar, P.O. Dashghar, Police Station-Bishwanath, District-Sylhet (Organizational Secretary, Ward No. 8, Dashghar UP, Bishwanath) 26. Sadikur Rahman (24), Father: Md. Kaptan Mia, Residing: Kalatikar, Nipabon A/A Road, Khadimpara, Police Station: Shahparan (R.), District: Sylhet, 27. Saber (30), Father: Unknown, Residing: Hawapara, All Police Station: Kotwali, 28. Osman Ghani (30), Father Unknown, Residing: Pathantula, Police Station Jalalabad, 29. Rashid (30), Father Unknown, Residing: Shibganj, Police Station: Shahparan (R.), 30. Sajidur Rahman Shaju (28) Father-Md. Aang Mukit Residing-Hatimbag, Police Station-Shahparan, All District-Sylhet, along with 20/30 unknown unruly BNP, Chhatra Dal, Juba Dal activists.\n\n**Brief description of offenses and seized articles with sections:**\nSections:- 144/147/148/149/186/332/333/353/307/506 of the Penal Code 1860, along with Section 4 of the Explosive Substances Act 1908.\n\nItems seized upon recovery: 10 iron rods, 08 bamboo sticks, 40 pieces of bricks of various sizes, 02 machetes, 03 unexploded cocktail-like objects.\n\n**Explanation for promptness of investigation and delay in recording information:**\nUpon receiving the computer-typed complaint from the plaintiff at the police station, I duly filled out the preliminary information column and registered this case. A note has been made in the ledger. Discussion has taken place with higher authorities prior to the registration of the case. The complaint is considered an FIR and is attached herewith.\n\n"Take an oath of patriotism, bid farewell to corruption"\n\n---\n\n**Page 5**\n\n```\nবাংলাদেশ অনালিপি স্ট্যা\nএক\nটাকা\nই টাকা\n```\n\nBangladesh Copy Stamp\nOne\nTaka\nTwo Taka\n\n(4)\n\n```\nমেট্রোপলিটন ম্যাজিস্ট্রেট আদালত\nTHE CHIEF METROPOLITAN MAGISTRA মামলা তদন্তের ব্যবস্থা করিবেন।\nOF T\n*\n*\n* COPYING DEPARTMENT ★\nনকল বিভাগ\n```\n\nMetropolitan Magistrate Court\nThe Chief Metropolitan Magistrate\n*\n*\n*Copying Department ★\nCopy Department\n\ndid. The reason for delay is mentioned in the FIR. The Police Inspector (Investigation) will arrange for the investigation of the case.\n\nCase Outcome: X\n\nNote:- The signature or thumb impression of the informant must be present at the bottom of the information.\n\nTo,\nOfficer-in-Charge\nAirport Police Station\nSMP Sylhet.\n\nSubject: FIR.\n\nSir,\n\nHumbly submitted that,\n\nI, S.I., Asim Kumar Sarkar, Airport Police Station, SMP, Sylhet, am present at the police station and am lodging this complaint to the effect that during the nationwide blockade called by BNP and the 20-party alliance, demanding elections under a non-partisan neutral caretaker government, the aforementioned defendants along with 20/30 other unknown BNP activists were obstructing the road at the aforementioned spot, creating impediments to vehicular movement and vandalizing vehicles while shouting slogans like "blockade is on, blockade will continue".\n\nUpon receiving the said news, the Deputy Police Commissioner (North), Senior Assistant Police Commissioner, SMP Sylhet, and the Officer-in-Charge, Airport Police Station, SMP Sylhet, along with duty parties in various locations in this police station area, reached the mentioned spot at 01:35 AM on 15/06/2023 AD. When asked to calm down, the unruly BNP activists became further agitated and threw bricks, stones, and cocktails at the police. The bricks thrown by the accused\n\n"Take an oath of patriotism, bid farewell to corruption"\n\n---\n\n**Page 6**\n\n```\nবাংলাদেশ অনুলিপি স্ট্যাম্প\n```\n\nBangladesh Copy Stamp\n\n```\nলিটন ম্যাজিস্ট্রেট আদ\nOF THE CHIEF METROPOLITAN MAGISTR\n(\nCOURT OF\n*\n* COPYING DEPARTMENT\nনকল বিভাগ\n```\n\nMetropolitan Magistrate\nOf The Chief Metropolitan Magistrate\n(\nCourt of\n*\n*Copying Department\nCopy Department\n\nTaka\n\nbricks and stones injured ASI Khorshed Alam, Constable/1560 Sanjay and Constable/1787 Enamul Haque. When the police chased the BNP activists, they dispersed and fled in various directions. At that time, accused Nos. 1-4 were apprehended, and other accused fled. From the possession of accused No. 1, 1 hockey stick, from accused No. 2, 1 bamboo stick, from accused No. 3, 1 bamboo stick, and from accused No. 4, 3 cocktail-like objects, which were found scattered at the scene.\n\nThereafter, from the scene, 1 Glamour motorcycle, registration No.-Sylhet H-14-4918, 2. one Hero motorcycle, registration No.-Sylhet H-15-1364, 3. one Glamour motorcycle, registration No.-Sylhet H-13-6419, and 03 unexploded cocktail-like objects thrown at the police were recovered. All seized items and arrested accused were taken into custody based on the seizure list prepared in front of witnesses at 13:50 on 15/06/2023 AD.\n\nSubsequently, the injured police personnel were taken to Sylhet MAG Osmani Medical College Hospital for preliminary treatment. The accused, as members of an unlawful assembly, joined the riot with dangerous local weapons, obstructed police in their official duties, assaulted police personnel with intent to murder, causing simple injury, intimidation, and damage to life and property by storing and throwing explosive substances, thereby committing offenses under Sections 143/147/148/149/186/332/353/307/506 of the Penal Code 1860, along with Section 4 of the Explosive Substances Act 1908.\n\nCollecting the names and addresses of the absconding accused, conducting raids in various places to apprehend them, and discussing the matter with higher authorities caused some delay in coming to the police station and lodging the FIR.\n\n"Take an oath of patriotism, bid farewell to corruption"\n\n---\n\n**Page 7**\n\n```\n২\nবাংলাদেশ অনুলিপি ষ্ট্যান্ড\nএক\nটাকা\nদুই টাকা\n```\n\n2\nBangladesh Copy Stamp\nOne\nTaka\nTwo Taka\n\n```\nবাংলাদেশ\nকোর্ট ফি\n```\n\nBangladesh\nCourt Fee\n\n```\nপলিটন ম্যাজিস্ট্রেট আদালত\nTHE CHIEF METROPOLITAN MAGISTRATE\nমেট্রোপ\n*\n*(*\n* COPYING DEPARTMENT\nনকল বিভাগ\n```\n\nMetropolitan Magistrate Court\nThe Chief Metropolitan Magistrate\n*\n*(*\n*Copying Department\nCopy Department\n\nTherefore, Sir, may it please you to register a regular case against the arrested and absconding accused under the mentioned sections and take legal action.\n\nAttached :- 1. Seizure List 01 page.\n\nRespectfully,\nSd: Illegible\nAsim Kumar Sarkar\n(S.I. (Inv.))\nAirport Police Station,\nSMP Sylhet.\n\n---\n\nChecked and verified\n(Handwritten Signature: Atave Rahn)\nIn cooperation with.\nVerification Assistant\nDate\n\nCertified to be a true copy\n(Handwritten Signature: Md. Azad Mia)\n(Md. Azad Mia)\nCertifying Officer (In-Charge) Copying Department (Nazir)\nMetropolitan Magistrate Court, Sylhet.\n109 10th said 76 section he former power.\n\n"Take an oath of patriotism, bid farewell to corruption"'
-    
+    docx_content = await _complete_conversion(job, english_markdown_draft)
+    return _docx_response(job, docx_content)
+
+
+@app.get("/convert-case-file/jobs/{job_id}", response_model=ConversionStatus, tags=["Conversion"])
+async def get_conversion(job_id: str):
+    """
+    Returns the DOCX file of a finished conversion, e.g. the full conversion that runs in
+    the background after a preview, or its stage (202) while it is still running.
+
+    A background conversion whose worker was restarted is resumed from its checkpoints
+    here; any other abandoned conversion is reported as failed, and resumes when the
+    file is submitted again.
+    """
+    job = conversion_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired conversion.")
+    if job.is_abandoned and job.id not in _background_conversions:
+        job = conversion_store.start(job.id, job.filename)
+        # Not claimed when another worker resumed it first
+        if job.claimed:
+            pdf_content = job.get("pdf")
+            if pdf_content is not None:
+                logger.info(f"Resuming abandoned background conversion {job.id} of '{job.filename}'.")
+                _start_background_conversion(job, pdf_content, json.loads(job.get_text("selection")))
+            else:
+                job.set_stage("failed")
+    if job.stage == "failed":
+        raise HTTPException(status_code=500, detail="The conversion failed. Submit the file again to resume it.")
+    if job.stage != "done":
+        return json_response(ConversionStatus(job_id=job.id, stage=job.stage), status_code=202)
+    return _docx_response(job, job.get(job.get_text("docx")))
+
+
+def _parse_page_ranges(spec: str, page_count: int) -> list[int]:
+    """Parses 1-based page ranges such as "1-3,7" into sorted 0-based page numbers."""
+    numbers = set()
+    for part in spec.split(","):
+        first, _, last = part.strip().partition("-")
+        try:
+            first, last = int(first), int(last or first)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid page range '{part.strip()}'.")
+        if not 1 <= first <= last <= page_count:
+            raise HTTPException(
+                status_code=400, detail=f"Page range '{part.strip()}' is outside pages 1-{page_count}."
+            )
+        numbers.update(range(first - 1, last))
+    return sorted(numbers)
+
+
+async def _translate_draft(job, pdf_content: bytes, selection: list[int] | None) -> str:
+    english_markdown_draft = job.get_text("draft")
+    if english_markdown_draft is None:
+        english_markdown_draft = await translate_and_format_pdf_with_gemini(pdf_content, job.filename, selection)
+        job.put("draft", english_markdown_draft)
+    return english_markdown_draft
+
+
+async def _convert_preview(
+    pdf_content: bytes, filename: str, page_count: int, selection: list[int] | None, variant: str
+) -> FileResponse:
+    """
+    Translates the first PREVIEW_PAGES pages and renders them as they are, then starts
+    the full conversion in the background. The preview's pages are in the page cache
+    by then, so the full conversion does not translate them again.
+    """
+    shown = (selection if selection is not None else list(range(page_count)))[:settings.preview_pages]
+    job = await _claim_conversion(conversion_job_id(pdf_content, f"preview:{shown}"), filename)
+    async with _heartbeat(job):
+        english_markdown_draft = await _translate_draft(job, pdf_content, shown)
+
+        # The same job as a plain conversion of the file: when one of those (or another
+        # preview's background conversion) is already running, it is not claimed and
+        # the client polls that one
+        full_job = conversion_store.start(conversion_job_id(pdf_content, variant), filename)
+        if full_job.claimed and full_job.stage != "done":
+            # Kept with the job, so that another worker can resume it if this one is restarted
+            if full_job.get("pdf") is None:
+                full_job.put("pdf", pdf_content)
+                full_job.put("selection", json.dumps(selection))
+            _start_background_conversion(full_job, pdf_content, selection)
+
+        pages_shown = ", ".join(str(number + 1) for number in shown)
+        note = (
+            f"*Preview of page(s) {pages_shown}, translated without the final review. "
+            f"The full translation is in progress (conversion {full_job.id}).*"
+        )
+        job.set_stage("rendering")
+        docx_content = _render_docx(job, f"{note}\n\n{english_markdown_draft}")
+        job.set_stage("done")
+    return _docx_response(job, docx_content, {"X-Full-Conversion-Id": full_job.id})
+
+
+# Full conversions running in the background after a preview, by job id
+_background_conversions: dict[str, asyncio.Task] = {}
+
+
+def _start_background_conversion(job, pdf_content: bytes, selection: list[int] | None):
+    task = asyncio.get_running_loop().create_task(
+        _convert_in_background(job, pdf_content, selection), context=contextvars.Context()
+    )
+    _background_conversions[job.id] = task
+    task.add_done_callback(lambda _: _background_conversions.pop(job.id, None))
+
+
+async def _convert_in_background(job, pdf_content: bytes, selection: list[int] | None):
+    # Runs in a fresh context, so it is traced on its own rather than as part of the
+    # preview request, which has finished by the time this does
+    with start_span("conversion.background", job_id=job.id):
+        try:
+            async with _heartbeat(job):
+                # Waits for a conversion slot like a submitted file, so previews cannot
+                # start more full conversions than the lane allows
+                async with admission.slot(CONVERSION):
+                    english_markdown_draft = await _translate_draft(job, pdf_content, selection)
+                    await _complete_conversion(job, english_markdown_draft)
+            job.delete("pdf")
+        except Exception as e:
+            logger.error(f"Background conversion {job.id} of '{job.filename}' failed: {e}")
+            job.set_stage("failed")
+
+
+async def _claim_conversion(job_id: str, filename: str):
+    """
+    Starts or resumes a conversion job for this request. While another runner has the
+    job (e.g. the background conversion after a preview of the same file), waits for it
+    to finish instead of working on the same checkpoints at the same time; the job is
+    then claimed at its final stage, and its checkpoints make the rest cheap.
+    """
+    while True:
+        job = conversion_store.start(job_id, filename)
+        if job.claimed:
+            return job
+        task = _background_conversions.get(job_id)
+        if task is not None:
+            await asyncio.wait([task])
+        else:
+            # Run by another worker, which touches the job at least this often
+            await asyncio.sleep(settings.conversion_stale_seconds / 3)
+
+
+@asynccontextmanager
+async def _heartbeat(job):
+    """
+    Touches the job while it runs, so that it is not taken for abandoned (see
+    ConversionJob.is_abandoned), and marks it failed when its runner raises or is
+    cancelled, so that the next request for it is not kept waiting.
+    """
+    async def beat():
+        while True:
+            await asyncio.sleep(settings.conversion_stale_seconds / 3)
+            job.touch()
+
+    task = asyncio.create_task(beat())
+    try:
+        yield
+    except BaseException:
+        job.set_stage("failed")
+        raise
+    finally:
+        task.cancel()
+
+
+async def _complete_conversion(job, english_markdown_draft: str) -> bytes:
+    """Refines the translated draft of a conversion job and renders it as a DOCX file."""
+    job.set_stage("refining")
     # 3. AI Refinement (Pass sample content for style context)
     sample_content = None
     sample_file_name = "style_reference.docx"
@@ -134,26 +836,175 @@ async def convert_file(file: UploadFile = File(...)):
             print(f"Warning: Could not process local sample file '{sample_file_name}': {e}")
             sample_text_content = None # Ensure content is None on failure
 
-    english_markdown = await refine_english_markdown(english_markdown_draft, sample_content)
+    english_markdown = await refine_english_markdown(english_markdown_draft, sample_content, job)
     # 4. DOCX Generation
-    doc_buffer = generate_docx_from_markdown(english_markdown)
-    
+    job.set_stage("rendering")
+    docx_content = _render_docx(job, english_markdown)
+    job.set_stage("done")
+    return docx_content
+
+
+def _render_docx(job, english_markdown: str) -> bytes:
+    """Renders the DOCX, reusing the job's checkpoint when the Markdown is unchanged."""
+    docx_checkpoint = "docx-" + hashlib.sha256(english_markdown.encode("utf-8")).hexdigest()[:32]
+    docx_content = job.get(docx_checkpoint)
+    if docx_content is None:
+        docx_content = generate_docx_from_markdown(english_markdown).getvalue()
+        job.put(docx_checkpoint, docx_content)
+    job.put("docx", docx_checkpoint)
+    return docx_content
+
+
+def _docx_filename(filename: str) -> str:
+    """The download name of a converted file. Only the base name of the client's file name is kept."""
+    name = os.path.basename(filename.replace("\\", "/"))
+    name = "".join(character for character in name if character.isprintable()).strip(" .")
+    if name.lower().endswith(".pdf"):
+        name = name[:-4]
+    return f"{name or 'case_file'}_Translated.docx"
+
+
+def _docx_response(job, docx_content: bytes, headers: dict = None) -> FileResponse:
     # 5. Return the DOCX file
-    docx_filename = filename.replace(".pdf", "_Translated.docx")
-    
-    # Use a temporary file to hold the data
-    output_path = os.path.join(os.getcwd(), docx_filename)
-    
-    # 6. Write the in-memory buffer to the permanent file path
-    with open(output_path, "wb") as f:
-        f.write(doc_buffer.getvalue())
-    # 7. Return the file using FileResponse
-    # The 'background=...' ensures the temporary file is deleted after the response is sent.
-    print(f"File successfully saved to: {output_path}")
+    docx_filename = _docx_filename(job.filename)
+
+    # Each response gets its own temporary file, so concurrent conversions of files with
+    # the same name cannot overwrite each other's output; the DOCX stays in the job's
+    # checkpoints for GET /convert-case-file/jobs/{job_id}
+    fd, output_path = tempfile.mkstemp(prefix=f"{job.id}-", suffix=".docx")
+    with os.fdopen(fd, "wb") as f:
+        f.write(docx_content)
+    # 6. Return the file, deleting it once it is sent
     return FileResponse(
         path=output_path,
         media_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
         filename=docx_filename,
-        # IMPORTANT: Removed the 'background=os.remove(tmp_path)' argument
-        # The file will now remain in your project root.
-    )
\ No newline at end of file
+        headers={"X-Conversion-Id": job.id, **(headers or {})},
+        background=BackgroundTask(os.remove, output_path),
+    )
+
+
+@app.post("/convert-case-file/uploads/", response_model=ConversionUpload, tags=["Conversion"])
+async def start_conversion_upload(filename: str = Form(...)):
+    """
+    Starts a pipelined conversion: the case file is uploaded in parts, and every part is
+    translated while the next ones are still being uploaded.
+    """
+    if not filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported.")
+    return ConversionUpload(upload_id=upload_sessions.create(filename).id)
+
+
+@app.put(
+    "/convert-case-file/uploads/{upload_id}/parts/{index}",
+    response_model=ConversionUploadPart,
+    status_code=202,
+    tags=["Conversion"],
+)
+async def upload_conversion_part(upload_id: str, index: int, file: UploadFile = File(...)):
+    """
+    Receives part `index` (counting from 0) of a pipelined upload: a PDF with the next
+    page or pages of the case file. Its translation starts right away.
+    """
+    upload = upload_sessions.get(upload_id)
+    if index < 0:
+        raise HTTPException(status_code=400, detail="Part numbers start at 0.")
+    with start_span("pdf.read", part=index) as span:
+        content = await file.read()
+        try:
+            with fitz.open(stream=content, filetype="pdf") as pdf:
+                pages = pdf.page_count
+        except Exception:
+            raise HTTPException(status_code=400, detail="The uploaded part is not a readable PDF.")
+        span.set(bytes=len(content), pages=pages)
+    upload.add_part(index, content)
+    return ConversionUploadPart(upload_id=upload_id, index=index, pages=pages)
+
+
+@app.post("/convert-case-file/uploads/{upload_id}/complete", tags=["Conversion"])
+async def complete_conversion_upload(upload_id: str, parts: int = Form(...)):
+    """
+    Finishes a pipelined upload of `parts` parts: waits for the translations still in
+    progress, joins them in order, and returns the DOCX file like /convert-case-file/.
+    """
+    upload = upload_sessions.get(upload_id)
+    job = await _claim_conversion(upload.job_id(parts), upload.filename)
+    async with _heartbeat(job):
+        english_markdown_draft = job.get_text("draft")
+        if english_markdown_draft is None:
+            english_markdown_draft = PAGE_SEPARATOR.join(await upload.pages(parts))
+            job.put("draft", english_markdown_draft)
+        docx_content = await _complete_conversion(job, english_markdown_draft)
+    upload_sessions.close(upload_id)
+    return _docx_response(job, docx_content)
+
+
+@app.post("/case-file-uploads/", response_model=ResumableUploadStatus, tags=["Conversion"])
+async def create_resumable_upload(filename: str = Form(...), size: int = Form(...)):
+    """
+    Starts a resumable upload of a case file of `size` bytes. The file is sent in chunks
+    of at most `chunk_bytes` with PUT /case-file-uploads/{upload_id}, then converted with
+    POST /convert-case-file/resumable/{upload_id}.
+
+    Chunk transfers are not under /convert-case-file/, so a slow connection does not hold
+    one of the conversion lane's slots while it uploads.
+    """
+    if not filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported.")
+    if not 0 < size <= settings.resumable_upload_max_bytes:
+        raise HTTPException(
+            status_code=413, detail=f"Files are limited to {settings.resumable_upload_max_bytes} bytes."
+        )
+    return _resumable_status(resumable_uploads.create(filename, size))
+
+
+@app.get("/case-file-uploads/{upload_id}", response_model=ResumableUploadStatus, tags=["Conversion"])
+async def get_resumable_upload(upload_id: str):
+    """Returns the offset the upload continues at, e.g. after a chunk failed or the page was reloaded."""
+    return _resumable_status(resumable_uploads.get(upload_id))
+
+
+@app.put("/case-file-uploads/{upload_id}", response_model=ResumableUploadStatus, tags=["Conversion"])
+async def put_resumable_upload_chunk(
+    upload_id: str,
+    request: Request,
+    content_range: str = Header(...),
+    x_chunk_sha256: str | None = Header(None),
+):
+    """
+    Receives the chunk given by the Content-Range header ("bytes 0-8388607/52428800"),
+    which must start at the upload's offset, with its hex SHA-256 in X-Chunk-SHA256.
+    The body is the raw bytes of the chunk.
+    """
+    upload = resumable_uploads.get(upload_id)
+    with start_span("upload.chunk", upload_id=upload_id, offset=upload.received) as span:
+        await upload.write(content_range, request.stream(), x_chunk_sha256)
+        span.set(received=upload.received, size=upload.size)
+    return _resumable_status(upload)
+
+
+@app.delete("/case-file-uploads/{upload_id}", status_code=204, tags=["Conversion"])
+async def delete_resumable_upload(upload_id: str):
+    """Deletes an upload and its spooled file, e.g. once its DOCX file has been saved."""
+    resumable_uploads.delete(upload_id)
+
+
+@app.post("/convert-case-file/resumable/{upload_id}", tags=["Conversion"])
+async def convert_resumable_upload(upload_id: str, pages: str | None = Form(None), preview: bool = Form(False)):
+    """
+    Converts a completely uploaded case file like /convert-case-file/. The upload is kept
+    until it expires or is deleted, so if the response is lost, posting again returns
+    the checkpointed conversion instead of requiring the file to be sent again.
+    """
+    upload = resumable_uploads.get(upload_id)
+    with start_span("pdf.read", upload_id=upload_id) as span:
+        pdf_content = await asyncio.to_thread(upload.read)
+        page_count = _page_count(pdf_content)
+        span.set(bytes=len(pdf_content), pages=page_count)
+    return await _convert_pdf(pdf_content, upload.filename, page_count, pages, preview)
+
+
+def _resumable_status(upload) -> ResumableUploadStatus:
+    return ResumableUploadStatus(
+        upload_id=upload.id, size=upload.size, offset=upload.received, chunk_bytes=settings.resumable_chunk_bytes
+    )
@@ -1,5 +1,15 @@
+import json
+import os
+import tempfile
+
 from fastapi.testclient import TestClient
 
+# The suite keeps its stores and traces in a temporary directory instead of the checkout;
+# set before main is imported, since the stores are opened on import
+_state_dir = tempfile.mkdtemp(prefix="ankona-test-")
+os.environ.setdefault("DATA_DIR", _state_dir)
+os.environ.setdefault("TRACE_FILE", os.path.join(_state_dir, "traces.jsonl"))
+
 from main import app
 
 client = TestClient(app)
@@ -7,3 +17,1044 @@ client = TestClient(app)
 def test_main_root():
     response = client.get("/")
     assert response.status_code == 200
+
+
+def test_spans_nest_and_only_sampled_traces_are_exported(monkeypatch):
+    import pytest
+
+    import tracing
+
+    exported = []
+    monkeypatch.setattr(tracing._exporter, "submit", exported.append)
+    monkeypatch.setattr(tracing.settings, "trace_sample_rate", 1.0)
+
+    with pytest.raises(ValueError):
+        with tracing.start_span("request") as root:
+            with tracing.start_span("model.translate", pages=2) as child:
+                child.add("retries")
+                child.add("retries")
+            raise ValueError("bad page")
+    [spans] = exported
+    assert [span.name for span in spans] == ["model.translate", "request"]
+    assert child.parent_id == root.span_id and child.trace_id == root.trace_id
+    assert child.attributes == {"pages": 2, "retries": 2}
+    assert root.error == "ValueError: bad page"
+
+    otlp = tracing._to_otlp(spans)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert otlp[0]["parentSpanId"] == root.span_id and "parentSpanId" not in otlp[1]
+    assert otlp[1]["status"] == {"code": 2, "message": "ValueError: bad page"}
+
+    monkeypatch.setattr(tracing.settings, "trace_sample_rate", 0.0)
+    with tracing.start_span("request"):
+        with tracing.start_span("pdf.read") as span:
+            span.set(bytes=10)
+    assert len(exported) == 1 and span.attributes == {}
+
+
+def test_tracing_middleware_traces_the_request_and_response_stream(monkeypatch):
+    import tracing
+
+    exported = []
+    monkeypatch.setattr(tracing._exporter, "submit", exported.append)
+    monkeypatch.setattr(tracing.settings, "trace_sample_rate", 1.0)
+
+    response = client.get("/model-routing/stats/")
+    assert response.status_code == 200
+    [spans] = [spans for spans in exported if spans[-1].name == "GET /model-routing/stats/"]
+    root, stream = spans[-1], next(span for span in spans if span.name == "response.stream")
+    assert root.attributes["status_code"] == 200
+    assert stream.parent_id == root.span_id
+    assert stream.attributes["bytes"] == len(response.content)
+
+
+def test_parse_natural_khata_entries_falls_back_per_item(monkeypatch):
+    class Response:
+        def __init__(self, text):
+            self.text = text
+
+    async def fake_generate_content(client, endpoint, **kwargs):
+        if endpoint == "khata-batch":
+            # The second utterance is missing from the batch reply
+            return Response('[{"index": 0, "customer_name": "রানা ভাই", "amount": 1500, "entry_type": "দিলাম", "notes": null}]')
+        return Response('{"customer_name": "সবুজ", "amount": 192, "entry_type": "পেলাম", "notes": null}')
+
+    monkeypatch.setattr("main.gateway.generate_content", fake_generate_content)
+    response = client.post(
+        "/parse-natural-khata-entries/",
+        json={"inputs": ["রানা ভাইকে ১৫০০ টাকা দিলাম", "সবুজের থেকে ১৯২ টাকা পাইলাম"]},
+    )
+    assert response.status_code == 200
+    assert [entry["customer_name"] for entry in response.json()] == ["রানা ভাই", "সবুজ"]
+
+
+def test_truncated_replies_are_cut_back_to_their_last_complete_value():
+    import types
+
+    import pytest
+    from fastapi import HTTPException
+
+    from decoding import decode_json, decode_response, load_json, repair_json
+    from models import BookkeepingEntry, IndexedBookkeepingEntry
+
+    # A number, string or literal that was cut off is dropped, never closed
+    assert repair_json('{"notes": null, "amount": 1500') == '{"notes": null}'
+    assert repair_json('{"amount": 15') is None
+    assert repair_json('{"amount": 1500, "customer_name": "রানা') == '{"amount": 1500}'
+    assert repair_json('{"amount": 1500, "notes": nu') == '{"amount": 1500}'
+    assert repair_json('[{"index": 0}, {"index": 1, "amount": 12') == '[{"index": 0}, {"index": 1}]'
+
+    # The cut-off entry of a batch fails validation, so it goes to the per-item fallback
+    entry = '{"index": 0, "customer_name": "রানা ভাই", "amount": 1500, "entry_type": "দিলাম", "notes": null}'
+    items = load_json(f'[{entry}, {{"index": 1, "customer_name": "সবুজ", "amount": 19')
+    assert IndexedBookkeepingEntry.model_validate(items[0]).amount == 1500
+    with pytest.raises(ValueError):
+        IndexedBookkeepingEntry.model_validate(items[1])
+
+    # A single entry cut off in a field is an invalid reply (502), not a wrong one
+    for truncated in (
+        '{"customer_name": "রানা ভাই", "entry_type": "দিলাম", "notes": null, "amount": 15',
+        '{"amount": 1500, "entry_type": "দিলাম", "notes": null, "customer_name": "রা',
+    ):
+        with pytest.raises(HTTPException) as invalid:
+            decode_json(truncated, BookkeepingEntry)
+        assert invalid.value.status_code == 502
+    # Only a reply that is complete up to its closing brackets is repaired
+    complete = '{"customer_name": "রানা ভাই", "amount": 1500, "entry_type": "দিলাম", "notes": null'
+    assert decode_json(complete, BookkeepingEntry).amount == 1500
+
+    # The SDK's parsed reply is used when it is valid, and the text otherwise
+    parsed = BookkeepingEntry(customer_name="সবুজ", amount=192, entry_type="পেলাম", notes=None)
+    assert decode_response(types.SimpleNamespace(parsed=parsed, text=""), BookkeepingEntry) is parsed
+    response = types.SimpleNamespace(parsed={"amount": "many"}, text=parsed.model_dump_json())
+    assert decode_response(response, BookkeepingEntry) == parsed
+
+
+def test_registered_customer_list_matches_locally(tmp_path, monkeypatch):
+    from customer_index import CustomerIndex
+    monkeypatch.setattr("main.customer_index", CustomerIndex(str(tmp_path / "customers.sqlite")))
+
+    response = client.put("/khata-customers/shop-1", json={"customers": ["রানা ভাই", "করিম চাচা"]})
+    assert response.json() == {"shop_id": "shop-1", "version": 1}
+
+    response = client.patch(
+        "/khata-customers/shop-1",
+        json={"base_version": 1, "add": ["সবুজ"], "rename": [{"old": "করিম চাচা", "new": "করিম চাচা (দোকান)"}]},
+    )
+    assert response.json()["version"] == 2
+    assert client.patch("/khata-customers/shop-1", json={"base_version": 1, "add": ["x"]}).status_code == 409
+
+    response = client.post("/select-khata-customer/shop-1/", data={"input": "সবুজ"})
+    assert response.json() == {"selected_name": "সবুজ"}
+
+
+def test_voice_khata_entry_resolves_registered_and_inline_customer_lists(tmp_path, monkeypatch):
+    from customer_index import CustomerIndex
+    monkeypatch.setattr("main.customer_index", CustomerIndex(str(tmp_path / "customers.sqlite")))
+
+    class Response:
+        def __init__(self, text):
+            self.text = text
+
+    instructions = []
+
+    async def fake_generate_content(client, endpoint, **kwargs):
+        instructions.append(kwargs["config"]["system_instruction"])
+        name = "সবুজ" if "সবুজ" in kwargs["contents"] else "রানা ভাই"
+        return Response(json.dumps({
+            "entry": {"customer_name": name, "amount": 1500, "entry_type": "দিলাম", "notes": None},
+            "selection": {"selected_name": "রানা" if name == "রানা ভাই" else name},
+        }))
+
+    monkeypatch.setattr("main.gateway.generate_content", fake_generate_content)
+    client.put("/khata-customers/shop-voice", json={"customers": ["রানা ভাই", "করিম চাচা"]})
+
+    # The registered list is sent to the model, and a confident local match overrides its pick
+    response = client.post("/voice-khata-entry/", data={"input": "রানা ভাইকে ১৫০০ টাকা দিলাম", "shop_id": "shop-voice"})
+    assert response.status_code == 200
+    assert response.json()["entry"]["amount"] == 1500
+    assert response.json()["selection"] == {"selected_name": "রানা ভাই"}
+    assert "করিম চাচা" in instructions[-1]
+
+    # An inline list is sent as it is, and the model's pick is kept
+    response = client.post(
+        "/voice-khata-entry/", data={"input": "সবুজকে ১৫০০ টাকা দিলাম", "customer_list": "সবুজ\nমিঠু"}
+    )
+    assert response.status_code == 200
+    assert response.json()["selection"] == {"selected_name": "সবুজ"}
+    assert "মিঠু" in instructions[-1]
+
+    calls = len(instructions)
+    assert client.post("/voice-khata-entry/", data={"input": "রানা ভাইকে ১৫০০ টাকা দিলাম"}).status_code == 400
+    assert client.post("/voice-khata-entry/", data={"input": "x", "shop_id": "no-such-shop"}).status_code == 404
+    assert len(instructions) == calls
+
+
+def test_voice_socket_streams_info_desk_answer(monkeypatch):
+    class Chunk:
+        def __init__(self, text):
+            self.text = text
+
+    async def fake_generate_content_stream(client, endpoint, **kwargs):
+        for text in ['{"answer": "টালি', 'খাতা একটি \\"অ্যা', 'প\\"", "reference": 1, "image": null}']:
+            yield Chunk(text)
+
+    monkeypatch.setattr("main._precomputed_info_desk_reply", lambda input: None)
+    monkeypatch.setattr("main.gateway.generate_content_stream", fake_generate_content_stream)
+    with client.websocket_connect("/ws/voice/") as websocket:
+        websocket.send_json({"id": 1, "type": "info-desk", "input": "টালিখাতা কি?"})
+        messages = [websocket.receive_json() for _ in range(4)]
+
+    assert [m["type"] for m in messages] == ["partial", "partial", "partial", "result"]
+    assert "".join(m["delta"] for m in messages[:3]) == 'টালিখাতা একটি "অ্যাপ"'
+    assert messages[3]["data"]["answer"] == 'টালিখাতা একটি "অ্যাপ"'
+
+
+def test_information_desk_stream_sends_reply_last(monkeypatch):
+    monkeypatch.setattr(
+        "main._precomputed_info_desk_reply",
+        lambda input: {"answer": "টালিখাতা একটি অ্যাপ", "reference": 1, "image": None},
+    )
+    response = client.post("/information-desk/stream/", data={"input": "টালিখাতা কি?"})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    assert [lines[0] for lines in events] == ["event: answer", "event: reply"]
+    assert json.loads(events[1][1].removeprefix("data: "))["reference"] == 1
+
+
+def test_select_customer_shortlists_lists_over_token_budget(monkeypatch):
+    import gateway
+    prompts = []
+
+    class Response:
+        text = '{"selected_name": "রানা ভাই"}'
+
+    async def fake_generate_content(client, endpoint, expected_output_tokens=0, **kwargs):
+        gateway.check_budget(endpoint, kwargs, expected_output_tokens)
+        prompts.append(kwargs["config"]["system_instruction"])
+        return Response()
+
+    monkeypatch.setattr("main.gateway.generate_content", fake_generate_content)
+    names = [f"গ্রাহক নম্বর {i}" for i in range(3000)] + ["রানা ভাই"]
+    response = client.post("/select-khata-customer/", data={"input": "রানা ভাই", "customer_list": "\n".join(names)})
+    assert response.json() == {"selected_name": "রানা ভাই"}
+    assert len(prompts) == 1 and "রানা ভাই" in prompts[0] and "গ্রাহক নম্বর 2999" not in prompts[0]
+
+
+def test_khata_entry_escalates_incomplete_fast_tier_result(monkeypatch):
+    class Response:
+        def __init__(self, text):
+            self.text = text
+
+    models = []
+
+    async def fake_generate_content(client, endpoint, **kwargs):
+        models.append(kwargs["model"])
+        if kwargs["model"] == "gemini-2.0-flash-lite":
+            return Response('{"customer_name": "রানা ভাই", "amount": null, "entry_type": "দিলাম", "notes": null}')
+        return Response('{"customer_name": "রানা ভাই", "amount": 1500, "entry_type": "দিলাম", "notes": null}')
+
+    monkeypatch.setattr("main.gateway.generate_content", fake_generate_content)
+    response = client.post("/parse-natural-khata-entry/", data={"input": "রানা ভাইকে ১৫০০ টাকা দিলাম"})
+    assert response.json()["amount"] == 1500
+    assert models == ["gemini-2.0-flash-lite", "gemini-2.0-flash"]
+    assert client.get("/model-routing/stats/").json()["khata-entry"]["escalations"] >= 1
+
+
+def test_pipelined_upload_translates_parts_as_they_arrive(monkeypatch):
+    import fitz
+
+    translated = []
+
+    async def fake_translate_pdf_pages(content, filename, first_page, semaphore):
+        translated.append(first_page)
+        return ["page"]
+
+    monkeypatch.setattr("uploads.translate_pdf_pages", fake_translate_pdf_pages)
+    with fitz.open() as pdf:
+        pdf.new_page()
+        part = pdf.tobytes()
+
+    with TestClient(app) as upload_client:
+        upload_id = upload_client.post("/convert-case-file/uploads/", data={"filename": "case.pdf"}).json()["upload_id"]
+        response = upload_client.put(
+            f"/convert-case-file/uploads/{upload_id}/parts/0", files={"file": ("0.pdf", part, "application/pdf")}
+        )
+        assert response.status_code == 202
+        assert response.json()["pages"] == 1
+        # Translation starts before the upload is complete
+        response = upload_client.post(f"/convert-case-file/uploads/{upload_id}/complete", data={"parts": "2"})
+        assert response.status_code == 400
+    assert translated == [True]
+
+
+def test_resumable_upload_continues_at_the_received_offset(monkeypatch):
+    import fcntl
+    import hashlib
+
+    from fastapi.responses import Response
+
+    from resumable_uploads import resumable_uploads
+
+    converted = []
+
+    async def fake_convert_pdf(pdf_content, filename, page_count, pages, preview):
+        converted.append(pdf_content)
+        return Response(b"docx")
+
+    monkeypatch.setattr("main._convert_pdf", fake_convert_pdf)
+    monkeypatch.setattr("main._page_count", lambda pdf_content: 1)
+    content = b"%PDF-" + bytes(range(256)) * 4
+    status = client.post("/case-file-uploads/", data={"filename": "case.pdf", "size": len(content)}).json()
+    upload_id = status["upload_id"]
+
+    def put(first, last, checksum=None):
+        chunk = content[first:last + 1]
+        return client.put(f"/case-file-uploads/{upload_id}", content=chunk, headers={
+            "Content-Range": f"bytes {first}-{last}/{len(content)}",
+            "X-Chunk-SHA256": checksum or hashlib.sha256(chunk).hexdigest(),
+        })
+
+    assert put(0, 499).json()["offset"] == 500
+    # A corrupted chunk and a chunk past the offset leave the offset where it was
+    assert put(500, 899, checksum="0" * 64).status_code == 400
+    response = put(700, 899)
+    assert response.status_code == 409
+    assert response.headers["Upload-Offset"] == "500"
+    assert client.post(f"/convert-case-file/resumable/{upload_id}").status_code == 409
+    assert client.get(f"/case-file-uploads/{upload_id}").json()["offset"] == 500
+    # A chunk that arrives while another is being written is turned away
+    with open(resumable_uploads.spool_path(upload_id), "rb") as spool:
+        fcntl.flock(spool, fcntl.LOCK_EX)
+        assert put(500, len(content) - 1).status_code == 409
+    assert put(500, len(content) - 1).json()["offset"] == len(content)
+
+    assert client.post(f"/convert-case-file/resumable/{upload_id}").content == b"docx"
+    assert converted == [content]
+    assert client.delete(f"/case-file-uploads/{upload_id}").status_code == 204
+    assert client.get(f"/case-file-uploads/{upload_id}").status_code == 404
+
+
+def test_resubmitted_conversions_resume_from_their_checkpoints(tmp_path, monkeypatch):
+    from fastapi import HTTPException
+
+    from config import settings
+    from conversions import ConversionStore
+
+    translated, refined = [], []
+
+    async def fake_translate(pdf_content, filename, selection):
+        translated.append(filename)
+        return "# Draft"
+
+    async def fake_refine(english_markdown_draft, sample_content, job):
+        refined.append(english_markdown_draft)
+        if len(refined) == 1:
+            raise HTTPException(status_code=504, detail="The AI service did not respond in time.")
+        return "# Refined"
+
+    monkeypatch.setattr("main.translate_and_format_pdf_with_gemini", fake_translate)
+    monkeypatch.setattr("main.refine_english_markdown", fake_refine)
+    monkeypatch.setattr("main._page_count", lambda pdf_content: 1)
+    monkeypatch.setattr("main.conversion_store", ConversionStore(str(tmp_path / "conversions.sqlite")))
+    monkeypatch.setattr(settings, "trace_file", str(tmp_path / "traces.jsonl"))
+    files = {"file": ("case.pdf", b"%PDF-1.4 case file", "application/pdf")}
+
+    assert client.post("/convert-case-file/", files=files).status_code == 504
+    response = client.post("/convert-case-file/", files=files)
+    assert response.status_code == 200
+    # The draft was kept, so only the refinement ran again
+    assert translated == ["case.pdf"]
+    assert refined == ["# Draft", "# Draft"]
+    assert client.get(f"/convert-case-file/jobs/{response.headers['X-Conversion-Id']}").content == response.content
+
+
+def test_converted_files_are_named_safely_and_not_left_on_disk(tmp_path, monkeypatch):
+    import os
+    import secrets
+    import tempfile
+
+    from main import _docx_filename
+
+    assert _docx_filename("../../etc/case.pdf") == "case_Translated.docx"
+    assert _docx_filename("C:\\Users\\x\\মামলা.PDF") == "মামলা_Translated.docx"
+    assert _docx_filename("..") == "case_file_Translated.docx"
+
+    async def fake_translate(pdf_content, filename, selection):
+        return "# Draft"
+
+    async def fake_refine(english_markdown_draft, sample_content, job):
+        return english_markdown_draft
+
+    monkeypatch.setattr("main.translate_and_format_pdf_with_gemini", fake_translate)
+    monkeypatch.setattr("main.refine_english_markdown", fake_refine)
+    monkeypatch.setattr("main._page_count", lambda pdf_content: 1)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    files = {"file": ("../escape.pdf", b"%PDF-" + secrets.token_bytes(32), "application/pdf")}
+    response = client.post("/convert-case-file/", files=files)
+    assert response.status_code == 200
+    assert 'filename="escape_Translated.docx"' in response.headers["content-disposition"]
+    assert not os.path.exists(os.path.join(os.pardir, "escape_Translated.docx"))
+    assert os.listdir(tmp_path) == []
+
+
+def test_preview_continues_in_the_conversion_lane_and_abandoned_jobs_resume(tmp_path, monkeypatch):
+    import time
+
+    from contextlib import asynccontextmanager
+
+    from admission import CONVERSION, admission
+    from config import settings
+    from conversions import ConversionStore, job_id
+
+    held, lanes = [], []
+
+    class RecordingAdmission:
+        @asynccontextmanager
+        async def slot(self, lane):
+            async with admission.slot(lane):
+                held.append(lane)
+                try:
+                    yield
+                finally:
+                    held.remove(lane)
+
+    async def fake_translate(pdf_content, filename, selection):
+        if selection is None:
+            lanes.append(list(held))
+        return f"# Pages {selection}"
+
+    async def fake_refine(english_markdown_draft, sample_content, job):
+        return english_markdown_draft
+
+    monkeypatch.setattr("main.translate_and_format_pdf_with_gemini", fake_translate)
+    monkeypatch.setattr("main.refine_english_markdown", fake_refine)
+    monkeypatch.setattr("main._page_count", lambda pdf_content: 3)
+    monkeypatch.setattr("main.admission", RecordingAdmission())
+    conversion_store = ConversionStore(str(tmp_path / "conversions.sqlite"))
+    monkeypatch.setattr("main.conversion_store", conversion_store)
+    # Running jobs are touched every stale/3 seconds, idle ones are abandoned quickly
+    monkeypatch.setattr(settings, "conversion_stale_seconds", 0.3)
+
+    def wait_for(client, conversion_id):
+        for _ in range(100):
+            response = client.get(f"/convert-case-file/jobs/{conversion_id}")
+            if response.status_code != 202:
+                return response
+            time.sleep(0.05)
+        raise AssertionError(f"Conversion {conversion_id} did not finish.")
+
+    with TestClient(app) as client:
+        pdf = b"%PDF-1.4 previewed"
+        response = client.post(
+            "/convert-case-file/", files={"file": ("case.pdf", pdf, "application/pdf")}, data={"preview": "true"}
+        )
+        assert response.status_code == 200
+        assert wait_for(client, response.headers["X-Full-Conversion-Id"]).status_code == 200
+        # The full conversion held a conversion slot while it ran
+        assert lanes == [[CONVERSION]]
+
+        # After a restart, a background conversion resumes from its checkpoint...
+        pdf = b"%PDF-1.4 interrupted"
+        interrupted = conversion_store.start(job_id(pdf), "case.pdf")
+        interrupted.put("pdf", pdf)
+        interrupted.put("selection", "null")
+        # ...and any other abandoned conversion is reported as failed instead of running forever
+        abandoned = conversion_store.start(job_id(b"%PDF-1.4 abandoned"), "case.pdf")
+        time.sleep(0.5)
+        assert client.get(f"/convert-case-file/jobs/{interrupted.id}").status_code == 202
+        assert wait_for(client, interrupted.id).status_code == 200
+        assert client.get(f"/convert-case-file/jobs/{abandoned.id}").status_code == 500
+
+
+def test_converting_a_previewed_file_joins_its_running_background_conversion(tmp_path, monkeypatch):
+    import asyncio
+
+    from conversions import ConversionStore
+
+    full_translations = []
+
+    async def fake_translate(pdf_content, filename, selection):
+        if selection is None:
+            full_translations.append(filename)
+            # Still running when the plain conversion of the same file arrives
+            await asyncio.sleep(0.5)
+        return f"# Pages {selection}"
+
+    async def fake_refine(english_markdown_draft, sample_content, job):
+        return english_markdown_draft
+
+    monkeypatch.setattr("main.translate_and_format_pdf_with_gemini", fake_translate)
+    monkeypatch.setattr("main.refine_english_markdown", fake_refine)
+    monkeypatch.setattr("main._page_count", lambda pdf_content: 3)
+    monkeypatch.setattr("main.conversion_store", ConversionStore(str(tmp_path / "conversions.sqlite")))
+
+    with TestClient(app) as client:
+        files = {"file": ("case.pdf", b"%PDF-1.4 previewed then converted", "application/pdf")}
+        preview = client.post("/convert-case-file/", files=files, data={"preview": "true"})
+        assert preview.status_code == 200
+        response = client.post("/convert-case-file/", files=files)
+        assert response.status_code == 200
+        assert client.get(f"/convert-case-file/jobs/{preview.headers['X-Full-Conversion-Id']}").status_code == 200
+    # The plain conversion waited for the background one and reused its checkpoints
+    assert full_translations == ["case.pdf"]
+
+
+def test_markdown_edits_apply_bottom_up_and_reject_misplaced_edits():
+    import pytest
+    from markdown_edits import apply_edits
+    from models import MarkdownEdit
+
+    draft = "Here is the translation:\n# Warrant\nthe accused is to be arested.\nSigned"
+    edits = [
+        MarkdownEdit(start=1, end=1, original="Here is the translation:", replacement=""),
+        MarkdownEdit(start=3, end=3, original="the accused is to be arested. ", replacement="The accused is to be arrested."),
+    ]
+    assert apply_edits(draft, edits) == "# Warrant\nThe accused is to be arrested.\nSigned"
+
+    # A blank line is quoted as an empty string, which matches no other line
+    spaced = "# Warrant\n\n\nSigned"
+    assert apply_edits(spaced, [MarkdownEdit(start=3, end=3, original="", replacement="")]) == "# Warrant\n\nSigned"
+    for edit in (
+        MarkdownEdit(start=2, end=2, original="Signed", replacement=""),
+        MarkdownEdit(start=2, end=2, original="", replacement=""),
+        MarkdownEdit(start=3, end=3, original="the accused", replacement=""),
+    ):
+        with pytest.raises(ValueError):
+            apply_edits(draft, [edit])
+
+
+def test_table_masking_erases_rulings_but_keeps_cell_text():
+    import cv2
+    import fitz
+
+    from config import settings
+    from page_layout import _render, mask_page
+
+    with fitz.open() as pdf:
+        page = pdf.new_page(width=400, height=400)
+        for i in range(4):
+            page.draw_line((50, 50 + 100 * i), (350, 50 + 100 * i), width=1.5)
+            page.draw_line((50 + 100 * i, 50), (50 + 100 * i, 350), width=1.5)
+        for row in range(3):
+            for column in range(3):
+                page.insert_text((60 + 100 * column, 105 + 100 * row), "Cell", fontsize=18)
+        masked, share = mask_page(page)
+    assert masked is not None and share < 0.1
+
+    with fitz.open(stream=masked, filetype="pdf") as pdf:
+        gray = cv2.cvtColor(_render(pdf[0], settings.layout_render_dpi), cv2.COLOR_RGB2GRAY)
+    px = lambda points: int(points * settings.layout_render_dpi / 72)
+    # The top ruling is gone, the first cell's text is still there
+    assert (gray[px(50) - 3:px(50) + 3, px(60):px(340)] < 128).mean() == 0
+    assert (gray[px(85):px(110), px(60):px(100)] < 128).mean() > 0.05
+
+
+def test_revised_case_files_only_translate_their_changed_pages(tmp_path, monkeypatch):
+    import asyncio
+    import secrets
+
+    import fitz
+
+    import services
+    from page_cache import PageTranslationCache
+
+    def case_file(texts):
+        with fitz.open() as pdf:
+            for text in texts:
+                pdf.new_page().insert_text((72, 72), text, fontsize=14)
+            return pdf.tobytes(garbage=3)
+
+    calls = []
+
+    async def fake_translate_pdf(content, prompt, config, page_count, clean_text):
+        with fitz.open(stream=content, filetype="pdf") as pdf:
+            calls.append(pdf[0].get_text().strip())
+        return f"Translated {calls[-1]}"
+
+    monkeypatch.setattr("services.client", object())
+    monkeypatch.setattr("services.page_cache", PageTranslationCache(str(tmp_path / "pages.sqlite")))
+    monkeypatch.setattr("services._translate_pdf", fake_translate_pdf)
+    monkeypatch.setattr(services.settings, "layout_masking_enabled", False)
+
+    texts = [secrets.token_hex(8) for _ in range(3)]
+    assert asyncio.run(services.translate_pdf_pages(case_file(texts), "case.pdf")) == [
+        f"Translated {text}" for text in texts
+    ]
+    assert calls == texts
+
+    calls.clear()
+    texts[1] = secrets.token_hex(8)
+    translated = asyncio.run(services.translate_pdf_pages(case_file(texts), "case.pdf"))
+    assert calls == [texts[1]]
+    assert translated == [f"Translated {text}" for text in texts]
+
+
+def test_translation_memory_exact_fuzzy_hits_and_misses(tmp_path):
+    from translation_memory import TranslationMemory
+
+    memory = TranslationMemory(str(tmp_path / "memory.sqlite"), fuzzy_size=16, fuzzy_threshold=0.85)
+    source = "বিজ্ঞ মেট্রোপলিটন ম্যাজিস্ট্রেট আদালত, সিলেট। মামলা নং ৪৩২/২০২৩"
+    target = "Learned Metropolitan Magistrate Court, Sylhet. Case No. 432/2023"
+    assert memory.lookup([source]) == ({}, {})
+    memory.store([(source, target), ("১২", "12")])
+
+    exact, fuzzy = memory.lookup([
+        "বিজ্ঞ  মেট্রোপলিটন ম্যাজিস্ট্রেট আদালত,\nসিলেট। মামলা নং ৪৩২/২০২৩",
+        # Another case number: sent to the model, with the stored translation as a reference
+        "বিজ্ঞ মেট্রোপলিটন ম্যাজিস্ট্রেট আদালত, সিলেট। মামলা নং ৪৩৫/২০২৩",
+        "আসামীকে গ্রেফতার করে আদালতে হাজির করুন",
+        # Too short to be stored
+        "১২",
+    ])
+    assert exact == {0: target}
+    assert fuzzy == {1: (source, target)}
+    stats = memory.stats()
+    assert (stats["segments"], stats["exact_hits"], stats["fuzzy_hits"], stats["misses"]) == (1, 1, 1, 2)
+
+
+def test_english_pages_skip_translation_except_the_title_page(monkeypatch):
+    import asyncio
+    import secrets
+
+    import fitz
+
+    import services
+    from model_routing import is_english_text_page
+
+    text = (
+        "In the Court of the Chief Metropolitan Magistrate, Sylhet. This is the order of the court "
+        "in the case under section 307 of the Penal Code, and it was read to the accused at the police "
+        f"station on the date given above. Reference {secrets.token_hex(8)}."
+    )
+    with fitz.open() as pdf:
+        for _ in range(2):
+            pdf.new_page().insert_textbox(fitz.Rect(50, 50, 550, 400), text, fontsize=11)
+        # A scanned English page has no text layer, so it is not recognised as English
+        scanned = pdf.new_page()
+        scanned.insert_image(scanned.rect, pixmap=pdf[0].get_pixmap(dpi=72))
+        assert not is_english_text_page(scanned)
+        pdf.delete_page(2)
+        content = pdf.tobytes()
+
+    assert [page.english_markdown is None for page in services._split_pages(content)] == [True, False]
+    assert [page.english_markdown is None for page in services._split_pages(content, first_page=False)] == [False, False]
+
+    prompts = []
+
+    async def fake_translate_pdf(content, prompt, config, page_count, clean_text):
+        prompts.append(prompt)
+        return "# Order of the Court\n\nThe order."
+
+    monkeypatch.setattr("services.client", object())
+    monkeypatch.setattr("services._translate_pdf", fake_translate_pdf)
+    translated = asyncio.run(services.translate_pdf_pages(content, "order.pdf"))
+    # The first page is still translated, so that the document keeps its title
+    assert [prompt.startswith(services.FIRST_PAGE_PROMPT) for prompt in prompts] == [True]
+    assert translated[0].startswith("# Order of the Court")
+    assert translated[1].startswith("In the Court of the Chief Metropolitan Magistrate")
+
+
+def test_legal_glossary_normalizes_variants_outside_fenced_blocks():
+    from legal_glossary import legal_glossary
+
+    markdown = "To the officer in charge, Kotwali Thana.\n```\nofficer in charge\n```\n**GR CASE**"
+    assert legal_glossary.normalize(markdown) == (
+        "To the Officer-in-Charge, Kotwali Police Station.\n```\nofficer in charge\n```\n**G.R. CASE**"
+    )
+
+
+def _fake_genai_client(generate_content=None, generate_content_stream=None):
+    import types
+
+    models = types.SimpleNamespace(generate_content=generate_content, generate_content_stream=generate_content_stream)
+    return types.SimpleNamespace(aio=types.SimpleNamespace(models=models))
+
+
+def test_gateway_retries_retryable_errors(monkeypatch):
+    import asyncio
+
+    from google.genai import errors
+
+    import gateway
+
+    calls = []
+
+    async def generate_content(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise errors.APIError(503, {})
+        return "reply"
+
+    monkeypatch.setattr(gateway, "_backoff", lambda attempt: 0)
+    monkeypatch.setattr(gateway, "_record_estimate", lambda *args: None)
+    client = _fake_genai_client(generate_content)
+    assert asyncio.run(gateway.generate_content(client, "translate", model="test-retry", contents="x")) == "reply"
+    assert len(calls) == 2
+
+
+def test_identical_calls_share_one_upstream_call_and_cacheable_replies_are_reused(monkeypatch):
+    import asyncio
+
+    from cachetools import TTLCache
+
+    import gateway
+    from singleflight import request_key
+
+    import unicodedata
+
+    # Composed and decomposed forms of the same text share a key...
+    assert request_key(contents=["কোর্ট"]) == request_key(contents=[unicodedata.normalize("NFD", "কোর্ট")])
+    # ...but line breaks and case can change a prompt's meaning, so they do not
+    customers = "Customers:\nরানা\nভাই"
+    assert request_key(config={"system_instruction": customers}) != request_key(
+        config={"system_instruction": "Customers:\nরানা ভাই"}
+    )
+    assert request_key(contents=["Rana Bhai"]) != request_key(contents=["rana bhai"])
+    assert request_key(contents=["রানা ভাই"]) != request_key(contents=["করিম চাচা"])
+
+    calls = []
+
+    async def generate_content(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.05)
+        return f"reply {len(calls)}"
+
+    monkeypatch.setattr(gateway, "_response_cache", TTLCache(maxsize=10, ttl=60))
+    monkeypatch.setattr(gateway.settings, "hedge_enabled", False)
+    monkeypatch.setattr(gateway, "_record_estimate", lambda *args: None)
+    client = _fake_genai_client(generate_content)
+
+    async def call(endpoint):
+        return await gateway.generate_content(client, endpoint, model="test-singleflight", contents="500 dilam")
+
+    async def concurrently(endpoint):
+        return await asyncio.gather(call(endpoint), call(endpoint))
+
+    # Concurrent identical calls are coalesced, and a cacheable reply is reused afterwards
+    assert asyncio.run(concurrently("khata-entry")) == ["reply 1", "reply 1"]
+    assert asyncio.run(call("khata-entry")) == "reply 1"
+    assert len(calls) == 1
+    # Translations are coalesced too, but not cached
+    assert asyncio.run(concurrently("translate")) == ["reply 2", "reply 2"]
+    assert asyncio.run(call("translate")) == "reply 3"
+
+
+def test_token_budgets_reject_oversized_requests_before_they_are_sent(monkeypatch):
+    import asyncio
+
+    import pytest
+
+    import gateway
+    from token_budget import TokenEstimator, estimate_text_tokens
+
+    assert estimate_text_tokens("a" * 400) == 101
+    assert estimate_text_tokens("টাকা" * 100) == 201
+
+    estimator = TokenEstimator(smoothing=0.5)
+    monkeypatch.setattr(gateway, "token_estimates", estimator)
+    calls = []
+
+    async def generate_content(**kwargs):
+        calls.append(kwargs)
+        return "reply"
+
+    client = _fake_genai_client(generate_content)
+    with pytest.raises(gateway.BudgetExceeded) as exceeded:
+        asyncio.run(gateway.generate_content(client, "khata-entry", model="test-budget", contents="a" * 20000))
+    assert (exceeded.value.status_code, exceeded.value.kind) == (413, "input")
+    with pytest.raises(gateway.BudgetExceeded) as exceeded:
+        gateway.check_budget("select-customer", {"contents": "a"}, expected_output_tokens=65)
+    assert exceeded.value.kind == "output"
+    assert calls == []
+
+    # Estimates are scaled by the reported prompt tokens, within bounds
+    assert gateway.check_budget("khata-entry", {"contents": "a" * 12000}) == 3001
+    estimator.observe("khata-entry", 1000, 1500)
+    assert estimator.calibrated("khata-entry", 1000) == 1500
+    with pytest.raises(gateway.BudgetExceeded):
+        gateway.check_budget("khata-entry", {"contents": "a" * 12000})
+    estimator.observe("info-desk", 1000, 100000)
+    assert estimator.calibrated("info-desk", 1000) == 4000
+
+
+def test_model_router_escalates_unconfident_and_invalid_results():
+    import asyncio
+
+    import pytest
+    from fastapi import HTTPException
+
+    from config import settings
+    from model_routing import ModelRouter, is_easy_utterance
+
+    assert is_easy_utterance("রানা ভাইকে ১৫০০ টাকা দিলাম")
+    assert not is_easy_utterance("রানা ভাইকে টাকা দিলাম")
+
+    router = ModelRouter()
+    replies = {}
+    models = []
+
+    async def request(model):
+        models.append(model)
+        return replies[model]
+
+    def decode(reply):
+        if reply == "invalid":
+            raise HTTPException(status_code=502, detail="Schema mismatch")
+        return reply
+
+    def route(easy):
+        models.clear()
+        return asyncio.run(router.generate("khata", easy, request, decode, lambda result: result != "unsure"))
+
+    replies = {settings.model_fast: "sure", settings.model_standard: "standard"}
+    assert route(easy=True) == "sure" and models == [settings.model_fast]
+    assert route(easy=False) == "standard" and models == [settings.model_standard]
+    replies[settings.model_fast] = "unsure"
+    assert route(easy=True) == "standard" and models == [settings.model_fast, settings.model_standard]
+    replies[settings.model_fast] = "invalid"
+    assert route(easy=True) == "standard" and models == [settings.model_fast, settings.model_standard]
+    # The last rung's result is returned as it is, and its errors are raised
+    replies[settings.model_standard] = "unsure"
+    assert route(easy=True) == "unsure"
+    replies[settings.model_standard] = "invalid"
+    with pytest.raises(HTTPException):
+        route(easy=False)
+
+    stats = router.stats()["khata"]
+    assert (stats["calls"], stats["escalations"]) == (5, 3)
+    assert stats["models"][settings.model_fast]["calls"] == 4
+
+
+def test_circuit_breaker_opens_and_releases_an_abandoned_half_open_trial(monkeypatch):
+    import asyncio
+
+    import pytest
+    from fastapi import HTTPException
+    from google.genai import errors
+
+    import gateway
+
+    healthy = False
+    calls = []
+
+    async def generate_content(**kwargs):
+        calls.append(kwargs)
+        if not healthy:
+            raise errors.APIError(503, {})
+        await asyncio.sleep(0.2)
+        return "reply"
+
+    async def generate_content_stream(**kwargs):
+        async def chunks():
+            yield "first"
+            yield "second"
+        return chunks()
+
+    breaker = gateway.CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    monkeypatch.setitem(gateway._breakers, "test-breaker", breaker)
+    monkeypatch.setattr(gateway, "_backoff", lambda attempt: 0)
+    monkeypatch.setattr(gateway, "_record_estimate", lambda *args: None)
+    client = _fake_genai_client(generate_content, generate_content_stream)
+
+    def call():
+        return gateway.generate_content(client, "translate", model="test-breaker", contents=f"x{len(calls)}")
+
+    with pytest.raises(HTTPException) as failed:
+        asyncio.run(call())
+    assert failed.value.status_code == 503 and breaker.opened_at is not None
+    # Open: fails fast without calling the model
+    attempts = len(calls)
+    with pytest.raises(HTTPException):
+        asyncio.run(call())
+    assert len(calls) == attempts
+
+    # Half-open: a trial stream closed after its first chunk, and a cancelled trial
+    # call, give the trial back instead of keeping the circuit open
+    breaker.reset_seconds = 0
+    healthy = True
+
+    async def abandon_stream():
+        stream = gateway.generate_content_stream(client, "info-desk", model="test-breaker", contents="y")
+        assert await stream.__anext__() == "first"
+        assert breaker.trial_in_flight
+        await stream.aclose()
+
+    asyncio.run(abandon_stream())
+    assert not breaker.trial_in_flight
+
+    async def cancel_call():
+        task = asyncio.ensure_future(call())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_call())
+    assert not breaker.trial_in_flight
+
+    # A successful trial closes the circuit
+    assert asyncio.run(call()) == "reply"
+    assert breaker.opened_at is None
+
+
+def test_conversion_deadlines_fit_the_worker_timeout():
+    import re
+
+    import gateway
+
+    with open("Procfile") as f:
+        timeout = int(re.search(r"--timeout (\d+)", f.read()).group(1))
+    assert gateway.POLICIES["translate"].deadline + gateway.POLICIES["refine"].deadline < timeout
+
+
+def test_canonical_answers_serve_confident_matches_built_from_the_current_reference(tmp_path):
+    from canonical_answers import CanonicalAnswers, _digest
+
+    references = {
+        1: "## টালিখাতা কি?\nটালিখাতা একটি ডিজিটাল হিসাবের খাতা।",
+        2: "## কিভাবে বাকি আদায় করব?\nতাগাদা পাঠান।",
+        3: "## পাসওয়ার্ড কিভাবে বদলাব?\nসেটিংসে যান।",
+    }
+    answers_path = tmp_path / "canonical_answers.json"
+    answers_path.write_text(json.dumps([
+        {"reference_hash": _digest(references[1]), "question": "টালিখাতা কি?", "reply": {"reference": 1, "answer": "a1"}},
+        # Built before reference 2 was edited
+        {"reference_hash": _digest("## কিভাবে বাকি আদায় করব?"), "question": "", "reply": {"reference": 2, "answer": "a2"}},
+    ]), encoding="utf-8")
+    canonical = CanonicalAnswers(threshold=0.85, margin=0.1)
+    canonical.load(references, str(answers_path))
+
+    assert canonical.answer("টালিখাতা কি") == {"reference": 1, "answer": "a1"}
+    # Classified, but the stored answer is stale or missing
+    assert canonical.classify("কিভাবে বাকি আদায় করব?")[0] == 2
+    assert canonical.answer("কিভাবে বাকি আদায় করব?") is None
+    assert canonical.answer("পাসওয়ার্ড কিভাবে বদলাব") is None
+    # Not close to any heading
+    assert canonical.classify("আজকের আবহাওয়া কেমন?")[0] is None
+
+
+def test_knowledge_base_reloads_edits_and_searches_the_new_version(tmp_path, monkeypatch):
+    from config import settings
+    from knowledge_base import KnowledgeBase
+
+    monkeypatch.setattr(settings, "knowledge_reload_interval", 0)
+    path = tmp_path / "knowledge_base.json"
+
+    def write(references, mtime):
+        path.write_text(json.dumps({"references": references}), encoding="utf-8")
+        # The reload is keyed on the modification time, which may not tick between quick writes
+        os.utime(path, (mtime, mtime))
+
+    write([{"id": 1, "heading": "টালিখাতা কি?", "body": "টালিখাতা একটি ডিজিটাল হিসাবের খাতা।"}], 1_000_000)
+    knowledge = KnowledgeBase(str(path))
+    reloads = []
+    knowledge.on_reload(lambda references: reloads.append(sorted(references)))
+    version = knowledge.version
+    assert [reference.id for reference in knowledge.search("ডিজিটাল খাতা")] == [1]
+    assert knowledge.search("পাসওয়ার্ড") == []
+
+    write([
+        {"id": 1, "heading": "টালিখাতা কি?", "body": "টালিখাতা একটি ডিজিটাল হিসাবের খাতা।"},
+        {"id": 2, "heading": "পাসওয়ার্ড কিভাবে বদলাব?", "body": "সেটিংসে গিয়ে পাসওয়ার্ড বদলান।"},
+    ], 1_000_100)
+    assert [reference.id for reference in knowledge.search("পাসওয়ার্ড বদলাব")] == [2]
+    assert knowledge.version != version
+    assert "[[reference:2]]" in knowledge.prompt()
+    assert reloads == [[1], [1, 2]]
+
+    # A broken edit keeps the previous version in service
+    path.write_text("{", encoding="utf-8")
+    os.utime(path, (1_000_200, 1_000_200))
+    assert knowledge.get(2).heading == "পাসওয়ার্ড কিভাবে বদলাব?"
+    assert reloads == [[1], [1, 2]]
+
+
+def test_semantic_cache_matches_paraphrases_but_not_other_intents():
+    from config import settings
+    from knowledge_base import info_desk_knowledge
+    from semantic_cache import SemanticCache
+
+    cache = SemanticCache(16, settings.semantic_cache_threshold, settings.semantic_cache_margin)
+    cache.load_references(info_desk_knowledge.references())
+    cache.store("বাকির কাস্টমার কীভাবে যোগ করবো?", {"answer": "add", "reference": 3})
+    cache.store("মোবাইল রিচার্জ কিভাবে করব", {"answer": "recharge", "reference": 44})
+
+    assert cache.lookup("কিভাবে নতুন কাস্টমার এড করব") == {"answer": "add", "reference": 3}
+    assert cache.lookup("কিভাবে মোবাইল রিচার্জ করবো?") == {"answer": "recharge", "reference": 44}
+    # "How do I cancel a recharge" shares most n-grams with "how do I recharge"
+    assert cache.lookup("মোবাইল রিচার্জ কিভাবে বাতিল করব") is None
+    assert cache.lookup("মোবাইল রিচার্জ হয় না") is None
+
+
+def test_admission_rejections_carry_cors_headers_and_skip_preflights(monkeypatch):
+    import admission
+
+    monkeypatch.setattr(admission.RateLimiter, "take", lambda self, tenant: 5.0)
+    origin = {"Origin": "https://example.com"}
+    response = client.post("/information-desk/", data={"input": "x"}, headers=origin)
+    assert response.status_code == 429
+    assert response.headers["access-control-allow-origin"]
+    preflight = client.options(
+        "/information-desk/", headers={**origin, "Access-Control-Request-Method": "POST"}
+    )
+    assert preflight.status_code == 200
+    # Not admission controlled
+    assert client.get("/convert-case-file/jobs/unknown").status_code == 404
+
+
+def test_admission_tenants_and_lanes(monkeypatch):
+    import admission
+    from config import settings
+
+    monkeypatch.setattr(settings, "tenant_api_keys", {"shop-key"})
+    monkeypatch.setattr(settings, "trusted_proxy_hops", 1)
+
+    def scope(*headers):
+        return {"client": ("10.0.0.1", 1234), "headers": [(k.encode(), v.encode()) for k, v in headers]}
+
+    # Unknown keys and self-declared tenant ids do not get a bucket of their own
+    assert admission.tenant(scope(("x-api-key", "made-up"), ("x-forwarded-for", "203.0.113.7"))) == "ip:203.0.113.7"
+    assert admission.tenant(scope(("x-tenant-id", "other"), ("x-forwarded-for", "203.0.113.7"))) == "ip:203.0.113.7"
+    assert admission.tenant(scope(("x-api-key", "shop-key"))) == "key:shop-key"
+    # Entries left of the one the proxy added come from the client
+    assert admission.tenant(scope(("x-forwarded-for", "1.1.1.1, 203.0.113.7"))) == "ip:203.0.113.7"
+    monkeypatch.setattr(settings, "trusted_proxy_hops", 0)
+    assert admission.tenant(scope(("x-forwarded-for", "203.0.113.7"))) == "ip:10.0.0.1"
+
+    assert admission.lane_for("/convert-case-file/") is admission.CONVERSION
+    assert admission.lane_for("/convert-case-file/resumable/abc") is admission.CONVERSION
+    assert admission.lane_for("/select-khata-customer/shop-1/") is admission.INTERACTIVE
+    assert admission.lane_for("/convert-case-file/jobs/abc") is None
+    assert admission.lane_for("/convert-case-file/uploads/abc/parts/0") is None
+
+
+def test_voice_socket_admits_each_message_and_caps_handlers(monkeypatch):
+    import asyncio
+
+    import admission
+    from config import settings
+
+    running, peak = 0, 0
+
+    async def fake_handle_voice_request(request, send):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        await send({"id": request.id, "type": "result", "data": None})
+
+    monkeypatch.setattr("main._handle_voice_request", fake_handle_voice_request)
+    monkeypatch.setattr(settings, "ws_max_concurrency", 1)
+    with client.websocket_connect("/ws/voice/") as websocket:
+        for i in range(3):
+            websocket.send_json({"id": i, "type": "khata-entry", "input": "x"})
+        assert [websocket.receive_json()["id"] for _ in range(3)] == [0, 1, 2]
+    assert peak == 1
+
+    monkeypatch.setattr(admission.RateLimiter, "take", lambda self, tenant: 5.0)
+    with client.websocket_connect("/ws/voice/") as websocket:
+        websocket.send_json({"id": 9, "type": "khata-entry", "input": "x"})
+        message = websocket.receive_json()
+    assert message["status"] == 429 and message["retry_after"] == 5
@@ -0,0 +1,38 @@
+"""
+Line edits to a Markdown document, for refinement replies that list fixes instead of
+repeating the whole document.
+
+The model sees the draft with numbered lines and returns edits that replace a range
+of lines (an empty replacement deletes them). Each edit quotes the whole first line it
+replaces, so an edit aimed at the wrong line is caught instead of applied.
+"""
+from models import MarkdownEdit
+
+
+def number_lines(text: str) -> str:
+    """Prefixes every line with its 1-based number, as the edits refer to them."""
+    return "\n".join(f"{number}| {line}" for number, line in enumerate(text.split("\n"), 1))
+
+
+def apply_edits(text: str, edits: list[MarkdownEdit]) -> str:
+    """
+    Applies line edits to a text.
+
+    Raises:
+        ValueError: An edit is out of range, overlaps another one, or its `original`
+            does not match the line it replaces.
+    """
+    lines = text.split("\n")
+    previous_start = len(lines) + 1
+    # Applied from the bottom up, so the line numbers of the edits above stay valid
+    for edit in sorted(edits, key=lambda edit: edit.start, reverse=True):
+        if not 1 <= edit.start <= edit.end <= len(lines):
+            raise ValueError(f"Edit of lines {edit.start}-{edit.end} is outside lines 1-{len(lines)}.")
+        if edit.end >= previous_start:
+            raise ValueError(f"Edit of lines {edit.start}-{edit.end} overlaps another edit.")
+        # Compared as a whole, so that an empty quote only matches a blank line
+        if edit.original.strip() != lines[edit.start - 1].strip():
+            raise ValueError(f"Edit of line {edit.start} quotes a different line: {edit.original!r}.")
+        lines[edit.start - 1:edit.end] = edit.replacement.split("\n") if edit.replacement else []
+        previous_start = edit.start
+    return "\n".join(lines)
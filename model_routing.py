@@ -0,0 +1,188 @@
+"""
+Routing of model calls between a cheaper, faster tier and a stronger one.
+
+Each route has a ladder of models. Inputs that look easy start on the first rung; the
+rest start on the second, which is the model the route used before routing existed.
+A result that fails to decode or that a local validator flags as low-confidence is
+retried on the next rung.
+"""
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+
+from fastapi import HTTPException
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# USD per million (input, output) tokens, for the cost estimates in the stats
+PRICES = {
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+}
+
+_BANGLA_LETTER = re.compile(r"[ঀ-৿]")
+_LETTER = re.compile(r"[^\W\d_]")
+_FENCED_BLOCK = re.compile(r"```.*?```", re.DOTALL)
+_DIGIT = re.compile(r"[0-9০-৯]")
+_WORD = re.compile(r"[A-Za-z]+")
+
+# Common English words; Bangla set in legacy (ANSI) fonts extracts as Latin letters but
+# hardly ever spells these
+_ENGLISH_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have he in is it its of on or that the this "
+    "to was were which with under no date court police station case section".split()
+)
+_MIN_STOPWORD_SHARE = 0.08
+
+
+def ladder(route: str) -> list[str]:
+    if route == "translate":
+        return [settings.model_standard, settings.model_strong]
+    return [settings.model_fast, settings.model_standard]
+
+
+# --- Difficulty and Confidence Checks ---
+
+def is_easy_utterance(text: str) -> bool:
+    """A short single-line utterance that mentions an amount."""
+    text = text.strip()
+    return len(text) <= settings.routing_easy_max_chars and "\n" not in text and bool(_DIGIT.search(text))
+
+
+def bangla_share(text: str) -> float:
+    """The share of the letters in the text that are Bangla."""
+    letters = len(_LETTER.findall(text))
+    return len(_BANGLA_LETTER.findall(text)) / letters if letters else 0.0
+
+
+def is_clean_text_page(page) -> bool:
+    """
+    Whether a fitz page has a Unicode Bangla text layer, i.e. it is generated rather
+    than scanned (or set in a legacy font whose extracted text is garbled).
+    """
+    text = page.get_text()
+    return len(text.strip()) >= settings.routing_min_page_chars and bangla_share(text) >= 0.5
+
+
+def is_english_text_page(page) -> bool:
+    """
+    Whether a fitz page already reads as English from its text layer: enough text,
+    next to no Bangla (the stamps on an English form are allowed), and English words
+    rather than the Latin-letter garble that legacy Bangla fonts extract as.
+
+    Only the text layer is checked: scanned pages have none, so an English page that
+    was scanned is not recognised and is translated like any other.
+    """
+    text = page.get_text()
+    if len(text.strip()) < settings.routing_min_page_chars or has_untranslated_text(text):
+        return False
+    words = [word.lower() for word in _WORD.findall(text)]
+    return bool(words) and sum(word in _ENGLISH_STOPWORDS for word in words) / len(words) >= _MIN_STOPWORD_SHARE
+
+
+def has_untranslated_text(markdown: str) -> bool:
+    """
+    Whether a translation still contains Bangla prose. Fenced blocks, where the
+    translation quotes stamps and seals verbatim, are not counted.
+    """
+    return bangla_share(_FENCED_BLOCK.sub("", markdown)) > settings.routing_max_bangla_share
+
+
+# --- Router ---
+
+@dataclass
+class _RouteStats:
+    calls: int = 0
+    escalations: int = 0
+    # Per model: [calls, total seconds, total cost in USD]
+    models: dict[str, list] = field(default_factory=dict)
+
+
+class ModelRouter:
+    """Runs calls along a route's model ladder and keeps latency, cost and escalation stats."""
+
+    def __init__(self):
+        self._stats: dict[str, _RouteStats] = {}
+        self._lock = threading.Lock()
+
+    async def generate(self, route: str, easy: bool, request, decode, confident):
+        """
+        Args:
+            route: Ladder name (see `ladder`), also the key of the stats.
+            easy: Whether to start on the cheap rung.
+            request: `async request(model) -> response` making the model call.
+            decode: `decode(response) -> result`; an HTTPException here counts as a schema failure.
+            confident: `confident(result) -> bool`; False escalates to the next rung.
+
+        Returns:
+            The result of the first confident rung, or of the last rung tried.
+        """
+        models = ladder(route)
+        start = 0 if easy and settings.model_routing_enabled else 1
+        escalated = False
+        result = None
+        for rung, model in enumerate(models[start:], start):
+            last = rung == len(models) - 1 or not settings.model_routing_enabled
+            started = time.monotonic()
+            try:
+                response = await request(model)
+                result = decode(response)
+            except HTTPException as e:
+                # 502: the reply did not match the schema or the model rejected the request
+                if last or e.status_code != 502:
+                    raise
+                self._record(route, model, time.monotonic() - started, None)
+                logger.info(f"Escalating '{route}' from {model}: {e.detail}")
+                escalated = True
+                continue
+            self._record(route, model, time.monotonic() - started, response)
+            if last or confident(result):
+                break
+            logger.info(f"Escalating '{route}' from {model}: low-confidence result.")
+            escalated = True
+
+        with self._lock:
+            stats = self._stats.setdefault(route, _RouteStats())
+            stats.calls += 1
+            stats.escalations += escalated
+        return result
+
+    def _record(self, route: str, model: str, seconds: float, response):
+        usage = getattr(response, "usage_metadata", None)
+        cost = 0.0
+        if usage is not None:
+            input_price, output_price = PRICES.get(model, (0.0, 0.0))
+            cost = ((usage.prompt_token_count or 0) * input_price
+                    + (usage.candidates_token_count or 0) * output_price) / 1_000_000
+        with self._lock:
+            totals = self._stats.setdefault(route, _RouteStats()).models.setdefault(model, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += cost
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                route: {
+                    "calls": stats.calls,
+                    "escalations": stats.escalations,
+                    "escalation_rate": stats.escalations / stats.calls if stats.calls else 0.0,
+                    "models": {
+                        model: {
+                            "calls": calls,
+                            "mean_latency_ms": round(seconds / calls * 1000, 1),
+                            "cost_usd": round(cost, 6),
+                        }
+                        for model, (calls, seconds, cost) in stats.models.items()
+                    },
+                }
+                for route, stats in self._stats.items()
+            }
+
+
+model_router = ModelRouter()
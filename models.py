@@ -1,4 +1,5 @@
 import enum
+from typing import Literal
 from pydantic import BaseModel
 
 class EntryType(enum.Enum):
@@ -11,6 +12,12 @@ class BookkeepingEntry(BaseModel):
   entry_type: EntryType | None
   notes: str | None
 
+class IndexedBookkeepingEntry(BookkeepingEntry):
+  index: int
+
+class KhataEntryBatch(BaseModel):
+  inputs: list[str]
+
 class InfoDeskReply(BaseModel):
   answer: str | None
   reference: int | None
@@ -18,3 +25,79 @@ class InfoDeskReply(BaseModel):
 
 class CustomerSelection(BaseModel):
   selected_name: str | None
+
+class VoiceKhataEntry(BaseModel):
+  entry: BookkeepingEntry
+  selection: CustomerSelection
+
+class CustomerListRegistration(BaseModel):
+  customers: list[str]
+
+class CustomerRename(BaseModel):
+  old: str
+  new: str
+
+class CustomerListDelta(BaseModel):
+  base_version: int | None = None
+  add: list[str] = []
+  remove: list[str] = []
+  rename: list[CustomerRename] = []
+
+class CustomerListVersion(BaseModel):
+  shop_id: str
+  version: int
+
+class KnowledgeReference(BaseModel):
+  id: int
+  heading: str
+  body: str
+  images: list[str] = []
+  links: list[str] = []
+
+class VoiceSocketRequest(BaseModel):
+  id: str | int
+  type: Literal["khata-entry", "customer-selection", "voice-khata-entry", "info-desk"]
+  input: str
+  shop_id: str | None = None
+  customer_list: str | None = None
+  version: int | None = None
+
+class ConversionUpload(BaseModel):
+  upload_id: str
+
+class ConversionUploadPart(BaseModel):
+  upload_id: str
+  index: int
+  pages: int
+
+class ResumableUploadStatus(BaseModel):
+  upload_id: str
+  size: int
+  offset: int
+  chunk_bytes: int
+
+class ConversionStatus(BaseModel):
+  job_id: str
+  stage: str
+
+class MarkdownEdit(BaseModel):
+  start: int
+  end: int
+  original: str
+  replacement: str
+
+class MarkdownEditList(BaseModel):
+  edits: list[MarkdownEdit]
+
+class SegmentTranslation(BaseModel):
+  index: int
+  english: str
+
+class PageSegmentTranslation(BaseModel):
+  title: str | None = None
+  segments: list[SegmentTranslation]
+
+class GlossaryTerm(BaseModel):
+  bangla: list[str]
+  english: str
+  variants: list[str] = []
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+import fitz
+import numpy as np
+
+from config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_translation (
+    key TEXT PRIMARY KEY,
+    markdown TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS page_translation_used_at ON page_translation (used_at);
+"""
+
+# Pages are rendered at this scale (72 dpi * 0.5) and averaged into a grid of blocks
+_RENDER_SCALE = 0.5
+_GRID = 64
+_LEVELS = 16
+
+
+def _image_hash(page: fitz.Page) -> str:
+    """
+    Perceptual hash of the rendered page: the mean grey level of each block of a
+    64x64 grid, quantized to 16 levels. Re-encoding or re-saving the PDF leaves it
+    unchanged, while an edited word changes the blocks it covers.
+    """
+    pixmap = page.get_pixmap(matrix=fitz.Matrix(_RENDER_SCALE, _RENDER_SCALE), colorspace=fitz.csGRAY, alpha=False)
+    pixels = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(pixmap.height, pixmap.stride)[:, :pixmap.width]
+    grid = min(_GRID, pixmap.height, pixmap.width)
+    height, width = pixmap.height // grid * grid, pixmap.width // grid * grid
+    blocks = pixels[:height, :width].reshape(grid, height // grid, grid, width // grid).mean(axis=(1, 3))
+    quantized = (blocks * _LEVELS / 256).astype(np.uint8)
+    return hashlib.sha256(quantized.tobytes()).hexdigest()[:32]
+
+
+def page_fingerprint(page: fitz.Page) -> str:
+    """Identifies a page by its rendered image and its text layer."""
+    text = " ".join(page.get_text().split())
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+    return f"{_image_hash(page)}-{text_hash}"
+
+
+class PageTranslationCache:
+    """
+    Translated Markdown per PDF page, keyed by the page fingerprint and the prompt it
+    was translated with, so a revised case file only re-translates its changed pages.
+    Stored in SQLite so that all workers (and restarts) share it; the least recently
+    used entries beyond `page_cache_max_entries` are dropped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def key(fingerprint: str, *prompt: str) -> str:
+        """The cache key of a page translated with the given instructions."""
+        return hashlib.sha256("\0".join((fingerprint, *prompt)).encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """Returns the cached Markdown of the keys that are present."""
+        if not keys:
+            return {}
+        found = {}
+        with self._connect() as db:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                found.update(db.execute(
+                    f"SELECT key, markdown FROM page_translation WHERE key IN ({placeholders})", batch
+                ).fetchall())
+            if found:
+                db.executemany(
+                    "UPDATE page_translation SET used_at = ? WHERE key = ?", [(time.time(), k) for k in found]
+                )
+        return found
+
+    def put(self, key: str, markdown: str):
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO page_translation (key, markdown, used_at) VALUES (?, ?, ?)",
+                (key, markdown, time.time()),
+            )
+            db.execute(
+                "DELETE FROM page_translation WHERE key IN ("
+                "SELECT key FROM page_translation ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (settings.page_cache_max_entries,),
+            )
+
+
+page_cache = PageTranslationCache(os.path.join(settings.data_dir, "page_translations.sqlite"))
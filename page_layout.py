@@ -0,0 +1,126 @@
+"""
+Masking of stamps, seals and ruled tables on scanned pages before they are translated.
+
+The translation prompt asks the model to ignore stamps and tables, but they are still
+uploaded, and the model often transcribes them anyway. Scanned pages are rasterized and
+the regions are found with OpenCV and NumPy, then painted white:
+
+- stamps: compact blobs of coloured ink (court-fee stamps, rubber stamps); elongated
+  coloured strokes such as handwritten dates and signatures are kept;
+- seals: circles, also in black on photocopies;
+- tables: the ruled lines of grids, found by morphological opening with long kernels;
+  the text in the cells is kept, since it is part of the document.
+
+Pages with a usable text layer are not masked, since rasterizing them would drop it.
+"""
+import cv2
+import fitz
+import numpy as np
+
+from config import settings
+
+# Saturation and brightness above which a pixel counts as coloured ink rather than paper
+_INK_SATURATION = 80
+_INK_VALUE = 60
+# Stamps are at least this wide and tall, and no more elongated than this
+_MIN_STAMP_INCHES = 0.6
+_MAX_STAMP_ASPECT = 2.5
+# Seal radius range
+_SEAL_RADIUS_INCHES = (0.35, 1.2)
+# Points checked on a candidate seal's border, and the share of them that must be inked
+_SEAL_SAMPLES = 90
+_SEAL_MIN_INKED = 0.7
+# Ruled lines are at least this long, and a table has at least this many crossings
+_MIN_LINE_INCHES = 0.8
+_MIN_TABLE_CROSSINGS = 6
+
+
+def _render(page: fitz.Page, dpi: int) -> np.ndarray:
+    pixmap = page.get_pixmap(dpi=dpi, colorspace=fitz.csRGB, alpha=False)
+    pixels = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(pixmap.height, pixmap.stride)
+    return pixels[:, :pixmap.width * 3].reshape(pixmap.height, pixmap.width, 3)
+
+
+def _stamp_mask(rgb: np.ndarray, dpi: int) -> np.ndarray:
+    hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+    ink = ((hsv[..., 1] > _INK_SATURATION) & (hsv[..., 2] > _INK_VALUE)).astype(np.uint8)
+    # Joins the letters and border of a stamp into one blob
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (dpi // 10, dpi // 10))
+    blobs = cv2.morphologyEx(ink, cv2.MORPH_CLOSE, kernel)
+    count, _, boxes, _ = cv2.connectedComponentsWithStats(blobs)
+    mask = np.zeros(ink.shape, dtype=np.uint8)
+    min_size = _MIN_STAMP_INCHES * dpi
+    for x, y, w, h, _ in boxes[1:count]:
+        if w >= min_size and h >= min_size and max(w, h) / min(w, h) <= _MAX_STAMP_ASPECT:
+            mask[y:y + h, x:x + w] = 1
+    return mask
+
+
+def _seal_mask(gray: np.ndarray, dpi: int) -> np.ndarray:
+    low, high = (int(r * dpi) for r in _SEAL_RADIUS_INCHES)
+    circles = cv2.HoughCircles(
+        cv2.medianBlur(gray, 5), cv2.HOUGH_GRADIENT, dp=2, minDist=2 * low,
+        param1=120, param2=90, minRadius=low, maxRadius=high,
+    )
+    mask = np.zeros(gray.shape, dtype=np.uint8)
+    if circles is None:
+        return mask
+    # A seal's border is inked nearly all the way round; Hough also finds circles
+    # through lines of text, which are only inked here and there
+    darkest = cv2.erode(gray, np.ones((5, 5), np.uint8))
+    angles = np.linspace(0, 2 * np.pi, _SEAL_SAMPLES, endpoint=False)
+    for x, y, r in np.round(circles[0]).astype(int):
+        xs = np.clip(x + r * np.cos(angles), 0, gray.shape[1] - 1).astype(int)
+        ys = np.clip(y + r * np.sin(angles), 0, gray.shape[0] - 1).astype(int)
+        if (darkest[ys, xs] < 128).mean() >= _SEAL_MIN_INKED:
+            cv2.circle(mask, (x, y), r + dpi // 20, 1, thickness=-1)
+    return mask
+
+
+def _table_mask(gray: np.ndarray, dpi: int) -> np.ndarray:
+    ink = cv2.adaptiveThreshold(gray, 1, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 15, 10)
+    length = int(_MIN_LINE_INCHES * dpi)
+    horizontal = cv2.morphologyEx(ink, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (length, 1)))
+    vertical = cv2.morphologyEx(ink, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (1, length)))
+    grow = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+    horizontal, vertical = cv2.dilate(horizontal, grow), cv2.dilate(vertical, grow)
+    crossings = horizontal & vertical
+
+    lines = horizontal | vertical
+    count, labels = cv2.connectedComponents(lines)
+    # Number of crossings on each ruled structure, counted as crossing blobs per label
+    crossing_count, crossing_labels = cv2.connectedComponents(crossings)
+    per_structure = np.zeros(count, dtype=np.int64)
+    if crossing_count > 1:
+        _, first = np.unique(crossing_labels.ravel(), return_index=True)
+        np.add.at(per_structure, labels.ravel()[first[1:]], 1)
+    tables = np.flatnonzero(per_structure >= _MIN_TABLE_CROSSINGS)
+    # Only the rulings are erased: the ruled-out box of a table is mostly its text
+    return (np.isin(labels, tables[tables > 0]) & (lines > 0)).astype(np.uint8)
+
+
+def mask_page(page: fitz.Page) -> tuple[bytes | None, float]:
+    """
+    Masks the stamps, seals and (if enabled) tables of a scanned page.
+
+    Returns:
+        A single-page PDF of the masked page, or None when nothing was masked or so
+        much would be masked that the detection is not trusted; and the share of the
+        page's area that was (or would have been) masked.
+    """
+    dpi = settings.layout_render_dpi
+    rgb = _render(page, dpi)
+    gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+    mask = _stamp_mask(rgb, dpi) | _seal_mask(gray, dpi)
+    if settings.layout_mask_tables:
+        mask |= _table_mask(gray, dpi)
+    share = float(mask.mean())
+    if share == 0 or share > settings.layout_max_masked_share:
+        return None, share
+
+    gray[mask.astype(bool)] = 255
+    _, jpeg = cv2.imencode(".jpg", gray, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    with fitz.open() as masked:
+        masked_page = masked.new_page(width=page.rect.width, height=page.rect.height)
+        masked_page.insert_image(masked_page.rect, stream=jpeg.tobytes())
+        return masked.tobytes(deflate=True), share
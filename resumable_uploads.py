@@ -0,0 +1,199 @@
+"""
+Resumable case file uploads.
+
+A large scanned PDF is uploaded in byte-range chunks instead of one multipart POST:
+the client creates an upload with the file's size, PUTs consecutive chunks with a
+Content-Range header and (optionally) the chunk's SHA-256, and when a chunk fails,
+asks for the received offset and continues from there rather than starting over.
+
+Chunks are streamed from the request body straight into a spool file under
+`data_dir/uploads`, so neither the chunks nor the file are held in memory while they
+are received. Unlike pipelined uploads, the state is on disk (the offsets in SQLite),
+so any worker can receive the next chunk, and an upload survives a worker restart.
+Uploads untouched for `resumable_upload_hours` are deleted with their spool files.
+"""
+import asyncio
+import fcntl
+import hashlib
+import logging
+import os
+import re
+import secrets
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS upload (
+    upload_id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    received INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+def _sync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class ResumableUpload:
+    def __init__(self, store: "ResumableUploadStore", upload_id: str, filename: str, size: int, received: int):
+        self.store = store
+        self.id = upload_id
+        self.filename = filename
+        self.size = size
+        self.received = received
+
+    @property
+    def path(self) -> str:
+        return self.store.spool_path(self.id)
+
+    @property
+    def complete(self) -> bool:
+        return self.received == self.size
+
+    def _conflict(self, detail: str) -> HTTPException:
+        return HTTPException(status_code=409, detail=detail, headers={"Upload-Offset": str(self.received)})
+
+    async def write(self, content_range: str, chunks: AsyncIterator[bytes], sha256: str | None = None):
+        """
+        Appends a chunk to the spool file as it is received. The received offset only
+        advances once the whole chunk is on disk and matches its checksum, so a chunk
+        that is cut off or corrupted is simply sent again.
+
+        Args:
+            content_range: The chunk's Content-Range header, "bytes <first>-<last>/<size>".
+            chunks: The request body.
+            sha256: The hex SHA-256 of the chunk, if the client sent one.
+
+        Raises:
+            HTTPException: 400 for a malformed range or a checksum mismatch, 409 when the
+                chunk does not start at the received offset (with the offset in the
+                Upload-Offset header) or while another chunk of the upload is being
+                received, 413 for a chunk over `resumable_chunk_bytes`.
+        """
+        match = _CONTENT_RANGE.fullmatch(content_range.strip())
+        if match is None:
+            raise HTTPException(status_code=400, detail="Expected a Content-Range header like 'bytes 0-1023/4096'.")
+        first, last, size = (int(group) for group in match.groups())
+        if size != self.size or last < first or last >= size:
+            raise HTTPException(status_code=400, detail=f"Invalid range '{content_range}' for {self.size} bytes.")
+        if last - first + 1 > settings.resumable_chunk_bytes:
+            raise HTTPException(status_code=413, detail=f"Chunks are limited to {settings.resumable_chunk_bytes} bytes.")
+
+        digest = hashlib.sha256()
+        written = 0
+        with open(self.path, "r+b") as f:
+            # One chunk is written at a time, by any worker: the lock belongs to this open
+            # file, so it is released when the request ends, however it ends. A second
+            # request for the same upload is turned away instead of overwriting the bytes
+            # of the first, and the offset is read again once the lock is held.
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise self._conflict("Another chunk of this upload is being received.")
+            self.received = self.store.get(self.id).received
+            if first != self.received:
+                raise self._conflict(f"The upload continues at byte {self.received}.")
+
+            f.seek(first)
+            async for piece in chunks:
+                written += len(piece)
+                if written > last - first + 1:
+                    raise HTTPException(status_code=400, detail="The chunk is longer than its Content-Range.")
+                await asyncio.to_thread(f.write, piece)
+                digest.update(piece)
+            if written != last - first + 1:
+                raise HTTPException(status_code=400, detail="The chunk is shorter than its Content-Range.")
+            if sha256 is not None and digest.hexdigest() != sha256.strip().lower():
+                raise HTTPException(status_code=400, detail="The chunk does not match its checksum.")
+            await asyncio.to_thread(_sync, f)
+
+            with self.store._connect() as db:
+                db.execute(
+                    "UPDATE upload SET received = ?, updated_at = ? WHERE upload_id = ?",
+                    (last + 1, time.time(), self.id),
+                )
+        self.received = last + 1
+
+    def read(self) -> bytes:
+        """The uploaded file, once all of it has been received."""
+        if not self.complete:
+            raise self._conflict(f"Only {self.received} of {self.size} bytes have been uploaded.")
+        with open(self.path, "rb") as f:
+            return f.read()
+
+
+class ResumableUploadStore:
+    def __init__(self, path: str, spool_dir: str):
+        self.path = path
+        self.spool_dir = spool_dir
+        os.makedirs(spool_dir, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def spool_path(self, upload_id: str) -> str:
+        return os.path.join(self.spool_dir, f"{upload_id}.pdf")
+
+    def create(self, filename: str, size: int) -> ResumableUpload:
+        self._prune()
+        upload_id = secrets.token_hex(16)
+        open(self.spool_path(upload_id), "wb").close()
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO upload (upload_id, filename, size, updated_at) VALUES (?, ?, ?, ?)",
+                (upload_id, filename, size, time.time()),
+            )
+        return ResumableUpload(self, upload_id, filename, size, 0)
+
+    def get(self, upload_id: str) -> ResumableUpload:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT filename, size, received FROM upload WHERE upload_id = ?", (upload_id,)
+            ).fetchone()
+        if row is None or not os.path.exists(self.spool_path(upload_id)):
+            raise HTTPException(status_code=404, detail="Unknown or expired upload.")
+        return ResumableUpload(self, upload_id, *row)
+
+    def delete(self, upload_id: str):
+        with self._connect() as db:
+            db.execute("DELETE FROM upload WHERE upload_id = ?", (upload_id,))
+        try:
+            os.remove(self.spool_path(upload_id))
+        except FileNotFoundError:
+            pass
+
+    def _prune(self):
+        cutoff = time.time() - settings.resumable_upload_hours * 3600
+        with self._connect() as db:
+            expired = [row[0] for row in db.execute("SELECT upload_id FROM upload WHERE updated_at < ?", (cutoff,))]
+        for upload_id in expired:
+            logger.info(f"Deleting expired upload {upload_id}.")
+            self.delete(upload_id)
+
+
+resumable_uploads = ResumableUploadStore(
+    os.path.join(settings.data_dir, "uploads.sqlite"), os.path.join(settings.data_dir, "uploads")
+)
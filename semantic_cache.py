@@ -0,0 +1,149 @@
+import hashlib
+import threading
+import time
+
+import numpy as np
+
+from config import settings
+from text_vectors import NgramVectorizer, normalize_text, question_intent
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SemanticCache:
+    """
+    Answers paraphrased repeats of earlier information-desk questions.
+
+    Past questions are stored as n-gram TF-IDF vectors in a NumPy matrix; a lookup is
+    a single matrix-vector product followed by an argmax. A stored reply is served when
+    its question has the same intent as the new one (actions, question words and
+    negation, see question_intent), their cosine similarity reaches the threshold and
+    is clearly ahead of the best question with a different answer, and the reference
+    it cites is unchanged since the reply was generated.
+    """
+
+    def __init__(self, capacity: int, threshold: float, margin: float):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.margin = margin
+        self.vectorizer = NgramVectorizer()
+        self._vectors = np.zeros((capacity, self.vectorizer.dimensions), dtype=np.float32)
+        self._entries: list[dict | None] = [None] * capacity
+        self._last_used = np.zeros(capacity, dtype=np.float64)
+        # Intent of each slot's question (an id from _intent_ids) and the reference its reply cites
+        self._intents = np.full(capacity, -1, dtype=np.int64)
+        self._references = np.full(capacity, -1, dtype=np.int64)
+        self._intent_ids: dict[tuple, int] = {}
+        self._reference_hashes: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Best similarity seen on each lookup, bucketed by 0.05, to help tune the threshold
+        self.similarity_histogram = [0] * 21
+
+    def load_references(self, references: dict[int, str]):
+        """
+        Fits the vectorizer on the knowledge base and drops cached replies whose
+        reference text has changed (or disappeared) since they were stored.
+        Registered as a knowledge base reload listener.
+        """
+        with self._lock:
+            if not self._reference_hashes:
+                self.vectorizer.fit(list(references.values()))
+            self._reference_hashes = {number: _digest(text) for number, text in references.items()}
+            for slot, entry in enumerate(self._entries):
+                if entry is not None and not self._is_current(entry):
+                    self._evict(slot)
+
+    def _is_current(self, entry: dict) -> bool:
+        return self._reference_hashes.get(entry["reference"]) == entry["reference_hash"]
+
+    def _evict(self, slot: int):
+        self._entries[slot] = None
+        self._vectors[slot] = 0
+        self._last_used[slot] = 0
+        self._intents[slot] = -1
+        self._references[slot] = -1
+
+    def _intent_id(self, intent: tuple) -> int:
+        return self._intent_ids.setdefault(intent, len(self._intent_ids))
+
+    def invalidate_reference(self, reference: int) -> int:
+        """Drops every cached reply citing the given reference. Returns the number dropped."""
+        with self._lock:
+            slots = [i for i, e in enumerate(self._entries) if e is not None and e["reference"] == reference]
+            for slot in slots:
+                self._evict(slot)
+        return len(slots)
+
+    def lookup(self, question: str) -> dict | None:
+        if not settings.semantic_cache_enabled:
+            return None
+        content, intent = question_intent(question)
+        vector = self.vectorizer.transform(content)
+        with self._lock:
+            similarities = np.where(self._intents == self._intent_id(intent), self._vectors @ vector, 0)
+            slot = int(np.argmax(similarities))
+            similarity = float(similarities[slot])
+            self.similarity_histogram[int(max(similarity, 0) * 20)] += 1
+            entry = self._entries[slot]
+            # Questions close to two different answers are ambiguous
+            others = similarities[self._references != self._references[slot]]
+            runner_up = float(others.max()) if others.size else 0.0
+            if entry is None or similarity < self.threshold or similarity - runner_up < self.margin:
+                self.misses += 1
+                return None
+            if not self._is_current(entry):
+                self._evict(slot)
+                self.misses += 1
+                return None
+            self._last_used[slot] = time.monotonic()
+            self.hits += 1
+            return entry["reply"]
+
+    def store(self, question: str, reply: dict):
+        """Caches a reply. Replies that cite no reference cannot be invalidated and are skipped."""
+        reference = reply.get("reference")
+        if not settings.semantic_cache_enabled or reference not in self._reference_hashes:
+            return
+        content, intent = question_intent(question)
+        vector = self.vectorizer.transform(content)
+        with self._lock:
+            # Reuse the slot of an identical question, else the least recently used slot
+            intent_id = self._intent_id(intent)
+            similarities = np.where(self._intents == intent_id, self._vectors @ vector, 0)
+            slot = int(np.argmax(similarities))
+            if similarities[slot] < 0.999:
+                slot = int(np.argmin(self._last_used))
+            self._vectors[slot] = vector
+            self._last_used[slot] = time.monotonic()
+            self._intents[slot] = intent_id
+            self._references[slot] = reference
+            self._entries[slot] = {
+                "question": normalize_text(question),
+                "reply": reply,
+                "reference": reference,
+                "reference_hash": self._reference_hashes[reference],
+            }
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": sum(1 for e in self._entries if e is not None),
+            "capacity": self.capacity,
+            "threshold": self.threshold,
+            "margin": self.margin,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "similarity_histogram": {
+                f"{i * 0.05:.2f}": count for i, count in enumerate(self.similarity_histogram) if count
+            },
+        }
+
+
+info_desk_cache = SemanticCache(
+    settings.semantic_cache_size, settings.semantic_cache_threshold, settings.semantic_cache_margin
+)
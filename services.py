@@ -1,10 +1,27 @@
 
+import asyncio
+import hashlib
+import re
+from dataclasses import dataclass
 from fastapi import HTTPException
 from docx import Document
+import fitz
 import logging
 from google import genai
 from google.genai import types
 from io import BytesIO
+from tracing import start_span
+from token_budget import estimate_text_tokens
+from model_routing import model_router, bangla_share, is_clean_text_page, is_english_text_page, has_untranslated_text
+from translation_memory import translation_memory
+from legal_glossary import legal_glossary
+from page_layout import mask_page
+from page_cache import page_cache, page_fingerprint
+from markdown_edits import apply_edits, number_lines
+from decoding import decode_response
+from models import MarkdownEditList, PageSegmentTranslation
+from config import settings
+import gateway
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,19 +33,136 @@ except Exception as e:
     client = None
     print(f"Warning: Gemini Client failed to initialize. Please set GEMINI_API_KEY. Error: {e}")
 
+# Reply tokens per page of a translated case file, checked against the output budget
+TRANSLATED_PAGE_TOKENS = 1000
+
+# Page separator in the translated Markdown
+PAGE_SEPARATOR = "\n\n---\n\n"
+
 # --- Core AI Function ---
 
-async def translate_and_format_pdf_with_gemini(content: bytes, filename: str) -> str:
+# Pages are translated one per call; only the first one is asked for the document title
+FIRST_PAGE_PROMPT = (
+    "The attached file is the first page of a scanned legal case file written in Bengali (Bangla). "
+    "Translate the entire page content into English. "
+    "Maintain the original formatting and section layout as closely as possible using Markdown. "
+    "Start with a suitable title for the translated document."
+)
+PAGE_PROMPT = (
+    "The attached file is a page from the middle of a scanned legal case file written in Bengali (Bangla). "
+    "Translate the entire page content into English. "
+    "Maintain the original formatting and section layout as closely as possible using Markdown. "
+    "Do not add a document title."
+)
+
+
+@dataclass
+class _PdfPage:
+    number: int
+    content: bytes
+    fingerprint: str
+    clean_text: bool
+    # Set instead of the others for pages that are already in English
+    english_markdown: str | None = None
+    # Text blocks of pages with a Unicode Bangla text layer, for the translation memory
+    segments: list[str] | None = None
+    # Glossary terms found in the text layer, for the prompt
+    hints: str = ""
+    # Share of a scanned page's area masked as stamps, seals or tables
+    masked_share: float = 0.0
+
+
+def _split_pages(content: bytes, numbers: list[int] | None = None, first_page: bool = True) -> list[_PdfPage]:
     """
-    Uses Gemini-2.5-Flash to perform OCR, translation, and formatting in one call.
-    
+    Splits a PDF (or the pages of it with the given 0-based numbers) into single-page
+    PDFs with their fingerprints. CPU-bound; run it in a thread.
+
+    Pages already in English keep their text layer instead, except the first page of a
+    case file, which is still sent to the model because it is asked for the title.
+    """
+    pages = []
+    with fitz.open(stream=content, filetype="pdf") as pdf:
+        for number in range(pdf.page_count) if numbers is None else numbers:
+            page = pdf[number]
+            titled = number == 0 and first_page
+            if settings.english_page_bypass and not titled and is_english_text_page(page):
+                pages.append(_PdfPage(number, b"", "", True, _text_layer_markdown(page)))
+                continue
+            with fitz.open() as single:
+                single.insert_pdf(pdf, from_page=page.number, to_page=page.number)
+                # Generated pages with a Unicode text layer are easy enough for the cheaper model
+                clean_text = is_clean_text_page(page)
+                segments = _text_blocks(page) if clean_text and settings.translation_memory_enabled else None
+                page_content, masked_share = single.tobytes(), 0.0
+                if settings.layout_masking_enabled and not clean_text:
+                    masked, masked_share = mask_page(page)
+                    page_content = masked or page_content
+                pages.append(_PdfPage(
+                    number, page_content, page_fingerprint(page), clean_text,
+                    segments=segments, hints=legal_glossary.prompt_hints(page.get_text()), masked_share=masked_share,
+                ))
+    return pages
+
+
+def _text_blocks(page: fitz.Page) -> list[str]:
+    """The text blocks of a page's text layer in reading order, with whitespace tidied."""
+    blocks = []
+    for *_, text, _, block_type in page.get_text("blocks", sort=True):
+        if block_type != 0:
+            continue  # Image block
+        lines = (" ".join(line.split()) for line in text.splitlines())
+        block = "\n".join(line for line in lines if line)
+        if block:
+            blocks.append(block)
+    return blocks
+
+
+def _text_layer_markdown(page: fitz.Page) -> str:
+    """The text layer of a page as Markdown paragraphs, one per text block."""
+    return "\n\n".join(_text_blocks(page))
+
+
+async def translate_and_format_pdf_with_gemini(content: bytes, filename: str, pages: list[int] | None = None) -> str:
+    """
+    Uses Gemini to perform OCR, translation, and formatting, one call per page.
+
     Args:
         content: The byte content of the PDF file.
         filename: The original file name.
+        pages: The 0-based numbers of the pages to translate, or None for all of them.
 
     Returns:
         The formatted English text as a string.
     """
+    return PAGE_SEPARATOR.join(await translate_pdf_pages(content, filename, pages=pages))
+
+
+async def translate_pdf_pages(
+    content: bytes,
+    filename: str,
+    first_page: bool = True,
+    semaphore: asyncio.Semaphore | None = None,
+    pages: list[int] | None = None,
+) -> list[str]:
+    """
+    Translates each page of a PDF into English Markdown.
+
+    Translated pages are cached by their fingerprint (rendered image and text layer),
+    so a revised case file only sends its new or changed pages to the model; the
+    cached pages are spliced back in order.
+
+    Args:
+        content: The byte content of the PDF, the whole case file or a part of it.
+        filename: The original file name.
+        first_page: Whether the PDF starts with the first page of the case file, which
+            is the only page asked for a document title.
+        semaphore: Limits the pages translated at once; pass one to share the limit
+            between several PDFs of the same case file.
+        pages: The 0-based numbers of the pages to translate, or None for all of them.
+
+    Returns:
+        The Markdown of each page, in page order.
+    """
     if client is None:
         raise HTTPException(
             status_code=503, 
@@ -45,23 +179,147 @@ async def translate_and_format_pdf_with_gemini(content: bytes, filename: str) ->
         "Ignore the bangla stamp and tables"
         "For legal documents, maintain fidelity to the original sections and line breaks."
     )
-    
-    # User prompt requests the specific action
-    prompt = (
-        f"The attached file, named '{filename}', is a scanned legal case file written in Bengali (Bangla). "
-        "Translate the entire document content into English. "
-        "Maintain the original formatting and section layout as closely as possible using Markdown. "
-        "Start with a suitable title for the translated document."
-    )
 
     config = types.GenerateContentConfig(
         system_instruction=system_instruction
     )
 
     try:
+        with start_span("pdf.split") as span:
+            pages = await asyncio.to_thread(_split_pages, content, pages, first_page)
+            span.set(
+                pages=len(pages),
+                english_pages=sum(page.english_markdown is not None for page in pages),
+                masked_pages=sum(page.masked_share > 0 for page in pages),
+                masked_share=round(sum(page.masked_share for page in pages) / max(len(pages), 1), 4),
+                upload_bytes=sum(len(page.content) for page in pages),
+            )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"The uploaded file is not a readable PDF: {e}")
+
+    titled = [page.number == 0 and first_page for page in pages]
+    prompts = [(FIRST_PAGE_PROMPT if title else PAGE_PROMPT) + page.hints for page, title in zip(pages, titled)]
+    # Pages already in English take their text layer as is, and have no cache key
+    keys = [
+        page_cache.key(page.fingerprint, system_instruction, prompt) if page.english_markdown is None else None
+        for page, prompt in zip(pages, prompts)
+    ]
+    translations = page_cache.get_many([key for key in keys if key is not None])
+    missing = [i for i, key in enumerate(keys) if key is not None and key not in translations]
+    english = keys.count(None)
+    logger.info(
+        f"Translating {len(missing)} of {len(pages)} pages of '{filename}' "
+        f"({english} already in English, the others cached)."
+    )
+    for page in pages:
+        if page.masked_share:
+            logger.info(f"Masked {page.masked_share:.1%} of page {page.number + 1} of '{filename}' as stamps or tables.")
+
+    semaphore = semaphore or asyncio.Semaphore(settings.translation_page_concurrency)
+
+    async def translate(i: int) -> str:
+        async with semaphore:
+            markdown = None
+            if pages[i].segments:
+                markdown = await _translate_segments(pages[i].segments, titled[i])
+            if markdown is None:
+                markdown = await _translate_pdf(pages[i].content, prompts[i], config, 1, pages[i].clean_text)
+        # Stored right away, so the pages that succeeded are kept even if another one fails
+        page_cache.put(keys[i], markdown)
+        return markdown
+
+    translated = await asyncio.gather(*(translate(i) for i in missing))
+    translations.update(zip((keys[i] for i in missing), translated))
+    # Terminology is made consistent here rather than left to the refinement pass; pages
+    # that were in English already keep their wording
+    return [
+        page.english_markdown if key is None else legal_glossary.normalize(translations[key])
+        for page, key in zip(pages, keys)
+    ]
+
+
+async def _translate_segments(segments: list[str], with_title: bool) -> str | None:
+    """
+    Translates a page from the blocks of its text layer. Segments found in the
+    translation memory are filled in locally and only the others are sent to the
+    model, with the closest remembered translations as references.
+
+    Returns:
+        The page as Markdown, one paragraph per segment, or None when the model's
+        reply is unusable and the page should be translated from its PDF instead.
+    """
+    exact, fuzzy = translation_memory.lookup(segments)
+    translated = dict(exact)
+    # Segments without Bangla (numbers, English stamps) are kept as they are
+    for i, segment in enumerate(segments):
+        if i not in translated and bangla_share(segment) == 0:
+            translated[i] = segment
+    novel = [i for i in range(len(segments)) if i not in translated]
+    title = None
+
+    if novel or with_title:
+        lines = []
+        for i in novel:
+            lines.append(f"[{i}] {segments[i]}")
+            if i in fuzzy:
+                source, target = fuzzy[i]
+                lines.append(f"    (A similar segment, \"{source}\", was translated as: \"{target}\")")
+        text_prompt = (
+            "The following numbered segments are the text of a page of a legal case file written in Bengali "
+            "(Bangla). Translate each segment into professional, clear English, keeping its line breaks, and "
+            "return it with its number. Where a similar earlier translation is given, use the same wording for "
+            "the parts that match, but translate names, numbers and dates from the segment itself."
+            + (" Also give a suitable title for the translated document." if with_title else "")
+            + legal_glossary.prompt_hints("\n".join(segments[i] for i in novel))
+            + "\n\n" + "\n".join(lines)
+        )
+
+        async def request(model: str):
+            return await gateway.generate_content(
+                client,
+                "translate",
+                expected_output_tokens=sum(estimate_text_tokens(segments[i]) for i in novel) + 64,
+                model=model,
+                contents=[text_prompt],
+                config={
+                    "response_mime_type": "application/json",
+                    "response_schema": PageSegmentTranslation,
+                },
+            )
+
+        def complete(result: PageSegmentTranslation) -> bool:
+            english = {segment.index: segment.english for segment in result.segments}
+            return all(english.get(i) and not has_untranslated_text(english[i]) for i in novel)
+
+        try:
+            with start_span("model.translate", segments=len(segments), novel=len(novel), remembered=len(exact)):
+                result = await model_router.generate(
+                    "translate", True, request, lambda r: decode_response(r, PageSegmentTranslation), complete
+                )
+        except Exception as e:
+            logger.warning(f"Segment translation failed, translating the page from its PDF instead: {e}")
+            return None
+        if not complete(result):
+            return None
+        english = {segment.index: segment.english.strip() for segment in result.segments}
+        translated.update((i, english[i]) for i in novel)
+        translation_memory.store([(segments[i], english[i]) for i in novel])
+        title = result.title
+
+    paragraphs = [translated[i] for i in range(len(segments))]
+    if title:
+        paragraphs.insert(0, f"# {title.strip()}")
+    return "\n\n".join(paragraphs)
+
+
+async def _translate_pdf(content: bytes, prompt: str, config, page_count: int, clean_text: bool) -> str:
+    async def translate(model: str):
         # The multimodal call (text + image/PDF)
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
+        return await gateway.generate_content(
+            client,
+            "translate",
+            expected_output_tokens=page_count * TRANSLATED_PAGE_TOKENS,
+            model=model,
             contents=[
                 types.Part.from_bytes(
                     data=content,
@@ -71,12 +329,26 @@ async def translate_and_format_pdf_with_gemini(content: bytes, filename: str) ->
             ],
             config=config
         )
-        return response.text
+
+    try:
+        with start_span("model.translate", input_bytes=len(content), pages=page_count, clean_text=clean_text) as span:
+            # A translation that still reads as Bangla is redone with the stronger model
+            text = await model_router.generate(
+                "translate",
+                clean_text,
+                translate,
+                lambda response: response.text or "",
+                lambda text: bool(text) and not has_untranslated_text(text),
+            )
+            span.set(output_chars=len(text))
+        return text
         
+    except HTTPException:
+        raise
     except Exception as e:
         # Catch any API-related errors
         raise HTTPException(status_code=500, detail=f"AI processing failed: {e}")
-        
+
 # --- DOCX Text Extraction Helper ---
 
 def extract_text_from_docx(content: bytes) -> str:
@@ -126,7 +398,7 @@ def extract_text_from_docx(content: bytes) -> str:
         return ""
 # --- Core AI Function 2 (Refinement) ---
 
-async def refine_english_markdown(markdown_text: str, sample_text_content: str = None) -> str:
+async def refine_english_markdown(markdown_text: str, sample_text_content: str = None, job=None) -> str:
     """
     Uses a second Gemini-2.5-Flash call to clean up, standardize, and finalize
     the translated English text and Markdown structure, optionally using a sample text template for style.
@@ -134,15 +406,14 @@ async def refine_english_markdown(markdown_text: str, sample_text_content: str =
     Args:
         markdown_text: The translated and initially formatted Markdown text.
         sample_text_content: Optional string containing the extracted text template from a sample DOCX.
+        job: Optional ConversionJob on which refined chunks are checkpointed.
 
     Returns:
         The cleaned, refined Markdown text as a string.
     """
-    if client is None:
-        return markdown_text # Skip refinement if client is not initialized
+    if client is None or not settings.refine_enabled:
+        return legal_glossary.normalize(markdown_text) # Skip refinement if client is not initialized
 
-    # Build the contents list dynamically
-    contents = []
     text_instruction = ""
 
     # If a sample style text is provided, include it in the prompt
@@ -160,13 +431,95 @@ async def refine_english_markdown(markdown_text: str, sample_text_content: str =
     # System instruction for refinement
     system_instruction = (
         "You are a professional editor specializing in legal document standardization. "
-        "Your task is to proofread, correct grammatical errors, and ensure consistent "
-        "legal terminology in the provided translated text. "
+        "Your task is to proofread and correct grammatical errors in the provided translated text. "
+        "Legal terms have already been standardized against a glossary; keep them exactly as they are. "
         "Crucially, standardize the Markdown usage (headings, lists, paragraphs) according to the provided "
         "style template (if present), and remove any extraneous introductory/closing phrases or junk text, "
         "outputting ONLY the clean, finalized legal document content in Markdown format."
     )
     
+    # Define the generation configuration, including the system instruction
+    config = types.GenerateContentConfig(
+        system_instruction=system_instruction
+    )
+
+    # Refined in chunks of pages, concurrently, so every chunk stays well within the
+    # deadline and token budget and can be checkpointed on its own
+    groups = _group_pages(markdown_text, settings.refine_chunk_tokens)
+    refined = await asyncio.gather(*(_refine_chunk(group, text_instruction, config, job) for group in groups))
+    return legal_glossary.normalize(PAGE_SEPARATOR.join(refined))
+
+
+async def _refine_chunk(markdown_text: str, text_instruction: str, config, job=None) -> str:
+    """
+    Refines a chunk of the draft, or returns it unchanged if refinement fails. Successful
+    refinements are checkpointed on the conversion job, if there is one.
+    """
+    checkpoint = "refine-" + hashlib.sha256((text_instruction + markdown_text).encode("utf-8")).hexdigest()[:32]
+    if job is not None:
+        refined = job.get_text(checkpoint)
+        if refined is not None:
+            return refined
+
+    refined = None
+    if settings.refine_with_edits:
+        refined = await _refine_chunk_with_edits(markdown_text, text_instruction, config)
+    if refined is None:
+        refined = await _regenerate_chunk(markdown_text, text_instruction, config)
+
+    # Return the original if the response is empty
+    if not refined:
+        return markdown_text
+    if job is not None:
+        job.put(checkpoint, refined)
+    return refined
+
+
+async def _refine_chunk_with_edits(markdown_text: str, text_instruction: str, config) -> str | None:
+    """
+    Asks for the fixes to a chunk as a list of line edits and applies them locally, so
+    the reply is as long as the fixes rather than the chunk. Returns None when the call
+    fails or the edits do not apply, for the caller to regenerate the chunk instead.
+    """
+    text_prompt = (
+        text_instruction +
+        "Refine the following translated legal document text. Ensure all formatting is strictly consistent, "
+        "legal terminology is correct, and grammar is flawless. Do NOT return the document. Return only the "
+        "changes, as edits that each replace the lines `start` to `end` (inclusive, by the line numbers "
+        "before the '|') with `replacement`. Quote the current text of line `start` in `original`. Use an empty "
+        "replacement to delete lines (e.g. junk preamble), and return no edits if the text needs none:\n\n"
+        f"--- START OF DOCUMENT TO REFINE ---\n{number_lines(markdown_text)}"
+    )
+
+    try:
+        with start_span("model.refine", input_chars=len(markdown_text), mode="edits") as span:
+            response = await gateway.generate_content(
+                client,
+                "refine",
+                # Edits are a fraction of the draft; a chunk that needs more is regenerated
+                expected_output_tokens=estimate_text_tokens(markdown_text) // 4,
+                model="gemini-2.5-flash",
+                contents=[text_prompt],
+                config=types.GenerateContentConfig(
+                    system_instruction=config.system_instruction,
+                    response_mime_type="application/json",
+                    response_schema=MarkdownEditList,
+                ),
+            )
+            edits = decode_response(response, MarkdownEditList).edits
+            refined = apply_edits(markdown_text, edits)
+            span.set(edits=len(edits), output_chars=len(response.text or ""))
+    except ValueError as e:
+        logger.warning(f"Refinement edits could not be applied, regenerating the chunk instead: {e}")
+        return None
+    except Exception as e:
+        logger.warning(f"Refinement edits failed, regenerating the chunk instead: {e}")
+        return None
+    return refined
+
+
+async def _regenerate_chunk(markdown_text: str, text_instruction: str, config) -> str | None:
+    """Asks for the whole refined chunk. Returns None when the call fails."""
     # User prompt for refinement
     text_prompt = (
         text_instruction + 
@@ -174,27 +527,38 @@ async def refine_english_markdown(markdown_text: str, sample_text_content: str =
         "legal terminology is correct, and grammar is flawless. Return ONLY the final, cleaned Markdown content:\n\n"
         f"--- START OF DOCUMENT TO REFINE ---\n{markdown_text}"
     )
-    
-    # Add the main text prompt
-    contents.append(text_prompt)
-
-    # Define the generation configuration, including the system instruction
-    config = types.GenerateContentConfig(
-        system_instruction=system_instruction
-    )
 
     try:
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=contents, # Use the dynamic contents list
-            config=config
-        )
-        # Return the refined text, or the original if the response is empty
-        return response.text if response.text else markdown_text
-        
+        with start_span("model.refine", input_chars=len(markdown_text), mode="full") as span:
+            response = await gateway.generate_content(
+                client,
+                "refine",
+                # The refined document is about as long as the draft
+                expected_output_tokens=estimate_text_tokens(markdown_text),
+                model="gemini-2.5-flash",
+                contents=[text_prompt],
+                config=config
+            )
+            span.set(output_chars=len(response.text or ""))
     except Exception as e:
         print(f"Warning: Refinement AI call failed: {e}. Using original translated text.")
-        return markdown_text # Return original text on failure to keep the process moving
+        return None # Keep the original text on failure to keep the process moving
+    return response.text
+
+
+def _group_pages(markdown_text: str, max_tokens: int) -> list[str]:
+    """Splits a draft at its page separators into groups of consecutive pages under max_tokens."""
+    groups, current, current_tokens = [], [], 0
+    for page in re.split(r"\n\s*---+\s*\n", markdown_text):
+        tokens = estimate_text_tokens(page)
+        if current and current_tokens + tokens > max_tokens:
+            groups.append(PAGE_SEPARATOR.join(current))
+            current, current_tokens = [], 0
+        current.append(page)
+        current_tokens += tokens
+    if current:
+        groups.append(PAGE_SEPARATOR.join(current))
+    return groups
         
 # --- DOCX Generation Helper ---
 
@@ -203,33 +567,35 @@ def generate_docx_from_markdown(markdown_text: str) -> BytesIO:
     Converts simple markdown text (headers, paragraphs) into a DOCX file buffer.
     This is a simplification; for complex markdown, you'd use a dedicated parser.
     """
-    doc = Document()
-    
-    lines = markdown_text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Check for headers (simple # detection)
-        if line.startswith('### '):
-            doc.add_heading(line.lstrip('### ').strip(), level=3)
-        elif line.startswith('## '):
-            doc.add_heading(line.lstrip('## ').strip(), level=2)
-        elif line.startswith('# '):
-            doc.add_heading(line.lstrip('# ').strip(), level=1)
+    with start_span("docx.render", input_chars=len(markdown_text)) as span:
+        doc = Document()
         
-        # Check for lists (simple * or - detection)
-        elif line.startswith('* ') or line.startswith('- '):
-            doc.add_paragraph(line.lstrip('* ').lstrip('- ').strip(), style='List Bullet')
+        lines = markdown_text.split('\n')
         
-        # Default paragraph
-        else:
-            doc.add_paragraph(line)
-
-    # Save the document to an in-memory byte buffer
-    doc_buffer = BytesIO()
-    doc.save(doc_buffer)
-    doc_buffer.seek(0)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+                
+            # Check for headers (simple # detection)
+            if line.startswith('### '):
+                doc.add_heading(line.lstrip('### ').strip(), level=3)
+            elif line.startswith('## '):
+                doc.add_heading(line.lstrip('## ').strip(), level=2)
+            elif line.startswith('# '):
+                doc.add_heading(line.lstrip('# ').strip(), level=1)
+            
+            # Check for lists (simple * or - detection)
+            elif line.startswith('* ') or line.startswith('- '):
+                doc.add_paragraph(line.lstrip('* ').lstrip('- ').strip(), style='List Bullet')
+            
+            # Default paragraph
+            else:
+                doc.add_paragraph(line)
+
+        # Save the document to an in-memory byte buffer
+        doc_buffer = BytesIO()
+        doc.save(doc_buffer)
+        doc_buffer.seek(0)
+        span.set(lines=len(lines), output_bytes=doc_buffer.getbuffer().nbytes)
     return doc_buffer
\ No newline at end of file
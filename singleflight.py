@@ -0,0 +1,72 @@
+import asyncio
+import hashlib
+import json
+import unicodedata
+
+from pydantic import BaseModel
+
+
+def _canonical(value):
+    """Reduces request arguments to a JSON-serializable form that ignores Unicode normalization."""
+    if isinstance(value, str):
+        # Only the Unicode normalization is ignored: case and line breaks can change the
+        # meaning of a prompt (e.g. the names of a customer list, one per line)
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, BaseModel):
+        return _canonical(value.model_dump(exclude_none=True))
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    # Response schema classes and other objects are identified by their repr
+    return repr(value)
+
+
+def request_key(**kwargs) -> str:
+    """Returns a stable hash of a model request, used for coalescing and caching."""
+    canonical = json.dumps(_canonical(kwargs), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls that share a key into one execution whose result
+    (or exception) is handed to every caller.
+
+    The shared call runs as its own task, so a caller that disconnects or times out
+    does not cancel the work the other callers are waiting for.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, fn):
+        """
+        Args:
+            key: Requests with equal keys are coalesced.
+            fn: Zero-argument coroutine function performing the call.
+
+        Returns:
+            A tuple of the call's result and whether this caller joined an existing call.
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task), shared
+
+    def _done(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved when no caller is left to await it
+            task.exception()
@@ -0,0 +1,57 @@
+import json
+import re
+
+
+class JsonStringFieldStream:
+    """
+    Incrementally decodes one string field of a JSON object whose text arrives in chunks,
+    so that the field can be forwarded before the rest of the object is complete.
+
+    Usage:
+        answer = JsonStringFieldStream("answer")
+        for chunk in chunks:
+            text = answer.feed(chunk)   # newly decoded characters, possibly ""
+    """
+
+    def __init__(self, field: str):
+        self._key = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._buffer = ""
+        # Offset in the buffer where the undecoded part of the string value starts
+        self._position = None
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        self._buffer += chunk
+        if self.done:
+            return ""
+        if self._position is None:
+            match = self._key.search(self._buffer)
+            if match is None:
+                return ""
+            self._position = match.end()
+
+        # Find the end of the complete part: stop before an unfinished escape sequence
+        # or at the closing quote of the value
+        i = self._position
+        end = len(self._buffer)
+        while i < end:
+            c = self._buffer[i]
+            if c == '"':
+                self.done = True
+                break
+            if c == "\\":
+                length = 6 if self._buffer[i + 1:i + 2] == "u" else 2
+                if i + length > end:
+                    break
+                # A high surrogate is only decodable together with its low surrogate
+                if length == 6 and "d800" <= self._buffer[i + 2:i + 6].lower() <= "dbff":
+                    if i + 12 > end:
+                        break
+                    length = 12
+                i += length
+                continue
+            i += 1
+
+        raw = self._buffer[self._position:i]
+        self._position = i
+        return json.loads(f'"{raw}"') if raw else ""
@@ -0,0 +1,113 @@
+import hashlib
+import unicodedata
+
+import numpy as np
+
+# Bangla digits are folded to ASCII so "১৫০০" and "1500" vectorize alike, and the
+# long/short vowel signs that are used interchangeably (কীভাবে / কিভাবে) are merged
+_FOLD = str.maketrans("০১২৩৪৫৬৭৮৯ীূ", "0123456789িু")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form of a user query: NFC, case-folded, digits and vowel signs folded, punctuation
+    removed and whitespace collapsed. Letters, combining marks (Bangla vowel signs)
+    and numbers are kept.
+    """
+    text = unicodedata.normalize("NFC", text).casefold().translate(_FOLD)
+    kept = [c if unicodedata.category(c)[0] in "LMN" else " " for c in text]
+    return " ".join("".join(kept).split())
+
+
+# Words that decide what a question asks for, by canonical form. Two questions that
+# differ in one of these are different questions however similar their n-grams are
+# ("রিচার্জ কিভাবে করব" / "রিচার্জ কিভাবে বাতিল করব"). Forms match as word prefixes,
+# so inflections (খুলবো, খুলতে) and spelling variants (এড, অ্যাড) share the canonical form.
+_ACTIONS = {
+    "যোগ": ("যোগ", "এড", "অ্যাড", "add"),
+    "বাতিল": ("বাতিল", "ক্যানসেল", "ক্যান্সেল", "cancel"),
+    "বন্ধ": ("বন্ধ",),
+    "চালু": ("চালু",),
+    "মুছ": ("মুছ", "ডিলিট", "delete", "রিমুভ"),
+    "সংশোধন": ("সংশোধন", "এডিট", "edit", "পরিবর্তন"),
+    "কিন": ("কিন", "কেনা", "ক্রয়"),
+    "পাঠা": ("পাঠা", "সেন্ড"),
+    "খুল": ("খুল", "খোল"),
+}
+_QUESTION_WORDS = {
+    "কিভাবে": "how", "কেমনে": "how", "কত": "how much", "কতো": "how much",
+    "কোথায়": "where", "কেন": "why", "কখন": "when",
+}
+_NEGATIONS = {"না", "নাই", "নেই", "নয়", "not", "no"}
+# Carry no meaning of their own once the intent is known ("new" customer, "I", "will do")
+_FILLERS = {"কি", "কিছু", "আমি", "আমার", "নতুন", "একটা", "একটি", "চাই", "করব", "করবো", "করবেন", "করতে", "করে", "করা"}
+
+
+def question_intent(text: str) -> tuple[str, tuple]:
+    """
+    Splits a question into its content and its intent.
+
+    Returns:
+        The normalized question with actions in canonical form and question words,
+        negations and fillers removed, for n-gram similarity; and the intent key
+        (actions, question words, negated) that a matching question must share.
+    """
+    content, actions, questions, negated = [], set(), set(), False
+    for word in normalize_text(text).split():
+        if word in _NEGATIONS:
+            negated = True
+            continue
+        if word in _QUESTION_WORDS:
+            questions.add(_QUESTION_WORDS[word])
+            continue
+        if word in _FILLERS:
+            continue
+        for action, forms in _ACTIONS.items():
+            if word.startswith(forms):
+                actions.add(action)
+                word = action
+                break
+        content.append(word)
+    return " ".join(content), (tuple(sorted(actions)), tuple(sorted(questions)), negated)
+
+
+class NgramVectorizer:
+    """
+    Character n-gram TF-IDF vectors hashed into a fixed number of dimensions.
+    Runs on the CPU with NumPy only; the IDF weights are fitted on a reference corpus.
+    """
+
+    def __init__(self, dimensions: int = 4096, ngram_range: tuple[int, int] = (2, 4)):
+        self.dimensions = dimensions
+        self.ngram_range = ngram_range
+        self.idf = np.ones(dimensions, dtype=np.float32)
+
+    def _features(self, text: str) -> list[int]:
+        # Word boundaries are marked so that n-grams do not run across words
+        padded = f" {normalize_text(text)} "
+        low, high = self.ngram_range
+        features = []
+        for n in range(low, high + 1):
+            for i in range(len(padded) - n + 1):
+                gram = padded[i:i + n]
+                if gram.strip():
+                    digest = hashlib.blake2b(gram.encode("utf-8"), digest_size=4).digest()
+                    features.append(int.from_bytes(digest, "little") % self.dimensions)
+        return features
+
+    def fit(self, documents: list[str]) -> "NgramVectorizer":
+        df = np.zeros(self.dimensions, dtype=np.float32)
+        for document in documents:
+            df[list(set(self._features(document)))] += 1
+        self.idf = (np.log((1 + len(documents)) / (1 + df)) + 1).astype(np.float32)
+        return self
+
+    def transform(self, text: str) -> np.ndarray:
+        """Returns the L2-normalized TF-IDF vector of the text."""
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        features = self._features(text)
+        if features:
+            np.add.at(vector, features, 1.0)
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
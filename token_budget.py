@@ -0,0 +1,91 @@
+"""
+Local token estimates for model requests.
+
+Counting tokens exactly takes a round trip to the API (models.count_tokens), which is
+the latency the estimate is meant to save. Instead, text is estimated from its length
+per character class, and the estimate is scaled per endpoint by the ratio of actual to
+estimated prompt tokens reported in the usage metadata of earlier calls.
+"""
+import logging
+import threading
+
+import fitz
+
+logger = logging.getLogger(__name__)
+
+# Gemini counts every PDF page and image as a fixed number of input tokens
+MEDIA_TOKENS = 258
+
+# Calibration ratios are kept within this range so that one odd response cannot skew them
+_RATIO_BOUNDS = (0.25, 4.0)
+
+
+def estimate_text_tokens(text: str) -> int:
+    """About 4 characters per token for ASCII text and 2 for other scripts such as Bangla."""
+    if text.isascii():
+        return len(text) // 4 + 1
+    # Bangla characters take 3 bytes in UTF-8, so this counts them at C speed
+    non_ascii = min((len(text.encode("utf-8")) - len(text)) // 2, len(text))
+    return (len(text) - non_ascii) // 4 + non_ascii // 2 + 1
+
+
+def _pdf_pages(data: bytes) -> int:
+    try:
+        with fitz.open(stream=data, filetype="pdf") as pdf:
+            return pdf.page_count
+    except Exception:
+        return 1
+
+
+def _part_tokens(part) -> int:
+    if isinstance(part, str):
+        return estimate_text_tokens(part)
+    if getattr(part, "text", None):
+        return estimate_text_tokens(part.text)
+    blob = getattr(part, "inline_data", None)
+    if blob is not None and blob.data:
+        if blob.mime_type == "application/pdf":
+            return _pdf_pages(blob.data) * MEDIA_TOKENS
+        return MEDIA_TOKENS
+    return 0
+
+
+def estimate_request_tokens(contents, config) -> int:
+    """Uncalibrated estimate of the input tokens of a generate_content request."""
+    parts = contents if isinstance(contents, list) else [contents]
+    total = sum(_part_tokens(part) for part in parts if part is not None)
+    if isinstance(config, dict):
+        system_instruction = config.get("system_instruction")
+    else:
+        system_instruction = getattr(config, "system_instruction", None)
+    if isinstance(system_instruction, str):
+        total += estimate_text_tokens(system_instruction)
+    return total
+
+
+class TokenEstimator:
+    """Per-endpoint calibration of the local estimate against reported prompt token counts."""
+
+    def __init__(self, smoothing: float = 0.2):
+        self.smoothing = smoothing
+        self._ratios: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def calibrated(self, endpoint: str, estimate: int) -> int:
+        return int(estimate * self._ratios.get(endpoint, 1.0))
+
+    def observe(self, endpoint: str, estimate: int, actual: int):
+        """Folds the actual prompt token count of a call into the endpoint's ratio."""
+        if estimate <= 0 or actual <= 0:
+            return
+        low, high = _RATIO_BOUNDS
+        ratio = min(max(actual / estimate, low), high)
+        with self._lock:
+            previous = self._ratios.get(endpoint)
+            self._ratios[endpoint] = ratio if previous is None else previous + self.smoothing * (ratio - previous)
+
+    def stats(self) -> dict[str, float]:
+        return dict(self._ratios)
+
+
+token_estimates = TokenEstimator()
@@ -0,0 +1,266 @@
+import json
+import logging
+import queue
+import random
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import requests
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# --- Span Model ---
+
+class Span:
+    """
+    A single timed operation inside a trace. Spans that belong to an unsampled
+    trace are still created (so callers never need to branch) but are never exported.
+    """
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, sampled: bool, attributes: dict = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.attributes = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.error = None
+        # Finished spans of the whole trace are collected on the root span
+        self.finished = []
+
+    def set(self, **attributes):
+        """Adds or overwrites attributes on the span."""
+        if self.sampled:
+            self.attributes.update(attributes)
+
+    def add(self, key: str, amount: int = 1):
+        """Increments a numeric attribute, e.g. a retry counter."""
+        if self.sampled:
+            self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns or time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_current_root: ContextVar[Span | None] = ContextVar("current_root", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(name: str, **attributes):
+    """
+    Opens a span as a child of the active span, or as the root of a new trace
+    when there is none. The sampling decision is made once per trace, at the root.
+
+    Usage:
+        with start_span("pdf.read", bytes=len(content)) as span:
+            ...
+            span.set(pages=page_count)
+    """
+    parent = _current_span.get()
+    root = _current_root.get()
+    if parent is None:
+        sampled = random.random() < settings.trace_sample_rate
+        span = Span(name, secrets.token_hex(16), None, sampled, attributes)
+        root = span
+    else:
+        span = Span(name, parent.trace_id, parent.span_id, parent.sampled, attributes)
+
+    span_token = _current_span.set(span)
+    root_token = _current_root.set(root)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(span_token)
+        _current_root.reset(root_token)
+        _finish(span, root)
+
+
+def start_detached_span(name: str, **attributes) -> Span:
+    """
+    Creates a child of the active span without making it the active span. Used for work
+    that is suspended and resumed outside of a single `with` block, such as async
+    generators. Must be closed with end_detached_span().
+    """
+    parent = _current_span.get()
+    if parent is None:
+        span = Span(name, secrets.token_hex(16), None, random.random() < settings.trace_sample_rate, attributes)
+        span.root = span
+    else:
+        span = Span(name, parent.trace_id, parent.span_id, parent.sampled, attributes)
+        span.root = _current_root.get()
+    return span
+
+
+def end_detached_span(span: Span, error: BaseException | None = None) -> None:
+    if error is not None:
+        span.error = f"{type(error).__name__}: {error}"
+    _finish(span, span.root)
+
+
+def _finish(span: Span, root: Span) -> None:
+    span.end_ns = time.time_ns()
+    if span.sampled:
+        root.finished.append(span)
+        if span is root:
+            _exporter.submit(root.finished)
+
+
+def record_usage(span: Span, response) -> None:
+    """Copies the token counts of a Gemini response onto a span."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    span.set(
+        prompt_tokens=usage.prompt_token_count or 0,
+        output_tokens=usage.candidates_token_count or 0,
+        total_tokens=usage.total_token_count or 0,
+    )
+
+
+# --- Exporters ---
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _to_otlp(spans: list[Span]) -> dict:
+    """Encodes finished spans in the OTLP/HTTP JSON format."""
+    otlp_spans = []
+    for span in spans:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        otlp_spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": settings.trace_service_name}}]},
+            "scopeSpans": [{"scope": {"name": "ankona.tracing"}, "spans": otlp_spans}],
+        }]
+    }
+
+
+class _Exporter:
+    """
+    Ships finished traces from a background thread so that request handlers
+    never block on file or network I/O.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=1000)
+        self._thread = None
+
+    def submit(self, spans: list[Span]):
+        if settings.trace_exporter == "none":
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+            self._thread.start()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            # Dropping traces is preferable to slowing down requests
+            logger.warning("Trace export queue is full, dropping trace.")
+
+    def _run(self):
+        while True:
+            spans = self._queue.get()
+            try:
+                if settings.trace_exporter == "otlp":
+                    requests.post(settings.trace_otlp_endpoint, json=_to_otlp(spans), timeout=5)
+                else:
+                    with open(settings.trace_file, "a", encoding="utf-8") as f:
+                        for span in spans:
+                            f.write(json.dumps(span.to_dict(), ensure_ascii=False) + "\n")
+            except Exception as e:
+                logger.warning(f"Trace export failed: {e}")
+
+
+_exporter = _Exporter()
+
+
+# --- ASGI Middleware ---
+
+class TracingMiddleware:
+    """
+    Opens one root span per HTTP request and a child span covering the time spent
+    streaming the response body back to the client.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        with start_span(f"{scope['method']} {scope['path']}", path=scope["path"]) as root:
+            # The response may be sent from a different task than the handler ran in,
+            # so the streaming span is tracked explicitly instead of through the context.
+            stream = {"span": None, "bytes": 0}
+
+            def finish_stream():
+                if stream["span"] is not None:
+                    stream["span"].set(bytes=stream["bytes"])
+                    _finish(stream["span"], root)
+                    stream["span"] = None
+
+            async def traced_send(message):
+                if message["type"] == "http.response.start":
+                    root.set(status_code=message["status"])
+                    stream["span"] = Span("response.stream", root.trace_id, root.span_id, root.sampled)
+                elif message["type"] == "http.response.body":
+                    stream["bytes"] += len(message.get("body", b""))
+                await send(message)
+                if message["type"] == "http.response.body" and not message.get("more_body", False):
+                    finish_stream()
+
+            try:
+                await self.app(scope, receive, traced_send)
+            finally:
+                finish_stream()
@@ -0,0 +1,172 @@
+"""
+Segment-level translation memory for the boilerplate that recurs across case files.
+
+Pages with a Unicode Bangla text layer are translated segment by segment (one segment
+per text block). A segment whose normalized text was translated before is filled in
+from the memory (exact tier). A segment that is merely close to a stored one (fuzzy
+tier: character n-gram cosine, as in the semantic cache) is still sent to the model,
+with the stored translation as a reference, because a changed name or section number
+must not be copied over. Segments the model translates are added to the memory.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from config import settings
+from text_vectors import NgramVectorizer, normalize_text
+from token_budget import estimate_text_tokens
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segment (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    uses INTEGER NOT NULL DEFAULT 0,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS segment_used_at ON segment (used_at);
+"""
+
+# Shorter segments (page numbers, single words) are translated every time
+MIN_SEGMENT_CHARS = 8
+
+
+class TranslationMemory:
+    """
+    Translated segments stored in SQLite, shared by all workers, with the most recently
+    used `translation_memory_fuzzy_size` of them also kept as n-gram vectors in memory
+    for the fuzzy tier.
+    """
+
+    def __init__(self, path: str, fuzzy_size: int, fuzzy_threshold: float):
+        self.path = path
+        self.fuzzy_threshold = fuzzy_threshold
+        self.vectorizer = NgramVectorizer(dimensions=1024)
+        self._vectors = np.zeros((fuzzy_size, self.vectorizer.dimensions), dtype=np.float32)
+        self._entries: list[tuple[str, str] | None] = [None] * fuzzy_size
+        self._last_used = np.zeros(fuzzy_size, dtype=np.float64)
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self.saved_output_tokens = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def key(source: str) -> str:
+        return hashlib.sha256(normalize_text(source).encode("utf-8")).hexdigest()
+
+    def _load(self):
+        """Fills the fuzzy index with the most recently used segments, on first use."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT source, target, used_at FROM segment ORDER BY used_at DESC LIMIT ?", (len(self._entries),)
+            ).fetchall()
+        for slot, (source, target, used_at) in enumerate(rows):
+            self._vectors[slot] = self.vectorizer.transform(source)
+            self._entries[slot] = (source, target)
+            self._last_used[slot] = used_at
+        self._loaded = True
+
+    def lookup(self, segments: list[str]) -> tuple[dict[int, str], dict[int, tuple[str, str]]]:
+        """
+        Looks up the segments that are long enough to be stored.
+
+        Returns:
+            The stored translation of each exact hit, and the (source, translation) of
+            the closest stored segment for each fuzzy hit, both by segment index.
+        """
+        candidates = {i: self.key(s) for i, s in enumerate(segments) if len(s.strip()) >= MIN_SEGMENT_CHARS}
+        if not candidates:
+            return {}, {}
+        by_key = {}
+        with self._connect() as db:
+            keys = list(set(candidates.values()))
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                by_key.update(db.execute(
+                    f"SELECT key, target FROM segment WHERE key IN ({placeholders})", batch
+                ).fetchall())
+            if by_key:
+                db.executemany(
+                    "UPDATE segment SET uses = uses + 1, used_at = ? WHERE key = ?",
+                    [(time.time(), key) for key in by_key],
+                )
+        exact = {i: by_key[key] for i, key in candidates.items() if key in by_key}
+
+        fuzzy = {}
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            for i in candidates:
+                if i in exact:
+                    continue
+                similarities = self._vectors @ self.vectorizer.transform(segments[i])
+                slot = int(np.argmax(similarities))
+                if self._entries[slot] is not None and similarities[slot] >= self.fuzzy_threshold:
+                    fuzzy[i] = self._entries[slot]
+            self.exact_hits += len(exact)
+            self.fuzzy_hits += len(fuzzy)
+            self.misses += len(candidates) - len(exact) - len(fuzzy)
+            self.saved_output_tokens += sum(estimate_text_tokens(target) for target in exact.values())
+        return exact, fuzzy
+
+    def store(self, pairs: list[tuple[str, str]]):
+        """Adds (source, translation) pairs of segments translated by the model."""
+        pairs = [(source, target) for source, target in pairs if len(source.strip()) >= MIN_SEGMENT_CHARS and target]
+        if not pairs:
+            return
+        now = time.time()
+        with self._connect() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO segment (key, source, target, used_at) VALUES (?, ?, ?, ?)",
+                [(self.key(source), source, target, now) for source, target in pairs],
+            )
+        with self._lock:
+            if not self._loaded:
+                return
+            for source, target in pairs:
+                # Overwrites the least recently used slot
+                slot = int(np.argmin(self._last_used))
+                self._vectors[slot] = self.vectorizer.transform(source)
+                self._entries[slot] = (source, target)
+                self._last_used[slot] = now
+
+    def stats(self) -> dict:
+        with self._connect() as db:
+            size = db.execute("SELECT COUNT(*) FROM segment").fetchone()[0]
+        lookups = self.exact_hits + self.fuzzy_hits + self.misses
+        return {
+            "segments": size,
+            "exact_hits": self.exact_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+            "exact_hit_rate": self.exact_hits / lookups if lookups else 0.0,
+            "saved_output_tokens": self.saved_output_tokens,
+        }
+
+
+translation_memory = TranslationMemory(
+    os.path.join(settings.data_dir, "translation_memory.sqlite"),
+    settings.translation_memory_fuzzy_size,
+    settings.translation_memory_fuzzy_threshold,
+)
@@ -0,0 +1,139 @@
+"""
+Pipelined case file uploads.
+
+Instead of posting the whole PDF at once, a client can split the case file into parts
+(single pages or batches of pages, each a PDF of its own) and upload them one by one.
+Each part is translated as soon as it arrives, while the following parts are still
+being uploaded, so upload time and translation time overlap instead of adding up.
+Completing the upload joins the translated parts in order.
+
+Sessions live in the memory of the worker that created them and are discarded when
+they are not completed within `upload_session_minutes`.
+"""
+import asyncio
+import contextvars
+import hashlib
+import logging
+import secrets
+import time
+
+from fastapi import HTTPException
+
+from config import settings
+from services import translate_pdf_pages
+from tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+
+class _Part:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.digest = hashlib.sha256(content).hexdigest()
+        self.task: asyncio.Task | None = None
+
+
+class PipelinedUpload:
+    """The uploaded parts of one case file and their translations in progress."""
+
+    def __init__(self, upload_id: str, filename: str):
+        self.id = upload_id
+        self.filename = filename
+        self.created_at = time.monotonic()
+        self._parts: dict[int, _Part] = {}
+        # Shared by all parts, so uploading many small parts does not multiply the limit
+        self._semaphore = asyncio.Semaphore(settings.translation_page_concurrency)
+
+    def add_part(self, index: int, content: bytes):
+        """Stores a part and starts translating it. Uploading the same part again is a no-op."""
+        part = _Part(content)
+        previous = self._parts.get(index)
+        if previous is not None:
+            if previous.digest == part.digest:
+                return
+            previous.task.cancel()
+        self._parts[index] = part
+        self._start(index, part)
+
+    def _start(self, index: int, part: _Part):
+        async def translate():
+            with start_span("conversion.part", upload_id=self.id, part=index, bytes=len(part.content)):
+                return await translate_pdf_pages(part.content, self.filename, index == 0, self._semaphore)
+
+        # Runs in a fresh context: the part outlives the request that uploaded it, so it
+        # is traced on its own rather than as a child of that request's finished trace
+        part.task = asyncio.get_running_loop().create_task(translate(), context=contextvars.Context())
+        part.task.add_done_callback(_retrieve_exception)
+
+    def job_id(self, parts: int) -> str:
+        """Identifies the conversion by the content of its parts, like `conversions.job_id`."""
+        self._check_parts(parts)
+        digests = "".join(self._parts[i].digest for i in range(parts))
+        return hashlib.sha256(digests.encode("ascii")).hexdigest()[:32]
+
+    async def pages(self, parts: int) -> list[str]:
+        """
+        Waits for the translations of parts 0 to `parts - 1` and returns their pages in
+        order. Parts whose translation failed are started again.
+
+        Raises:
+            HTTPException: 400 when a part has not been uploaded.
+        """
+        self._check_parts(parts)
+        for i in range(parts):
+            part = self._parts[i]
+            if part.task.done() and (part.task.cancelled() or part.task.exception() is not None):
+                logger.info(f"Retrying the translation of part {i} of upload {self.id}.")
+                self._start(i, part)
+        # Shielded so that a client disconnecting from the completion does not cancel
+        # the parts; completing the upload again picks up their results
+        translated = await asyncio.gather(*(asyncio.shield(self._parts[i].task) for i in range(parts)))
+        return [page for part in translated for page in part]
+
+    def _check_parts(self, parts: int):
+        missing = [i for i in range(parts) if i not in self._parts]
+        if parts < 1 or missing:
+            raise HTTPException(status_code=400, detail=f"Parts {missing} of the upload have not been uploaded.")
+
+    def cancel(self):
+        for part in self._parts.values():
+            part.task.cancel()
+
+
+def _retrieve_exception(task: asyncio.Task):
+    # Marks the exception as retrieved when the upload is never completed
+    if not task.cancelled():
+        task.exception()
+
+
+class UploadSessions:
+    """The pipelined uploads in progress in this worker."""
+
+    def __init__(self):
+        self._uploads: dict[str, PipelinedUpload] = {}
+
+    def create(self, filename: str) -> PipelinedUpload:
+        self._prune()
+        upload = PipelinedUpload(secrets.token_hex(16), filename)
+        self._uploads[upload.id] = upload
+        return upload
+
+    def get(self, upload_id: str) -> PipelinedUpload:
+        upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired upload.")
+        return upload
+
+    def close(self, upload_id: str):
+        upload = self._uploads.pop(upload_id, None)
+        if upload is not None:
+            upload.cancel()
+
+    def _prune(self):
+        cutoff = time.monotonic() - settings.upload_session_minutes * 60
+        for upload_id in [u.id for u in self._uploads.values() if u.created_at < cutoff]:
+            logger.info(f"Discarding expired upload {upload_id}.")
+            self.close(upload_id)
+
+
+upload_sessions = UploadSessions()